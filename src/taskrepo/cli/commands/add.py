@@ -4,7 +4,7 @@ import sys
 
 import click
 
-from taskrepo.core.repository import RepositoryManager
+from taskrepo.core.repository import get_manager
 from taskrepo.core.task import Task
 from taskrepo.tui import prompts
 from taskrepo.utils.helpers import update_cache_and_display_repo
@@ -31,7 +31,7 @@ from taskrepo.utils.helpers import update_cache_and_display_repo
 def add(ctx, repo, title, project, priority, assignees, tags, links, parent, due, description, interactive):
     """Add a new task."""
     config = ctx.obj["config"]
-    manager = RepositoryManager(config.parent_dir)
+    manager = get_manager(config.parent_dir)
 
     repositories = manager.discover_repositories()
 
@@ -4,7 +4,7 @@ from typing import Optional
 
 import click
 
-from taskrepo.core.repository import RepositoryManager
+from taskrepo.core.repository import get_manager
 from taskrepo.utils.helpers import find_task_by_title_or_id, select_task_from_result
 
 
@@ -24,7 +24,7 @@ def add_link(ctx, task_id: str, url: str, repo: Optional[str]):
     URL: URL to add to task links
     """
     config = ctx.obj["config"]
-    manager = RepositoryManager(config.parent_dir)
+    manager = get_manager(config.parent_dir)
 
     # Validate URL format
     if not url.startswith(("http://", "https://")):
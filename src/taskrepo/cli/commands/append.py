@@ -4,7 +4,7 @@ from typing import Optional
 
 import click
 
-from taskrepo.core.repository import RepositoryManager
+from taskrepo.core.repository import get_manager
 from taskrepo.utils.helpers import find_task_by_title_or_id, select_task_from_result
 
 
@@ -23,7 +23,7 @@ def append(ctx, task_id: str, text: str, repo: Optional[str]):
     TASK_ID: Task ID, UUID, or title to append to
     """
     config = ctx.obj["config"]
-    manager = RepositoryManager(config.parent_dir)
+    manager = get_manager(config.parent_dir)
 
     # Find task
     result = find_task_by_title_or_id(manager, task_id, repo)
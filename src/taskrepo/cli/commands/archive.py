@@ -7,7 +7,7 @@ import click
 from prompt_toolkit.shortcuts import prompt
 from prompt_toolkit.validation import Validator
 
-from taskrepo.core.repository import RepositoryManager
+from taskrepo.core.repository import get_manager
 from taskrepo.tui.display import display_tasks_table
 from taskrepo.utils.display_constants import STATUS_EMOJIS
 from taskrepo.utils.helpers import process_tasks_batch
@@ -28,7 +28,7 @@ def archive(ctx, task_ids: Tuple[str, ...], repo, yes, all_completed):
     Use --all-completed to archive all tasks with status 'completed' in one command.
     """
     config = ctx.obj["config"]
-    manager = RepositoryManager(config.parent_dir)
+    manager = get_manager(config.parent_dir)
 
     # Handle --all-completed flag
     if all_completed and not task_ids:
@@ -51,11 +51,12 @@ def archive(ctx, task_ids: Tuple[str, ...], repo, yes, all_completed):
             return
 
         # Get display IDs from cache for completed tasks
-        from taskrepo.utils.id_mapping import get_display_id_from_uuid
+        from taskrepo.utils.id_mapping import load_uuid_to_display_id
 
+        display_ids = load_uuid_to_display_id()
         completed_ids = []
         for task in completed_tasks:
-            display_id = get_display_id_from_uuid(task.id)
+            display_id = display_ids.get(task.id)
             if display_id:
                 completed_ids.append(str(display_id))
 
@@ -169,9 +169,9 @@ def config_cmd(ctx, show):
 
         elif choice == "6":
             # Set default repository
-            from taskrepo.core.repository import RepositoryManager
+            from taskrepo.core.repository import get_manager
 
-            manager = RepositoryManager(config.parent_dir)
+            manager = get_manager(config.parent_dir)
             repositories = manager.discover_repositories()
 
             if not repositories:
@@ -184,7 +184,7 @@ def config_cmd(ctx, show):
                 click.echo(f"\nCurrent default repository: {current_repo}")
                 click.echo("\nAvailable repositories:")
                 for idx, repo in enumerate(repositories, start=1):
-                    task_count = len(repo.list_tasks())
+                    task_count = repo.task_count()
                     marker = " (current default)" if repo.name == config.default_repo else ""
                     click.echo(f"  {idx}. {repo.name} ({task_count} tasks){marker}")
 
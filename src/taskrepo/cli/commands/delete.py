@@ -7,7 +7,7 @@ import click
 from prompt_toolkit.shortcuts import prompt
 from prompt_toolkit.validation import Validator
 
-from taskrepo.core.repository import RepositoryManager
+from taskrepo.core.repository import get_manager
 from taskrepo.utils.helpers import process_tasks_batch, update_cache_and_display_repo
 
 
@@ -30,7 +30,7 @@ def delete(ctx, task_ids: Tuple[str, ...], repo, force):
     TASK_IDS: One or more task IDs or titles to delete
     """
     config = ctx.obj["config"]
-    manager = RepositoryManager(config.parent_dir)
+    manager = get_manager(config.parent_dir)
 
     # Flatten comma-separated task IDs to check if batch mode
     task_id_count = sum(len([tid.strip() for tid in task_id.split(",")]) for task_id in task_ids)
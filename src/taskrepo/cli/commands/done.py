@@ -7,7 +7,7 @@ import click
 from prompt_toolkit.shortcuts import prompt
 from prompt_toolkit.validation import Validator
 
-from taskrepo.core.repository import RepositoryManager
+from taskrepo.core.repository import get_manager
 from taskrepo.tui.display import display_tasks_table
 from taskrepo.utils.display_constants import STATUS_EMOJIS
 from taskrepo.utils.helpers import process_tasks_batch, update_cache_and_display_repo
@@ -31,7 +31,7 @@ def done(ctx, task_ids: Tuple[str, ...], repo, yes):
     TASK_IDS: One or more task IDs to mark as done (optional - if omitted, lists completed tasks)
     """
     config = ctx.obj["config"]
-    manager = RepositoryManager(config.parent_dir)
+    manager = get_manager(config.parent_dir)
 
     # If no task_ids provided, list completed tasks
     if not task_ids:
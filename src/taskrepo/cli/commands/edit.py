@@ -10,7 +10,7 @@ from typing import Tuple
 import click
 import dateparser
 
-from taskrepo.core.repository import RepositoryManager
+from taskrepo.core.repository import get_manager
 from taskrepo.core.task import Task
 from taskrepo.utils.helpers import (
     find_task_by_title_or_id,
@@ -304,7 +304,7 @@ def edit(
       tsk edit 5,6,7 --assignees @alice            # Set same assignee for all
     """
     config = ctx.obj["config"]
-    manager = RepositoryManager(config.parent_dir)
+    manager = get_manager(config.parent_dir)
 
     # Flatten comma-separated task IDs (supports both "12 13 14" and "12,13,14")
     task_id_list = []
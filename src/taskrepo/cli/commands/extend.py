@@ -5,7 +5,7 @@ from typing import Tuple
 
 import click
 
-from taskrepo.core.repository import RepositoryManager
+from taskrepo.core.repository import get_manager
 from taskrepo.tui.display import display_tasks_table
 from taskrepo.utils.date_parser import format_date_input, parse_date_or_duration
 from taskrepo.utils.helpers import find_task_by_title_or_id
@@ -47,7 +47,7 @@ def ext(ctx, task_ids: Tuple[str, ...], date_or_duration, repo):
         tsk ext 7 2025-11-15  # Set task 7 due date to Nov 15, 2025
     """
     config = ctx.obj["config"]
-    manager = RepositoryManager(config.parent_dir)
+    manager = get_manager(config.parent_dir)
 
     # Parse date or duration
     try:
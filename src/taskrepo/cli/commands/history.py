@@ -7,7 +7,7 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.tree import Tree
 
-from taskrepo.core.repository import RepositoryManager
+from taskrepo.core.repository import get_manager
 from taskrepo.utils import history_cache
 from taskrepo.utils.date_parser import parse_date_or_duration
 from taskrepo.utils.display_constants import (
@@ -43,7 +43,7 @@ console = Console()
 def history(ctx, repo, since, task, verbose, all, no_cache, clear_cache):
     """Show task and git repository history over time."""
     config = ctx.obj["config"]
-    manager = RepositoryManager(config.parent_dir)
+    manager = get_manager(config.parent_dir)
 
     # Handle cache clearing
     if clear_cache:
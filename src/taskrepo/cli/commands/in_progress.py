@@ -4,7 +4,7 @@ from typing import Tuple
 
 import click
 
-from taskrepo.core.repository import RepositoryManager
+from taskrepo.core.repository import get_manager
 from taskrepo.utils.helpers import (
     process_tasks_batch,
     prompt_for_subtask_unarchiving,
@@ -22,7 +22,7 @@ def in_progress(ctx, task_ids: Tuple[str, ...], repo):
     TASK_IDS: One or more task IDs to mark as in progress (comma-separated)
     """
     config = ctx.obj["config"]
-    manager = RepositoryManager(config.parent_dir)
+    manager = get_manager(config.parent_dir)
 
     # Track which tasks were completed (for subtask handling)
     was_completed_map = {}
@@ -6,7 +6,7 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
-from taskrepo.core.repository import RepositoryManager
+from taskrepo.core.repository import get_manager
 from taskrepo.utils.display_constants import PRIORITY_COLORS, PRIORITY_EMOJIS, STATUS_COLORS, STATUS_EMOJIS
 from taskrepo.utils.helpers import find_task_by_title_or_id, select_task_from_result
 
@@ -21,7 +21,7 @@ def info(ctx, task_id, repo):
     TASK_ID: Task ID or title to display information for
     """
     config = ctx.obj["config"]
-    manager = RepositoryManager(config.parent_dir)
+    manager = get_manager(config.parent_dir)
 
     # Try to find task by ID or title
     result = find_task_by_title_or_id(manager, task_id, repo)
@@ -6,10 +6,10 @@ from pathlib import Path
 import click
 from rich.console import Console
 
-from taskrepo.core.repository import RepositoryManager
+from taskrepo.core.repository import get_manager
 from taskrepo.tui.display import display_tasks_table
 from taskrepo.utils.conflict_detection import display_conflict_warning, scan_all_repositories
-from taskrepo.utils.id_mapping import get_cache_path
+from taskrepo.utils.id_mapping import get_cache_path, load_uuid_to_display_id
 
 
 def _load_uuid_to_display_id() -> dict[str, int]:
@@ -20,21 +20,7 @@ def _load_uuid_to_display_id() -> dict[str, int]:
     ``uuid``). Callers that care about missing cache state should check the
     returned dict length.
     """
-    cache_path = get_cache_path()
-    if not cache_path.exists():
-        return {}
-    try:
-        with open(cache_path) as f:
-            cache = json.load(f)
-        if not isinstance(cache, dict):
-            return {}
-        return {
-            entry["uuid"]: int(display_id)
-            for display_id, entry in cache.items()
-            if isinstance(entry, dict) and "uuid" in entry
-        }
-    except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError):
-        return {}
+    return load_uuid_to_display_id(get_cache_path())
 
 
 def _task_to_dict(task, uuid_to_id: dict[str, int]) -> dict:
@@ -83,7 +69,7 @@ def list_tasks(ctx, repo, project, status, priority, assignee, tag, archived, js
     Use --json for machine-readable output suitable for scripting or LLMs.
     """
     config = ctx.obj["config"]
-    manager = RepositoryManager(config.parent_dir)
+    manager = get_manager(config.parent_dir)
 
     # Check for unresolved merge conflicts and warn user.
     # In JSON mode, emit the warning to stderr so stdout stays valid JSON.
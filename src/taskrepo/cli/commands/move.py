@@ -8,7 +8,7 @@ import click
 from prompt_toolkit.shortcuts import prompt
 from prompt_toolkit.validation import Validator
 
-from taskrepo.core.repository import Repository, RepositoryManager
+from taskrepo.core.repository import Repository, RepositoryManager, get_manager
 from taskrepo.core.task import Task
 from taskrepo.utils.helpers import (
     find_task_by_title_or_id,
@@ -64,7 +64,7 @@ def move(ctx, task_ids: Tuple[str, ...], repo: Optional[str], to: str, force: bo
         tsk move 8 --to personal --force
     """
     config = ctx.obj["config"]
-    manager = RepositoryManager(config.parent_dir)
+    manager = get_manager(config.parent_dir)
 
     # Validate that target repository exists
     target_repo = manager.get_repository(to)
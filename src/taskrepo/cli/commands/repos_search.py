@@ -6,7 +6,7 @@ from prompt_toolkit.shortcuts import checkboxlist_dialog, confirm
 from rich.console import Console
 from rich.table import Table
 
-from taskrepo.core.repository import RepositoryManager
+from taskrepo.core.repository import get_manager
 from taskrepo.utils.github import (
     GitHubError,
     check_gh_auth,
@@ -103,7 +103,7 @@ def repos_search(ctx, org, list_only):
         return
 
     # Get local repositories
-    manager = RepositoryManager(config.parent_dir)
+    manager = get_manager(config.parent_dir)
     local_repos = manager.discover_repositories()
     local_repo_names = {f"tasks-{repo.name}" for repo in local_repos}
 
@@ -2,7 +2,7 @@
 
 import click
 
-from taskrepo.core.repository import RepositoryManager
+from taskrepo.core.repository import get_manager
 from taskrepo.tui.display import display_tasks_table
 
 
@@ -24,7 +24,7 @@ def search(ctx, query, repo, project, status, priority, assignee, tag, show_all)
     QUERY: Text to search for in tasks
     """
     config = ctx.obj["config"]
-    manager = RepositoryManager(config.parent_dir)
+    manager = get_manager(config.parent_dir)
 
     # Get tasks from specified repo or all repos
     # Load all non-archived tasks (completed status filtering happens later)
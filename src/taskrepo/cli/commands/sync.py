@@ -14,7 +14,7 @@ from rich.console import Console
 from rich.markup import escape
 from rich.progress import Progress, TaskID
 
-from taskrepo.core.repository import Repository, RepositoryManager
+from taskrepo.core.repository import Repository, get_manager
 from taskrepo.core.task import Task
 from taskrepo.tui.conflict_resolver import resolve_conflict_interactive
 from taskrepo.tui.display import display_tasks_table
@@ -348,7 +348,7 @@ def run_with_spinner(
 def sync(ctx, repo, push, auto_merge, strategy, verbose, non_interactive):
     """Sync task repositories with git (pull and optionally push)."""
     config = ctx.obj["config"]
-    manager = RepositoryManager(config.parent_dir)
+    manager = get_manager(config.parent_dir)
 
     # Get repositories to sync
     if repo:
@@ -547,8 +547,7 @@ def sync(ctx, repo, push, auto_merge, strategy, verbose, non_interactive):
 
                             if resolved_files:
                                 # Stage resolved files
-                                for resolved_file in resolved_files:
-                                    git_repo.index.add([str(resolved_file)])
+                                git_repo.index.add([str(resolved_file) for resolved_file in resolved_files])
                                 progress.console.print(f"  [green]✓[/green] Resolved {len(resolved_files)} file(s)")
 
                         # Try to complete the merge
@@ -614,6 +613,7 @@ def sync(ctx, repo, push, auto_merge, strategy, verbose, non_interactive):
                     if conflicts:
                         progress.console.print(f"  [yellow]⚠[/yellow] Found {len(conflicts)} conflicting task(s)")
                         resolved_count = 0
+                        resolved_paths = []
 
                         for conflict in conflicts:
                             resolved_task = None
@@ -686,11 +686,13 @@ def sync(ctx, repo, push, auto_merge, strategy, verbose, non_interactive):
                                 repository.save_task(resolved_task)
                                 # Invalidate cache since task was modified
                                 task_cache.invalidate(repository.path / conflict.file_path)
-                                git_repo.git.add(str(conflict.file_path))
+                                resolved_paths.append(str(conflict.file_path))
                                 resolved_count += 1
 
                         # Track conflict resolution (don't commit yet - will consolidate later)
                         if resolved_count > 0:
+                            # Stage all resolutions with a single git invocation
+                            git_repo.git.add(*resolved_paths)
                             change_tracker.record_conflict_resolution(resolved_count)
                             progress.console.print(
                                 f"  [green]✓[/green] Resolved and staged {resolved_count} conflict(s)"
@@ -746,8 +748,7 @@ def sync(ctx, repo, push, auto_merge, strategy, verbose, non_interactive):
 
                             # Stage resolved files (don't commit yet - will consolidate later)
                             def stage_resolutions():
-                                for file_path in resolved_files:
-                                    git_repo.git.add(str(file_path))
+                                git_repo.git.add(*[str(file_path) for file_path in resolved_files])
 
                             run_with_spinner(
                                 progress,
@@ -776,8 +777,9 @@ def sync(ctx, repo, push, auto_merge, strategy, verbose, non_interactive):
                         if resolved_readmes:
                             # Stage resolved README files
                             def stage_readme_resolutions():
-                                for file_path in resolved_readmes:
-                                    git_repo.git.add(str(file_path.relative_to(repository.path)))
+                                git_repo.git.add(
+                                    *[str(file_path.relative_to(repository.path)) for file_path in resolved_readmes]
+                                )
 
                             run_with_spinner(
                                 progress,
@@ -8,7 +8,7 @@ from pathlib import Path
 import click
 from rich.console import Console
 
-from taskrepo.core.repository import RepositoryManager
+from taskrepo.core.repository import get_manager
 from taskrepo.tui import prompts
 from taskrepo.tui.task_tui import TaskTUI
 from taskrepo.utils.conflict_detection import display_conflict_warning, scan_all_repositories
@@ -152,7 +152,7 @@ def tui(ctx, repo, no_sync):
         q/Esc - Quit
     """
     config = ctx.obj["config"]
-    manager = RepositoryManager(config.parent_dir)
+    manager = get_manager(config.parent_dir)
     repositories = manager.discover_repositories()
 
     if not repositories:
@@ -207,7 +207,7 @@ def tui(ctx, repo, no_sync):
             ctx.exit(1)
 
     # Update ID cache with all tasks before starting TUI
-    manager = RepositoryManager(config.parent_dir)
+    manager = get_manager(config.parent_dir)
     all_tasks = manager.list_all_tasks(include_archived=False)
     sorted_tasks = sort_tasks(all_tasks, config, all_tasks=all_tasks)
     save_id_cache(sorted_tasks)
@@ -236,12 +236,6 @@ def tui(ctx, repo, no_sync):
             _handle_new_task(task_tui, config)
         elif result == "edit":
             _handle_edit_task(task_tui, config)
-        elif result == "done":
-            _handle_status_change(task_tui, "completed")
-        elif result == "in-progress":
-            _handle_in_progress_toggle(task_tui)
-        elif result == "cancelled":
-            _handle_status_change(task_tui, "cancelled")
         elif result == "delete":
             _handle_delete_task(task_tui)
         elif result == "archive":
@@ -252,12 +246,6 @@ def tui(ctx, repo, no_sync):
             _handle_subtask(task_tui, config)
         elif result == "extend":
             _handle_extend(task_tui, config)
-        elif result == "priority-high":
-            _handle_priority_change(task_tui, "H")
-        elif result == "priority-medium":
-            _handle_priority_change(task_tui, "M")
-        elif result == "priority-low":
-            _handle_priority_change(task_tui, "L")
         elif result == "info":
             _handle_info_task(task_tui)
         elif result == "sync":
@@ -272,7 +260,9 @@ def tui(ctx, repo, no_sync):
         sorted_tasks = sort_tasks(all_tasks, config, all_tasks=all_tasks)
         save_id_cache(sorted_tasks)
 
-        # Recreate TUI to refresh, restoring view state
+        # Recreate TUI to refresh, restoring view state. Rediscover so repositories added or
+        # removed meanwhile show up; unchanged ones are reused with their validated task caches.
+        repositories = manager.discover_repositories()
         task_tui = TaskTUI(config, repositories)
         task_tui.view_mode = saved_view_mode
         task_tui.current_view_idx = saved_view_idx
@@ -439,109 +429,6 @@ def _handle_edit_task(task_tui: TaskTUI, config):
             task_tui._force_reload()
 
 
-def _handle_in_progress_toggle(task_tui: TaskTUI):
-    """Handle toggling between in-progress and pending status."""
-    selected_tasks = task_tui._get_selected_tasks()
-    if not selected_tasks:
-        # Silently return if no task selected
-        return
-
-    from datetime import datetime
-
-    # Update each task in its respective repository
-    for task in selected_tasks:
-        # Find the repository for this task by name (works in all view modes)
-        repo = next((r for r in task_tui.repositories if r.name == task.repo), None)
-
-        if not repo:
-            # Skip this task if repo not found
-            continue
-
-        # Toggle: if in-progress, set to pending; otherwise, set to in-progress
-        if task.status == "in-progress":
-            task.status = "pending"
-        else:
-            task.status = "in-progress"
-
-        task.modified = datetime.now()
-        repo.save_task(task)
-
-    # Mark TUI as not synced since we made local changes
-    _mark_as_not_synced(task_tui)
-
-    # Force immediate reload to show changes
-    task_tui._force_reload()
-
-    # Clear multi-selection (no message, immediate return to TUI)
-    task_tui.multi_selected.clear()
-
-
-def _handle_status_change(task_tui: TaskTUI, new_status: str):
-    """Handle changing status of selected task(s)."""
-    selected_tasks = task_tui._get_selected_tasks()
-    if not selected_tasks:
-        # Silently return if no task selected
-        return
-
-    from datetime import datetime
-
-    # Update each task in its respective repository
-    for task in selected_tasks:
-        # Find the repository for this task by name (works in all view modes)
-        repo = next((r for r in task_tui.repositories if r.name == task.repo), None)
-
-        if not repo:
-            # Skip this task if repo not found
-            continue
-
-        task.status = new_status
-        task.modified = datetime.now()
-        repo.save_task(task)
-
-    # Mark TUI as not synced since we made local changes
-    _mark_as_not_synced(task_tui)
-
-    # Force immediate reload to show changes
-    # If status change removes task from view (completed/cancelled), select task above
-    removes_from_view = new_status in ["completed", "cancelled"]
-    task_tui._force_reload(select_above=removes_from_view)
-
-    # Clear multi-selection (no message, immediate return to TUI)
-    task_tui.multi_selected.clear()
-
-
-def _handle_priority_change(task_tui: TaskTUI, new_priority: str):
-    """Handle changing priority of selected task(s)."""
-    selected_tasks = task_tui._get_selected_tasks()
-    if not selected_tasks:
-        # Silently return if no task selected
-        return
-
-    from datetime import datetime
-
-    # Update each task in its respective repository
-    for task in selected_tasks:
-        # Find the repository for this task by name (works in all view modes)
-        repo = next((r for r in task_tui.repositories if r.name == task.repo), None)
-
-        if not repo:
-            # Skip this task if repo not found
-            continue
-
-        task.priority = new_priority
-        task.modified = datetime.now()
-        repo.save_task(task)
-
-    # Mark TUI as not synced since we made local changes
-    _mark_as_not_synced(task_tui)
-
-    # Force immediate reload to show changes
-    task_tui._force_reload()
-
-    # Clear multi-selection (no message, immediate return to TUI)
-    task_tui.multi_selected.clear()
-
-
 def _handle_delete_task(task_tui: TaskTUI):
     """Handle deleting selected task(s)."""
     selected_tasks = task_tui._get_selected_tasks()
@@ -635,7 +522,7 @@ def _handle_move_task(task_tui: TaskTUI, config):
     """Handle moving selected task(s) to another repository."""
     from datetime import datetime
 
-    from taskrepo.core.repository import RepositoryManager
+    from taskrepo.core.repository import get_manager
     from taskrepo.tui import prompts
 
     selected_tasks = task_tui._get_selected_tasks()
@@ -664,7 +551,7 @@ def _handle_move_task(task_tui: TaskTUI, config):
         return
 
     # Initialize manager for subtask checking
-    manager = RepositoryManager(config.parent_dir)
+    manager = get_manager(config.parent_dir)
 
     # Move each task
     moved_count = 0
@@ -778,9 +665,10 @@ def _handle_subtask(task_tui: TaskTUI, config):
         return
 
     # Get existing values for autocomplete
-    existing_projects = repo.get_projects()
-    existing_assignees = repo.get_assignees()
-    existing_tags = repo.get_tags()
+    summary = repo.summarize()
+    existing_projects = summary["projects"]
+    existing_assignees = summary["assignees"]
+    existing_tags = summary["tags"]
 
     # Prompt for other task details
     project = prompts.prompt_project(existing_projects, default=parent_task.project)
@@ -1203,8 +1091,7 @@ def _handle_sync(task_tui: TaskTUI, config):
                         click.secho(f"  ✓ Auto-resolved {len(resolved_files)} conflicted file(s)", fg="green")
 
                         # Commit the resolutions
-                        for file_path in resolved_files:
-                            git_repo.git.add(str(file_path))
+                        git_repo.git.add(*[str(file_path) for file_path in resolved_files])
                         git_repo.index.commit(f"Auto-resolve: Fixed {len(resolved_files)} conflict marker(s)")
                         click.secho("  ✓ Committed conflict resolutions", fg="green")
 
@@ -6,7 +6,7 @@ import click
 from prompt_toolkit.shortcuts import prompt
 from prompt_toolkit.validation import Validator
 
-from taskrepo.core.repository import RepositoryManager
+from taskrepo.core.repository import get_manager
 from taskrepo.utils.display_constants import STATUS_EMOJIS
 from taskrepo.utils.helpers import find_task_by_title_or_id, select_task_from_result
 
@@ -22,7 +22,7 @@ def unarchive(ctx, task_ids, repo, yes):
     TASK_IDS: One or more task IDs to unarchive
     """
     config = ctx.obj["config"]
-    manager = RepositoryManager(config.parent_dir)
+    manager = get_manager(config.parent_dir)
 
     # Process multiple task IDs
     unarchived_tasks = []
@@ -5,7 +5,7 @@ from typing import Optional, Tuple
 import click
 from dateparser import parse as parse_date
 
-from taskrepo.core.repository import RepositoryManager
+from taskrepo.core.repository import get_manager
 from taskrepo.utils.helpers import find_task_by_title_or_id, select_task_from_result
 
 
@@ -53,7 +53,7 @@ def update(
     TASK_IDS: One or more task IDs (comma-separated or space-separated)
     """
     config = ctx.obj["config"]
-    manager = RepositoryManager(config.parent_dir)
+    manager = get_manager(config.parent_dir)
 
     # Check that at least one update option is provided
     if not any([priority, status, project, add_tag, remove_tag, add_assignee, remove_assignee, due, title]):
@@ -1,5 +1,11 @@
 """Main CLI entry point for TaskRepo."""
 
+import functools
+import importlib
+import os
+import sys
+from pathlib import Path
+
 import click
 from henriqueslab_updater import (
     ChangelogPlugin,
@@ -9,78 +15,230 @@ from henriqueslab_updater import (
 )
 
 from taskrepo.__version__ import __version__
-from taskrepo.cli.commands.add import add
-from taskrepo.cli.commands.add_link import add_link
-from taskrepo.cli.commands.append import append
-from taskrepo.cli.commands.archive import archive
-from taskrepo.cli.commands.cancelled import cancelled
-from taskrepo.cli.commands.changelog import changelog
-from taskrepo.cli.commands.config import config_cmd
-from taskrepo.cli.commands.delete import delete
-from taskrepo.cli.commands.done import done
-from taskrepo.cli.commands.edit import edit
-from taskrepo.cli.commands.extend import ext
-from taskrepo.cli.commands.history import history
-from taskrepo.cli.commands.in_progress import in_progress
-from taskrepo.cli.commands.info import info
-from taskrepo.cli.commands.list import list_tasks
-from taskrepo.cli.commands.move import move
-from taskrepo.cli.commands.repos_search import repos_search
-from taskrepo.cli.commands.search import search
-from taskrepo.cli.commands.sync import sync
-from taskrepo.cli.commands.tui import tui
-from taskrepo.cli.commands.unarchive import unarchive
-from taskrepo.cli.commands.update import update
-from taskrepo.cli.commands.upgrade import upgrade
 from taskrepo.core.config import Config
 from taskrepo.utils.banner import display_banner
 
+# Help sections in display order: (section title, command names)
+COMMAND_SECTIONS = (
+    (
+        "Setup & Configuration",
+        ("init", "config", "config-show", "llm-info", "changelog", "upgrade"),
+    ),
+    (
+        "Viewing Tasks",
+        ("list", "search", "info", "tui"),
+    ),
+    (
+        "Managing Tasks",
+        ("add", "edit", "ext", "move", "in-progress", "done", "cancelled", "del", "archive", "unarchive"),
+    ),
+    (
+        "Repository Operations",
+        ("create-repo", "repos", "repos-search", "sync", "history"),
+    ),
+)
+
 
 class OrderedGroup(click.Group):
     """Custom Click Group that displays commands in sections."""
 
     def format_commands(self, ctx, formatter):
         """Format commands with section headers."""
-        # Define command sections in desired order
-        sections = [
-            (
-                "Setup & Configuration",
-                ["init", "config", "config-show", "llm-info", "changelog", "upgrade"],
-            ),
-            (
-                "Viewing Tasks",
-                ["list", "search", "info", "tui"],
-            ),
-            (
-                "Managing Tasks",
-                ["add", "edit", "ext", "move", "in-progress", "done", "cancelled", "del", "archive", "unarchive"],
-            ),
-            (
-                "Repository Operations",
-                ["create-repo", "repos", "repos-search", "sync", "history"],
-            ),
-        ]
-
-        # Build command dict
-        commands = {}
-        for subcommand in self.list_commands(ctx):
-            cmd = self.get_command(ctx, subcommand)
-            if cmd is None:
-                continue
-            if cmd.hidden:
-                continue
-            commands[subcommand] = cmd
-
         # Format each section
-        for section_name, command_names in sections:
-            # Filter commands that exist in this section
-            section_commands = [(name, commands[name]) for name in command_names if name in commands]
-
-            if section_commands:
+        for section_name, command_names in COMMAND_SECTIONS:
+            section_rows = []
+            for name in command_names:
+                short_help = self.get_short_help(ctx, name, formatter.width)
+                if short_help is not None:
+                    section_rows.append((name, short_help))
+
+            if section_rows:
                 with formatter.section(section_name):
-                    formatter.write_dl(
-                        [(name, cmd.get_short_help_str(limit=formatter.width)) for name, cmd in section_commands]
-                    )
+                    formatter.write_dl(section_rows)
+
+    def get_short_help(self, ctx, cmd_name, limit):
+        """Get the short help for a command, or None if it is missing or hidden."""
+        cmd = self.get_command(ctx, cmd_name)
+        if cmd is None or cmd.hidden:
+            return None
+        return cmd.get_short_help_str(limit=limit)
+
+
+class LazyGroup(OrderedGroup):
+    """OrderedGroup that imports subcommand modules only when they are needed.
+
+    Subcommands are declared as a mapping of command name to
+    (module path, attribute name, short help) and resolved on first lookup,
+    so invocations such as ``tsk --version`` don't import every command
+    module. The declared short help lets ``tsk --help`` render without
+    importing any of them.
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        """List eagerly registered and lazily declared commands."""
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        """Return the command, importing its module on first access."""
+        cmd = super().get_command(ctx, cmd_name)
+        if cmd is None and cmd_name in self.lazy_subcommands:
+            module_name, attr_name, _help = self.lazy_subcommands[cmd_name]
+            cmd = getattr(importlib.import_module(module_name), attr_name)
+            # Register the resolved command so later lookups skip the import
+            self.add_command(cmd, name=cmd_name)
+        return cmd
+
+    def get_short_help(self, ctx, cmd_name, limit):
+        """Get the short help, using the declared text for unloaded commands."""
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            # Shorten the declared help exactly as click would for the real command
+            placeholder = click.Command(cmd_name, help=self.lazy_subcommands[cmd_name][2])
+            return placeholder.get_short_help_str(limit=limit)
+        return super().get_short_help(ctx, cmd_name, limit)
+
+
+# Subcommands defined in taskrepo.cli.commands, loaded on demand:
+# name -> (module path, attribute name, short help shown by --help)
+LAZY_SUBCOMMANDS = {
+    "add": (
+        "taskrepo.cli.commands.add",
+        "add",
+        "Add a new task.",
+    ),
+    "add-link": (
+        "taskrepo.cli.commands.add_link",
+        "add_link",
+        "Add a link/URL to a task.",
+    ),
+    "append": (
+        "taskrepo.cli.commands.append",
+        "append",
+        "Append text to a task's description.",
+    ),
+    "archive": (
+        "taskrepo.cli.commands.archive",
+        "archive",
+        "Archive one or more tasks, or list archived tasks if no task IDs are provided.",
+    ),
+    "cancelled": (
+        "taskrepo.cli.commands.cancelled",
+        "cancelled",
+        "Mark one or more tasks as cancelled.",
+    ),
+    "changelog": (
+        "taskrepo.cli.commands.changelog",
+        "changelog",
+        "View changelog for TaskRepo versions.",
+    ),
+    "config": (
+        "taskrepo.cli.commands.config",
+        "config_cmd",
+        "Interactive configuration management.",
+    ),
+    # Register only as "del"
+    "del": (
+        "taskrepo.cli.commands.delete",
+        "delete",
+        "Delete one or more tasks permanently.",
+    ),
+    "done": (
+        "taskrepo.cli.commands.done",
+        "done",
+        "Mark one or more tasks as completed, or list completed tasks if no task IDs are provided.",
+    ),
+    "edit": (
+        "taskrepo.cli.commands.edit",
+        "edit",
+        "Edit one or more tasks.",
+    ),
+    "ext": (
+        "taskrepo.cli.commands.extend",
+        "ext",
+        "Set task due dates to a specific date or extend by a duration.",
+    ),
+    "history": (
+        "taskrepo.cli.commands.history",
+        "history",
+        "Show task and git repository history over time.",
+    ),
+    "in-progress": (
+        "taskrepo.cli.commands.in_progress",
+        "in_progress",
+        "Mark one or more tasks as in progress.",
+    ),
+    "info": (
+        "taskrepo.cli.commands.info",
+        "info",
+        "Display detailed information about a specific task.",
+    ),
+    "list": (
+        "taskrepo.cli.commands.list",
+        "list_tasks",
+        "List tasks with optional filters.",
+    ),
+    "move": (
+        "taskrepo.cli.commands.move",
+        "move",
+        "Move one or more tasks to a different repository.",
+    ),
+    "repos-search": (
+        "taskrepo.cli.commands.repos_search",
+        "repos_search",
+        "Search for TaskRepo repositories on GitHub.",
+    ),
+    "search": (
+        "taskrepo.cli.commands.search",
+        "search",
+        "Search for tasks containing a text query.",
+    ),
+    "sync": (
+        "taskrepo.cli.commands.sync",
+        "sync",
+        "Sync task repositories with git (pull and optionally push).",
+    ),
+    "tui": (
+        "taskrepo.cli.commands.tui",
+        "tui",
+        "Launch interactive TUI for task management.",
+    ),
+    "unarchive": (
+        "taskrepo.cli.commands.unarchive",
+        "unarchive",
+        "Unarchive one or more tasks (restore from archive folder).",
+    ),
+    "update": (
+        "taskrepo.cli.commands.update",
+        "update",
+        "Update fields for one or more tasks.",
+    ),
+    "upgrade": (
+        "taskrepo.cli.commands.upgrade",
+        "upgrade",
+        "Upgrade taskrepo to the latest version.",
+    ),
+}
+
+
+class LazyContextObj(dict):
+    """Click context object that loads the configuration on first access.
+
+    Commands keep reading ``ctx.obj["config"]``; the config file is only
+    parsed when a command actually does so, not on ``--help``/``--version``.
+    """
+
+    def __missing__(self, key):
+        if key == "config":
+            config = self[key] = Config()
+            return config
+        raise KeyError(key)
+
+
+# Commands that never trigger the post-command update check
+SKIP_UPDATE_CHECK_COMMANDS = frozenset({"upgrade", "changelog", "llm-info"})
 
 
 def print_version(ctx, param, value):
@@ -100,7 +258,7 @@ def print_help(ctx, param, value):
     ctx.exit()
 
 
-@click.group(cls=OrderedGroup, invoke_without_command=True)
+@click.group(cls=LazyGroup, lazy_subcommands=LAZY_SUBCOMMANDS, invoke_without_command=True)
 @click.option(
     "--version",
     is_flag=True,
@@ -124,11 +282,9 @@ def cli(ctx):
 
     Manage your tasks as markdown files in git repositories.
     """
-    # Ensure context object exists
-    ctx.ensure_object(dict)
-
-    # Load configuration
-    ctx.obj["config"] = Config()
+    # Ensure context object exists; configuration is loaded on first use
+    if not isinstance(ctx.obj, LazyContextObj):
+        ctx.obj = LazyContextObj(ctx.obj or {})
 
     # Display banner when no subcommand is provided (shows help)
     if ctx.invoked_subcommand is None:
@@ -142,7 +298,13 @@ def process_result(ctx, result, **kwargs):
     """Process result after command execution.
 
     This runs after any command completes and checks for updates.
+    The check itself is throttled by henriqueslab-updater's cache (24h).
     """
+    # Skip commands that handle updates themselves and output consumed by
+    # other programs (pipes, redirects), where a notice is just noise
+    if ctx.invoked_subcommand in SKIP_UPDATE_CHECK_COMMANDS or not sys.stdout.isatty():
+        return
+
     # Start async update check in background (if due)
     check_for_updates_async_background(
         package_name="taskrepo",
@@ -160,43 +322,12 @@ def process_result(ctx, result, **kwargs):
     show_update_notification()
 
 
-# Register commands
-cli.add_command(add)
-cli.add_command(add_link)
-cli.add_command(append)
-cli.add_command(archive)
-cli.add_command(cancelled)
-cli.add_command(changelog)
-cli.add_command(config_cmd)
-cli.add_command(list_tasks)
-cli.add_command(edit)
-cli.add_command(done)
-cli.add_command(delete, name="del")  # Register only as "del"
-cli.add_command(ext)
-cli.add_command(history)
-cli.add_command(move)
-cli.add_command(in_progress)
-cli.add_command(info)
-cli.add_command(repos_search)
-cli.add_command(search)
-cli.add_command(sync)
-cli.add_command(tui)
-cli.add_command(unarchive)
-cli.add_command(update)
-cli.add_command(upgrade)
-
-
 @cli.command()
 @click.option("--reconfigure", is_flag=True, help="Reconfigure even if already initialized")
 @click.pass_context
 def init(ctx, reconfigure):
     """Initialize TaskRepo configuration."""
-    from pathlib import Path
-
-    from prompt_toolkit import prompt
-    from prompt_toolkit.shortcuts import confirm
-
-    from taskrepo.core.repository import RepositoryManager
+    from taskrepo.core.repository import RepositoryManager, get_manager
 
     config = ctx.obj["config"]
 
@@ -210,16 +341,17 @@ def init(ctx, reconfigure):
         click.echo(f"Parent directory: {config.parent_dir}")
         click.echo()
 
-        if not confirm("Reconfigure TaskRepo?"):
+        # click.confirm keeps this common "just verify" path free of prompt_toolkit
+        if not click.confirm("Reconfigure TaskRepo?", default=False):
             # Just verify setup
-            manager = RepositoryManager(config.parent_dir)
+            manager = get_manager(config.parent_dir)
             repos = manager.discover_repositories()
 
             if repos:
                 click.echo()
                 click.secho(f"✓ Found {len(repos)} repositor{'y' if len(repos) == 1 else 'ies'}:", fg="green")
                 for repo in repos:
-                    task_count = len(repo.list_tasks())
+                    task_count = repo.task_count()
                     click.echo(f"  - {repo.name} ({task_count} tasks)")
             else:
                 click.echo()
@@ -230,6 +362,9 @@ def init(ctx, reconfigure):
 
         click.echo()
 
+    from prompt_toolkit import prompt
+    from prompt_toolkit.shortcuts import confirm
+
     # Scan for existing repositories
     click.echo("Scanning for existing task repositories...")
     current_dir = Path.cwd()
@@ -239,18 +374,20 @@ def init(ctx, reconfigure):
     if current_dir.parent != current_dir:  # Not at root
         scan_locations.append(current_dir.parent)
 
-    # Also scan common code directories
+    # Also scan common code directories (one listing of ~ instead of a stat per name)
     home = Path.home()
-    for common_dir in ["Code", "GitHub", "Projects", "Documents", "src"]:
-        potential_path = home / common_dir
-        if potential_path.exists() and potential_path not in scan_locations:
-            scan_locations.append(potential_path)
+    try:
+        with os.scandir(home) as entries:
+            home_dirs = {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        home_dirs = set()
+    scan_locations.extend(
+        home / name for name in ("Code", "GitHub", "Projects", "Documents", "src") if name in home_dirs
+    )
 
-    # Find all locations with task repositories
-    found_locations = {}
-    for location in scan_locations:
-        repos_dict = RepositoryManager.scan_for_task_repositories(location, max_depth=2)
-        found_locations.update(repos_dict)
+    # Find all locations with task repositories (one walk over all locations;
+    # locations that overlap or repeat are only listed once)
+    found_locations = RepositoryManager.scan_for_task_repositories(*scan_locations, max_depth=2)
 
     # Present options to user
     parent_dir = None
@@ -262,11 +399,11 @@ def init(ctx, reconfigure):
         # Sort by number of repos (descending)
         sorted_locations = sorted(found_locations.items(), key=lambda x: len(x[1]), reverse=True)
 
+        lines = []
         for idx, (location, repos) in enumerate(sorted_locations, 1):
-            click.echo(f"  {idx}. {location}")
-            for repo_name in repos:
-                click.echo(f"     - tasks-{repo_name}")
-        click.echo()
+            lines.append(f"  {idx}. {location}")
+            lines.extend(f"     - tasks-{repo_name}" for repo_name in repos)
+        click.echo("\n".join(lines) + "\n")
 
         # If current directory has repos, offer it as default
         if current_dir in found_locations:
@@ -318,14 +455,14 @@ def init(ctx, reconfigure):
             click.secho(f"✓ Created {parent_dir}", fg="green")
 
     # Verify setup by discovering repositories
-    manager = RepositoryManager(parent_dir)
+    manager = get_manager(parent_dir)
     repos = manager.discover_repositories()
 
     click.echo()
     if repos:
         click.secho(f"Found {len(repos)} repositor{'y' if len(repos) == 1 else 'ies'}:", fg="green")
         for repo in repos:
-            task_count = len(repo.list_tasks())
+            task_count = repo.task_count()
             click.echo(f"  - {repo.name} ({task_count} tasks)")
         click.echo()
         click.secho("✓ Ready to use! Try: tsk list", fg="green", bold=True)
@@ -345,12 +482,12 @@ def init(ctx, reconfigure):
 @click.pass_context
 def create_repo(ctx, name, github, org, interactive):
     """Create a new task repository."""
-    from taskrepo.core.repository import Repository, RepositoryManager
+    from taskrepo.core.repository import Repository, get_manager
     from taskrepo.tui import prompts
     from taskrepo.utils.github import GitHubError, check_github_repo_exists, clone_github_repo
 
     config = ctx.obj["config"]
-    manager = RepositoryManager(config.parent_dir)
+    manager = get_manager(config.parent_dir)
 
     # Interactive mode
     if interactive:
@@ -361,8 +498,7 @@ def create_repo(ctx, name, github, org, interactive):
         # Get repository name
         if not name:
             # Get existing repo names for validation
-            existing_repos = manager.discover_repositories()
-            existing_names = [repo.name for repo in existing_repos]
+            existing_names = manager.discover_repository_names()
             name = prompts.prompt_repo_name(existing_names=existing_names)
             if not name:
                 click.echo("Cancelled.")
@@ -390,10 +526,11 @@ def create_repo(ctx, name, github, org, interactive):
             visibility = prompts.prompt_visibility()
 
             # Check if GitHub repo already exists
-            if check_github_repo_exists(org, f"tasks-{name}"):
+            github_repo_name = f"tasks-{name}"
+            if check_github_repo_exists(org, github_repo_name):
                 click.echo()
-                click.secho(f"⚠️  Repository tasks-{name} already exists on GitHub!", fg="yellow", bold=True)
-                click.echo(f"    URL: https://github.com/{org}/tasks-{name}")
+                click.secho(f"⚠️  Repository {github_repo_name} already exists on GitHub!", fg="yellow", bold=True)
+                click.echo(f"    URL: https://github.com/{org}/{github_repo_name}")
                 click.echo()
 
                 # Ask if user wants to clone it
@@ -402,15 +539,15 @@ def create_repo(ctx, name, github, org, interactive):
                 try:
                     if confirm("Would you like to clone it instead?"):
                         # Clone the repository
-                        repo_path = config.parent_dir / f"tasks-{name}"
+                        repo_path = config.parent_dir / github_repo_name
                         click.echo("\nCloning repository from GitHub...")
 
                         try:
-                            clone_github_repo(org, f"tasks-{name}", repo_path)
+                            clone_github_repo(org, github_repo_name, repo_path)
                             repo = Repository(repo_path)
                             click.echo()
                             click.secho(f"✓ Cloned repository: {repo.name} at {repo.path}", fg="green")
-                            click.secho(f"✓ GitHub repository: https://github.com/{org}/tasks-{name}", fg="green")
+                            click.secho(f"✓ GitHub repository: https://github.com/{org}/{github_repo_name}", fg="green")
                             ctx.exit(0)
                         except GitHubError as e:
                             click.secho(f"\n✗ Failed to clone repository: {e}", fg="red", err=True)
@@ -458,9 +595,10 @@ def create_repo(ctx, name, github, org, interactive):
             visibility = "private"  # Default to private in non-interactive mode
 
             # Check if GitHub repo already exists
-            if check_github_repo_exists(org, f"tasks-{name}"):
+            github_repo_name = f"tasks-{name}"
+            if check_github_repo_exists(org, github_repo_name):
                 click.secho(
-                    f"Error: Repository tasks-{name} already exists on GitHub at https://github.com/{org}/tasks-{name}",
+                    f"Error: Repository {github_repo_name} already exists on GitHub at https://github.com/{org}/{github_repo_name}",
                     fg="red",
                     err=True,
                 )
@@ -485,10 +623,10 @@ def create_repo(ctx, name, github, org, interactive):
 @click.pass_context
 def repos(ctx):
     """List all task repositories."""
-    from taskrepo.core.repository import RepositoryManager
+    from taskrepo.core.repository import get_manager
 
     config = ctx.obj["config"]
-    manager = RepositoryManager(config.parent_dir)
+    manager = get_manager(config.parent_dir)
 
     repositories = manager.discover_repositories()
 
@@ -528,6 +666,147 @@ def config_show(ctx):
     click.echo(f"  Stable display IDs: {stable_ids_status}")
 
 
+@functools.cache
+def _llm_info_text() -> tuple[str, str]:
+    """Build the static parts of the llm-info reference once.
+
+    Returns:
+        Tuple of (header, footer) text surrounding the dynamic
+        commands and configuration sections
+    """
+    header = [
+        "",
+        "=" * 70,
+        click.style("TaskRepo CLI Reference for LLMs", fg="cyan", bold=True),
+        "=" * 70,
+        "",
+        "TaskRepo is a TaskWarrior-inspired CLI for managing tasks as",
+        "markdown files in git repositories.",
+        "",
+        # Section 1: Available Commands (dynamic from --help)
+        click.style("📋 AVAILABLE COMMANDS", fg="yellow", bold=True),
+        "",
+        "Run 'tsk --help' to see all commands. Key commands include:",
+        "",
+    ]
+    footer = [
+        # Section 3: Task Properties (static but important)
+        click.style("🏷️  TASK PROPERTIES", fg="yellow", bold=True),
+        "",
+        "  Statuses:   pending, in-progress, completed, cancelled",
+        "  Priorities: H (High), M (Medium), L (Low)",
+        '  Due dates:  today, tomorrow, "next week", "Nov 15", 2025-11-15',
+        "              OR durations: 1d, 2w, 3m, 1y (extends from current due)",
+        "  Assignees:  @username (GitHub handles)",
+        "  Parent:     <task-id> (for creating subtasks - hierarchical tasks)",
+        "  Display IDs: Sequential numbers (1, 2, 3...) mapped to task UUIDs",
+        "",
+        # Section 4: Command Examples (curated for LLMs)
+        click.style("💡 COMMAND EXAMPLES", fg="yellow", bold=True),
+        "",
+        "  # List high-priority tasks in work repo",
+        "  tsk list --repo work --priority H",
+        "",
+        "  # List pending tasks for a specific assignee",
+        "  tsk list --assignee @alice --status pending",
+        "",
+        "  # Search for authentication-related tasks",
+        '  tsk search "authentication"',
+        "",
+        "  # Create task with multiple options",
+        '  tsk add --title "Fix bug" --priority H --due tomorrow --repo work',
+        "",
+        "  # Create subtask (non-interactive)",
+        '  tsk add --title "Write tests" --parent 3 --repo work -I',
+        "",
+        "  # Edit task fields directly (non-interactive)",
+        "  tsk edit 5 --priority L --status in-progress",
+        "  tsk edit 5 --add-tags urgent --add-assignees @bob",
+        "",
+        "  # Set or change parent (make task a subtask)",
+        "  tsk edit 5 --parent 3",
+        "",
+        "  # Remove parent (convert subtask to top-level)",
+        '  tsk edit 5 --parent ""',
+        "",
+        "  # Extend due date by 1 week",
+        "  tsk ext 5 1w",
+        "",
+        "  # Set due date to specific date",
+        "  tsk ext 5 tomorrow",
+        '  tsk ext 5 "Nov 15"',
+        "",
+        "  # Mark multiple tasks as done",
+        "  tsk done 4,5,6",
+        "",
+        "  # Move task to another repository",
+        "  tsk move 5 --to personal",
+        "",
+        # Section 5: Filtering & Searching
+        click.style("🔍 FILTERING & SEARCHING", fg="yellow", bold=True),
+        "",
+        "  Filter flags for 'tsk list':",
+        "    --repo, -r <name>        Filter by repository",
+        "    --status, -s <status>    Filter by status",
+        "    --priority <H|M|L>       Filter by priority",
+        "    --assignee, -a @user     Filter by assignee",
+        "    --tag, -t <tag>          Filter by tag",
+        "    --project, -p <name>     Filter by project",
+        "    --archived               Show archived tasks",
+        "",
+        "  Search command:",
+        '    tsk search "keyword"      Search title, description, project, tags',
+        '    tsk search "bug" --priority H  Combine search with filters',
+        "",
+        # Section 6: Common Workflows
+        click.style("📝 COMMON WORKFLOWS", fg="yellow", bold=True),
+        "",
+        "  1. Create and start working on a task:",
+        '     tsk add --title "Implement feature" --priority H --repo work',
+        "     tsk in-progress <id>",
+        "",
+        "  2. Create task with subtasks (non-interactive):",
+        '     tsk add --title "Build feature" --repo work -I',
+        '     tsk add --title "Write tests" --parent <parent-id> --repo work -I',
+        '     tsk add --title "Update docs" --parent <parent-id> --repo work -I',
+        "",
+        "  3. Convert existing tasks to subtasks:",
+        "     tsk edit 10 11 12 --parent 3",
+        "",
+        "  4. Find and update tasks:",
+        '     tsk search "authentication"',
+        "     tsk edit <id> --add-tags security",
+        "     tsk ext <id> 1w",
+        "",
+        "  5. Review and complete tasks:",
+        "     tsk list --status in-progress",
+        "     tsk done <id>",
+        "",
+        "  6. Sync with team:",
+        "     tsk sync --push",
+        "",
+        # Section 7: Quick Tips for LLMs
+        click.style("💡 QUICK TIPS FOR LLMs", fg="yellow", bold=True),
+        "",
+        "  • Use display IDs (1, 2, 3...) to reference tasks in commands",
+        "  • Multiple IDs: Use comma-separated list (e.g., 4,5,6)",
+        "  • Subtasks: Use --parent flag on add/edit; supports hierarchical tasks",
+        "  • Subtasks can exist in different repositories from their parent",
+        "  • View subtasks with 'tsk info <id>' to see parent and children",
+        "  • Tasks are stored as markdown files in git repositories",
+        "  • Repository naming: tasks-{name} (e.g., tasks-work, tasks-personal)",
+        "  • Configuration file: ~/.TaskRepo/config",
+        "  • Interactive mode: Run 'tsk tui' for full-screen interface",
+        "  • Each task has a UUID but users interact via sequential IDs",
+        "  • Use 'tsk config --show' to see current user configuration",
+        "  • Use 'tsk --help' to see all available commands",
+        "",
+        "=" * 70,
+        "",
+    ]
+    return "\n".join(header), "\n".join(footer)
+
+
 @cli.command()
 @click.pass_context
 def llm_info(ctx):
@@ -539,34 +818,17 @@ def llm_info(ctx):
     from taskrepo.cli.commands.config import _display_config
 
     config = ctx.obj["config"]
+    header, footer = _llm_info_text()
 
-    click.echo()
-    click.echo("=" * 70)
-    click.secho("TaskRepo CLI Reference for LLMs", fg="cyan", bold=True)
-    click.echo("=" * 70)
-    click.echo()
-    click.echo("TaskRepo is a TaskWarrior-inspired CLI for managing tasks as")
-    click.echo("markdown files in git repositories.")
-    click.echo()
-
-    # Section 1: Available Commands (dynamic from --help)
-    click.secho("📋 AVAILABLE COMMANDS", fg="yellow", bold=True)
-    click.echo()
-    click.echo("Run 'tsk --help' to see all commands. Key commands include:")
-    click.echo()
+    click.echo(header)
 
-    # Get the help output from the parent CLI group
+    # Get the help output from the parent CLI group and keep just the
+    # commands section (from the first section header to the end)
     help_text = ctx.parent.get_help()
-    # Extract just the commands section (after "Options:" and before the end)
-    lines = help_text.split("\n")
-    in_commands = False
-    for line in lines:
-        # Start printing after we pass the Options section
-        if "Setup & Configuration:" in line:
-            in_commands = True
-        if in_commands:
-            click.echo(line)
-
+    start = help_text.find("Setup & Configuration:")
+    if start != -1:
+        help_text = help_text[help_text.rfind("\n", 0, start) + 1 :]
+        click.echo(help_text)
     click.echo()
 
     # Section 2: Current Configuration (dynamic from config --show)
@@ -574,123 +836,7 @@ def llm_info(ctx):
     _display_config(config)
     click.echo()
 
-    # Section 3: Task Properties (static but important)
-    click.secho("🏷️  TASK PROPERTIES", fg="yellow", bold=True)
-    click.echo()
-    click.echo("  Statuses:   pending, in-progress, completed, cancelled")
-    click.echo("  Priorities: H (High), M (Medium), L (Low)")
-    click.echo('  Due dates:  today, tomorrow, "next week", "Nov 15", 2025-11-15')
-    click.echo("              OR durations: 1d, 2w, 3m, 1y (extends from current due)")
-    click.echo("  Assignees:  @username (GitHub handles)")
-    click.echo("  Parent:     <task-id> (for creating subtasks - hierarchical tasks)")
-    click.echo("  Display IDs: Sequential numbers (1, 2, 3...) mapped to task UUIDs")
-    click.echo()
-
-    # Section 4: Command Examples (curated for LLMs)
-    click.secho("💡 COMMAND EXAMPLES", fg="yellow", bold=True)
-    click.echo()
-    click.echo("  # List high-priority tasks in work repo")
-    click.echo("  tsk list --repo work --priority H")
-    click.echo()
-    click.echo("  # List pending tasks for a specific assignee")
-    click.echo("  tsk list --assignee @alice --status pending")
-    click.echo()
-    click.echo("  # Search for authentication-related tasks")
-    click.echo('  tsk search "authentication"')
-    click.echo()
-    click.echo("  # Create task with multiple options")
-    click.echo('  tsk add --title "Fix bug" --priority H --due tomorrow --repo work')
-    click.echo()
-    click.echo("  # Create subtask (non-interactive)")
-    click.echo('  tsk add --title "Write tests" --parent 3 --repo work -I')
-    click.echo()
-    click.echo("  # Edit task fields directly (non-interactive)")
-    click.echo("  tsk edit 5 --priority L --status in-progress")
-    click.echo("  tsk edit 5 --add-tags urgent --add-assignees @bob")
-    click.echo()
-    click.echo("  # Set or change parent (make task a subtask)")
-    click.echo("  tsk edit 5 --parent 3")
-    click.echo()
-    click.echo("  # Remove parent (convert subtask to top-level)")
-    click.echo('  tsk edit 5 --parent ""')
-    click.echo()
-    click.echo("  # Extend due date by 1 week")
-    click.echo("  tsk ext 5 1w")
-    click.echo()
-    click.echo("  # Set due date to specific date")
-    click.echo("  tsk ext 5 tomorrow")
-    click.echo('  tsk ext 5 "Nov 15"')
-    click.echo()
-    click.echo("  # Mark multiple tasks as done")
-    click.echo("  tsk done 4,5,6")
-    click.echo()
-    click.echo("  # Move task to another repository")
-    click.echo("  tsk move 5 --to personal")
-    click.echo()
-
-    # Section 5: Filtering & Searching
-    click.secho("🔍 FILTERING & SEARCHING", fg="yellow", bold=True)
-    click.echo()
-    click.echo("  Filter flags for 'tsk list':")
-    click.echo("    --repo, -r <name>        Filter by repository")
-    click.echo("    --status, -s <status>    Filter by status")
-    click.echo("    --priority <H|M|L>       Filter by priority")
-    click.echo("    --assignee, -a @user     Filter by assignee")
-    click.echo("    --tag, -t <tag>          Filter by tag")
-    click.echo("    --project, -p <name>     Filter by project")
-    click.echo("    --archived               Show archived tasks")
-    click.echo()
-    click.echo("  Search command:")
-    click.echo('    tsk search "keyword"      Search title, description, project, tags')
-    click.echo('    tsk search "bug" --priority H  Combine search with filters')
-    click.echo()
-
-    # Section 6: Common Workflows
-    click.secho("📝 COMMON WORKFLOWS", fg="yellow", bold=True)
-    click.echo()
-    click.echo("  1. Create and start working on a task:")
-    click.echo('     tsk add --title "Implement feature" --priority H --repo work')
-    click.echo("     tsk in-progress <id>")
-    click.echo()
-    click.echo("  2. Create task with subtasks (non-interactive):")
-    click.echo('     tsk add --title "Build feature" --repo work -I')
-    click.echo('     tsk add --title "Write tests" --parent <parent-id> --repo work -I')
-    click.echo('     tsk add --title "Update docs" --parent <parent-id> --repo work -I')
-    click.echo()
-    click.echo("  3. Convert existing tasks to subtasks:")
-    click.echo("     tsk edit 10 11 12 --parent 3")
-    click.echo()
-    click.echo("  4. Find and update tasks:")
-    click.echo('     tsk search "authentication"')
-    click.echo("     tsk edit <id> --add-tags security")
-    click.echo("     tsk ext <id> 1w")
-    click.echo()
-    click.echo("  5. Review and complete tasks:")
-    click.echo("     tsk list --status in-progress")
-    click.echo("     tsk done <id>")
-    click.echo()
-    click.echo("  6. Sync with team:")
-    click.echo("     tsk sync --push")
-    click.echo()
-
-    # Section 7: Quick Tips for LLMs
-    click.secho("💡 QUICK TIPS FOR LLMs", fg="yellow", bold=True)
-    click.echo()
-    click.echo("  • Use display IDs (1, 2, 3...) to reference tasks in commands")
-    click.echo("  • Multiple IDs: Use comma-separated list (e.g., 4,5,6)")
-    click.echo("  • Subtasks: Use --parent flag on add/edit; supports hierarchical tasks")
-    click.echo("  • Subtasks can exist in different repositories from their parent")
-    click.echo("  • View subtasks with 'tsk info <id>' to see parent and children")
-    click.echo("  • Tasks are stored as markdown files in git repositories")
-    click.echo("  • Repository naming: tasks-{name} (e.g., tasks-work, tasks-personal)")
-    click.echo("  • Configuration file: ~/.TaskRepo/config")
-    click.echo("  • Interactive mode: Run 'tsk tui' for full-screen interface")
-    click.echo("  • Each task has a UUID but users interact via sequential IDs")
-    click.echo("  • Use 'tsk config --show' to see current user configuration")
-    click.echo("  • Use 'tsk --help' to see all available commands")
-    click.echo()
-    click.echo("=" * 70)
-    click.echo()
+    click.echo(footer)
 
 
 if __name__ == "__main__":
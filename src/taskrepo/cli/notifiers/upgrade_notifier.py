@@ -2,6 +2,19 @@
 
 import click
 
+# Manual upgrade instructions keyed by henriqueslab-updater install method
+_PIP_INSTRUCTIONS = (
+    "  pip install --upgrade taskrepo",
+    "  # Or try with --user flag:",
+    "  pip install --upgrade --user taskrepo",
+)
+_MANUAL_INSTRUCTIONS = {
+    "homebrew": ("  brew update && brew upgrade taskrepo",),
+    "pipx": ("  pipx upgrade taskrepo",),
+    "uv": ("  uv tool upgrade taskrepo",),
+    "dev": ("  cd <repo> && git pull && uv sync",),
+}
+
 
 class TaskRepoUpgradeNotifier:
     """Rich-based upgrade notifier matching TaskRepo's cyan color scheme.
@@ -30,13 +43,13 @@ class TaskRepoUpgradeNotifier:
             latest: Latest available version
             available: Whether an update is available
         """
+        lines = [f"Current version: v{current}"]
         if available and latest:
-            click.echo(f"Current version: v{current}")
-            click.secho(f"Latest version: v{latest}", fg="green", bold=True)
-            click.secho("Update available!", fg="yellow")
+            lines.append(click.style(f"Latest version: v{latest}", fg="green", bold=True))
+            lines.append(click.style("Update available!", fg="yellow"))
         else:
-            click.echo(f"Current version: v{current}")
-            click.secho("✓ You are already using the latest version", fg="green")
+            lines.append(click.style("✓ You are already using the latest version", fg="green"))
+        click.echo("\n".join(lines))
 
     def show_update_info(self, current: str, latest: str, release_url: str) -> None:
         """Show update available information.
@@ -46,10 +59,13 @@ class TaskRepoUpgradeNotifier:
             latest: Latest available version
             release_url: URL to release notes
         """
-        click.echo()
-        click.secho(f"Update available: v{current} → v{latest}", fg="yellow", bold=True)
-        click.echo(f"Release notes: {release_url}")
-        click.echo()
+        lines = [
+            "",
+            click.style(f"Update available: v{current} → v{latest}", fg="yellow", bold=True),
+            f"Release notes: {release_url}",
+            "",
+        ]
+        click.echo("\n".join(lines))
 
     def show_installer_info(self, friendly_name: str, command: str) -> None:
         """Show detected installer information.
@@ -58,9 +74,7 @@ class TaskRepoUpgradeNotifier:
             friendly_name: Human-readable installer name
             command: The upgrade command to be executed
         """
-        click.echo(f"\nDetected installer: {friendly_name}")
-        click.echo(f"Running: {command}")
-        click.echo()
+        click.echo(f"\nDetected installer: {friendly_name}\nRunning: {command}\n")
 
     def show_success(self, version: str) -> None:
         """Show successful upgrade message.
@@ -68,11 +82,14 @@ class TaskRepoUpgradeNotifier:
         Args:
             version: The version that was installed
         """
-        click.echo()
-        click.secho(f"✓ Successfully upgraded taskrepo to v{version}", fg="green", bold=True)
-        click.echo()
-        click.echo("Please restart your terminal or run 'source ~/.bashrc' (or ~/.zshrc)")
-        click.echo("to ensure the new version is loaded.")
+        lines = [
+            "",
+            click.style(f"✓ Successfully upgraded taskrepo to v{version}", fg="green", bold=True),
+            "",
+            "Please restart your terminal or run 'source ~/.bashrc' (or ~/.zshrc)",
+            "to ensure the new version is loaded.",
+        ]
+        click.echo("\n".join(lines))
 
     def show_error(self, error: str | None) -> None:
         """Show upgrade error message.
@@ -80,13 +97,10 @@ class TaskRepoUpgradeNotifier:
         Args:
             error: Error message (if available)
         """
-        click.echo()
-        click.secho("✗ Upgrade failed", fg="red", bold=True)
-        click.echo()
+        lines = ["", click.style("✗ Upgrade failed", fg="red", bold=True), ""]
         if error:
-            click.secho("Error:", fg="red")
-            click.echo(error)
-            click.echo()
+            lines += [click.style("Error:", fg="red"), error, ""]
+        click.echo("\n".join(lines))
 
     def show_manual_instructions(self, install_method: str) -> None:
         """Show manual upgrade instructions.
@@ -94,31 +108,9 @@ class TaskRepoUpgradeNotifier:
         Args:
             install_method: The detected installation method
         """
-        # Map internal install_method to friendly names
-        installer_names = {
-            "homebrew": "Homebrew",
-            "pipx": "pipx",
-            "uv": "uv tool",
-            "pip-user": "pip (user)",
-            "pip": "pip",
-            "dev": "Development mode",
-            "unknown": "pip",
-        }
-        installer_name = installer_names.get(install_method, install_method)
-
-        click.secho("Manual upgrade:", fg="yellow")
-        if installer_name == "Homebrew":
-            click.echo("  brew update && brew upgrade taskrepo")
-        elif installer_name == "pipx":
-            click.echo("  pipx upgrade taskrepo")
-        elif installer_name == "uv tool":
-            click.echo("  uv tool upgrade taskrepo")
-        elif installer_name == "Development mode":
-            click.echo("  cd <repo> && git pull && uv sync")
-        else:
-            click.echo("  pip install --upgrade taskrepo")
-            click.echo("  # Or try with --user flag:")
-            click.echo("  pip install --upgrade --user taskrepo")
+        lines = [click.style("Manual upgrade:", fg="yellow")]
+        lines.extend(_MANUAL_INSTRUCTIONS.get(install_method, _PIP_INSTRUCTIONS))
+        click.echo("\n".join(lines))
 
     def confirm_upgrade(self, version: str) -> bool:
         """Prompt user to confirm upgrade.
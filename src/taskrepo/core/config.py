@@ -1,5 +1,7 @@
 """Configuration management for TaskRepo."""
 
+import json
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -62,23 +64,89 @@ class Config:
             self.save()
             return self._data
 
-        try:
-            with open(self.config_path) as f:
-                data = yaml.safe_load(f) or {}
-        except yaml.YAMLError as e:
-            print(f"Warning: Failed to parse config file: {e}")
-            data = {}
+        # Reuse the parsed config when the file is unchanged since last parse
+        cache_key = self._cache_key()
+        data = self._load_cached_config(cache_key)
+
+        if data is None:
+            try:
+                with open(self.config_path) as f:
+                    data = yaml.safe_load(f) or {}
+                self._save_cached_config(cache_key, data)
+            except yaml.YAMLError as e:
+                print(f"Warning: Failed to parse config file: {e}")
+                data = {}
 
         # Merge with defaults
         config = self.DEFAULT_CONFIG.copy()
         config.update(data)
         return config
 
+    @property
+    def _cache_path(self) -> Path:
+        """Path to the parsed-config cache stored next to the config file."""
+        return self.config_path.with_name(f".{self.config_path.name}_cache.json")
+
+    def _cache_key(self) -> Optional[list[int]]:
+        """Get the (mtime_ns, size) key identifying the current config file contents.
+
+        Returns:
+            Cache key, or None if the config file can't be stat'ed
+        """
+        try:
+            stat = self.config_path.stat()
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def _load_cached_config(self, cache_key: Optional[list[int]]) -> Optional[dict]:
+        """Load parsed config data from the cache if it matches the config file.
+
+        Args:
+            cache_key: Key of the current config file (from _cache_key)
+
+        Returns:
+            Cached config data, or None on a cache miss
+        """
+        if cache_key is None:
+            return None
+
+        try:
+            with open(self._cache_path, encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(cached, dict) or cached.get("key") != cache_key:
+            return None
+        return cached.get("data")
+
+    def _save_cached_config(self, cache_key: Optional[list[int]], data: dict):
+        """Write parsed config data to the cache.
+
+        Args:
+            cache_key: Key of the config file the data was parsed from
+            data: Parsed config data
+        """
+        if cache_key is None:
+            return
+
+        tmp_path = self._cache_path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"key": cache_key, "data": data}, f)
+            os.replace(tmp_path, self._cache_path)
+        except (OSError, TypeError, ValueError):
+            # Non-JSON values or unwritable directory - just skip caching
+            tmp_path.unlink(missing_ok=True)
+
     def save(self):
         """Save configuration to file."""
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
         with open(self.config_path, "w") as f:
             yaml.dump(self._data, f, default_flow_style=False, sort_keys=False)
+        # Refresh the cache so a same-size rewrite within mtime granularity can't go stale
+        self._save_cached_config(self._cache_key(), self._data)
 
     @property
     def parent_dir(self) -> Path:
@@ -1,25 +1,121 @@
 """Repository discovery and management."""
 
+import json
+import os
 import uuid
-from functools import lru_cache
+import weakref
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Optional
 
 from git import Repo as GitRepo
 
-from taskrepo.core.task import Task
+from taskrepo.core.task import Task, TaskMeta
+from taskrepo.utils.paths import get_meta_cache_dir
+
+# Metadata cache format version - increment when the entry layout changes
+META_CACHE_VERSION = 1
+
+# Upper bound on threads used to load task files concurrently
+_MAX_LOAD_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+# Below this many files, thread start-up costs more than it saves
+_PARALLEL_LOAD_MIN_FILES = 32
+
+# Emoji shown next to status and priority in generated README tables
+_README_STATUS_EMOJI = {
+    "pending": "⏳",
+    "in-progress": "🔄",
+    "completed": "✅",
+    "cancelled": "❌",
+}
+_README_PRIORITY_EMOJI = {"H": "🔴", "M": "🟡", "L": "🟢"}
+
+
+@lru_cache(maxsize=256)
+def _readme_tree_prefix(depth: int, is_last: bool, ancestors: tuple[bool, ...]) -> str:
+    """Build the README tree-drawing prefix for a row; siblings share their prefix.
+
+    Args:
+        depth: Tree depth of the task (0 for top-level)
+        is_last: Whether the task is the last child of its parent
+        ancestors: Whether each ancestor is a last child
+
+    Returns:
+        Prefix to put before the task title
+    """
+    if depth == 0:
+        return ""
+
+    branch = "└─ " if is_last else "├─ "
+
+    # For direct children (depth 1), only show branch without ancestor lines
+    if depth == 1:
+        return branch
+
+    # For deeper nesting, add ancestor lines, skipping the first ancestor (parent is top-level)
+    prefix = "".join(
+        "&nbsp;&nbsp;&nbsp;" if is_ancestor_last else "│&nbsp;&nbsp;" for is_ancestor_last in ancestors[1:]
+    )
+    return prefix + branch
+
+
+@lru_cache(maxsize=4096)
+def _archive_readme_row(
+    task_id: str,
+    title: str,
+    status: str,
+    priority: str,
+    assignees: tuple[str, ...],
+    project: Optional[str],
+    tags: tuple[str, ...],
+    links: tuple[str, ...],
+    due: Optional[datetime],
+    modified: datetime,
+) -> str:
+    """Format one row of the archive README table.
+
+    Archived rows depend only on the task's fields (there is no countdown
+    column), so rows of unchanged tasks are reused across README regenerations.
+
+    Returns:
+        Markdown table row
+    """
+    task_link = f"[{task_id[:8]}...](task-{task_id}.md)"  # Relative link
+    status_text = f"{_README_STATUS_EMOJI.get(status, '')} {status}"
+    priority_text = f"{_README_PRIORITY_EMOJI.get(priority, '')} {priority}"
+    assignees_text = ", ".join(assignees) if assignees else "-"
+    tags_text = ", ".join(tags) if tags else "-"
+    # Markdown links with 🔗 emoji
+    links_text = " ".join(f"[🔗]({link})" for link in links) if links else "-"
+    due_date = due.strftime("%Y-%m-%d") if due else "-"
+    # Archived date (modified timestamp)
+    archived_date = modified.strftime("%Y-%m-%d")
+
+    # Escape pipe characters
+    title = title.replace("|", "\\|")
+    project_text = (project or "-").replace("|", "\\|")
+
+    return (
+        f"| {task_link} | {title} | {status_text} | {priority_text} | {assignees_text} | {project_text} "
+        f"| {tags_text} | {links_text} | {due_date} | {archived_date} |"
+    )
 
 
 @lru_cache(maxsize=512)
-def _load_task_cached(file_path: str, mtime: float, repo: str) -> Task:
+def _load_task_cached(file_path: str, mtime_ns: int, size: int, repo: str) -> Task:
     """Load and parse a task file with LRU caching.
 
-    Caches parsed Task objects based on file path and modification time.
-    When mtime changes, the cache is automatically invalidated.
+    Caches parsed Task objects based on file path, modification time and size.
+    When either changes, the cache is automatically invalidated; the size
+    catches rewrites that land within the filesystem's mtime granularity.
 
     Args:
         file_path: Path to task file (as string for hashability)
-        mtime: File modification time (for cache invalidation)
+        mtime_ns: File modification time in nanoseconds (for cache invalidation)
+        size: File size in bytes (for cache invalidation)
         repo: Repository name
 
     Returns:
@@ -28,22 +124,88 @@ def _load_task_cached(file_path: str, mtime: float, repo: str) -> Task:
     return Task.load(Path(file_path), repo=repo)
 
 
+# Bumped whenever any repository writes a task or the cache is cleared, so
+# per-instance list_tasks() caches never outlive an in-process modification.
+_cache_generation = 0
+
+
 def clear_task_cache():
     """Clear the task loading cache.
 
     Call this after modifying tasks to ensure fresh data is loaded.
     Useful when tasks are updated outside of the normal flow.
     """
+    global _cache_generation
+    _cache_generation += 1
     _load_task_cached.cache_clear()
 
 
+def _scan_task_files(directory: Path) -> list[os.DirEntry]:
+    """List task-*.md files in a directory with a single scandir pass.
+
+    Args:
+        directory: Directory to scan (missing directories yield no entries)
+
+    Returns:
+        DirEntry objects sorted by filename
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = [e for e in it if e.name.startswith("task-") and e.name.endswith(".md") and e.is_file()]
+    except OSError:
+        return []
+    entries.sort(key=lambda e: e.name)
+    return entries
+
+
+def _report_load_failures(failed_files: list[tuple[str, str]], kind: str, repo_name: str, silent_errors: bool) -> None:
+    """Print warnings for task files that failed to load, in a single write.
+
+    Args:
+        failed_files: (file path, error message) pairs
+        kind: What was being loaded, e.g. "task" or "archived task"
+        repo_name: Repository name for the summary line
+        silent_errors: If True, print only a summary instead of one line per file
+    """
+    if not failed_files:
+        return
+
+    def is_conflict(error: str) -> bool:
+        # Git conflict markers surface as YAML errors
+        return "<<<<<<< HEAD" in error or "could not find expected ':'" in error
+
+    if silent_errors:
+        lines = [f"Warning: Failed to load {len(failed_files)} {kind}(s) in {repo_name} repository"]
+        conflict_count = sum(1 for _, error in failed_files if is_conflict(error))
+        if conflict_count:
+            lines.append(f"  → {conflict_count} file(s) appear to have unresolved git merge conflicts")
+            lines.append("  → Run 'git status' to check for conflicts and resolve them")
+    else:
+        lines = []
+        for path, error in failed_files:
+            name = os.path.basename(path)
+            if is_conflict(error):
+                lines.append(f"Warning: Failed to load {kind} {name}: Invalid YAML frontmatter: {error}")
+            else:
+                lines.append(f"Warning: Failed to load {kind} {name}: {error}")
+    print("\n".join(lines))
+
+
+def _dir_mtime_ns(path: Path) -> Optional[int]:
+    """Return a directory's modification time in nanoseconds, or None if missing."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
 class Repository:
     """Represents a task repository (tasks-* directory with git).
 
     Attributes:
         name: Repository name (e.g., 'work' from 'tasks-work')
         path: Path to the repository directory
-        git_repo: GitPython Repo object
+        git_repo: GitPython Repo object (opened lazily)
     """
 
     def __init__(self, path: Path):
@@ -66,17 +228,7 @@ class Repository:
         if not dir_name.startswith("tasks-"):
             raise ValueError(f"Invalid repository name: {dir_name}. Must start with 'tasks-'")
 
-        self.name = dir_name[6:]  # Remove 'tasks-' prefix
-        self.path = path
-        self.tasks_dir = path / "tasks"
-        self.archive_dir = self.tasks_dir / "archive"
-
-        # Initialize or open git repository
-        try:
-            self.git_repo = GitRepo(path)
-        except Exception:
-            # Not a git repo yet, initialize it
-            self.git_repo = GitRepo.init(path)
+        self._init_attributes(path)
 
         # Ensure tasks directory exists
         self.tasks_dir.mkdir(exist_ok=True)
@@ -86,6 +238,50 @@ class Repository:
         # Migrate old done tasks to main tasks folder
         self._migrate_done_to_tasks()
 
+    @classmethod
+    def _from_trusted(cls, path: Path) -> "Repository":
+        """Create a Repository for a path already known to be a tasks-* directory.
+
+        Skips the existence, type and name checks of __init__ (the caller has
+        just established them) and doesn't create tasks/ or archive/; methods
+        that write there create them on demand.
+
+        Args:
+            path: Path to an existing tasks-* directory
+
+        Returns:
+            Repository object
+        """
+        repo = cls.__new__(cls)
+        repo._init_attributes(path)
+        repo._migrate_done_to_tasks()
+        return repo
+
+    def _init_attributes(self, path: Path) -> None:
+        """Set the path-derived attributes shared by all constructors."""
+        self.name = path.name[6:]  # Remove 'tasks-' prefix
+        self.path = path
+        self.tasks_dir = path / "tasks"
+        self.archive_dir = self.tasks_dir / "archive"
+        # include_archived -> (cache key, tasks); see list_tasks()
+        self._tasks_cache: dict[bool, tuple[tuple, list[Task]]] = {}
+        # (cache key, summary); see summarize()
+        self._summary_cache: Optional[tuple[tuple, dict[str, list[str]]]] = None
+
+    @cached_property
+    def git_repo(self) -> GitRepo:
+        """GitPython Repo object, opened (or initialized) on first access.
+
+        Listing and reading tasks never touches git, so the repository is
+        only opened for callers that actually need it.
+        """
+        # A single stat decides open vs. init, so errors opening an existing
+        # repository are raised instead of being masked by a re-init
+        if (self.path / ".git").exists():
+            return GitRepo(self.path)
+        # Not a git repo yet, initialize it
+        return GitRepo.init(self.path)
+
     def _migrate_done_to_tasks(self) -> None:
         """Migrate tasks from old done/ folder to main tasks/ folder.
 
@@ -124,10 +320,52 @@ class Repository:
         except Exception as e:
             print(f"Warning: Could not fully remove done/ folder: {e}")
 
+    def invalidate(self) -> None:
+        """Drop this repository's cached task list and bump the shared cache generation."""
+        global _cache_generation
+        _cache_generation += 1
+        self._tasks_cache.clear()
+        self._summary_cache = None
+
+    def _scan_task_dirs(
+        self, include_archived: bool
+    ) -> tuple[list[tuple[os.DirEntry, Optional[os.stat_result]]], tuple]:
+        """Scan the task directories and stat every task file once.
+
+        Task files are rewritten in place, which leaves the directory mtime
+        unchanged, so the cache key covers each file's (mtime_ns, size) rather
+        than the directories alone.
+
+        Args:
+            include_archived: If True, also scan the archive/ folder
+
+        Returns:
+            Tuple of ((entry, stat or None if it vanished) pairs, list_tasks() cache key)
+        """
+        task_dirs = [self.tasks_dir, self.archive_dir] if include_archived else [self.tasks_dir]
+        files = []
+        signature = []
+        for task_dir in task_dirs:
+            for entry in _scan_task_files(task_dir):
+                try:
+                    st = entry.stat()
+                except OSError:
+                    st = None
+                files.append((entry, st))
+                signature.append((entry.path, st.st_mtime_ns, st.st_size) if st else (entry.path, None, None))
+        return files, (tuple(signature), _cache_generation)
+
+    def _tasks_cache_key(self, include_archived: bool) -> tuple:
+        """Build the list_tasks() cache key from every task file's mtime and size."""
+        return self._scan_task_dirs(include_archived)[1]
+
     def list_tasks(self, include_archived: bool = False, silent_errors: bool = False) -> list[Task]:
         """List all tasks in this repository.
 
-        Uses LRU caching to avoid re-parsing unchanged task files.
+        The parsed list is memoized per instance and reused while no task file
+        was added, removed, renamed or rewritten (each file's mtime and size
+        are checked, so edits from other processes are picked up). Individual
+        files are additionally LRU-cached by mtime.
 
         Args:
             include_archived: If True, also load tasks from archive/ folder
@@ -136,53 +374,55 @@ class Repository:
         Returns:
             List of Task objects (from tasks/ folder, excluding archive/ subdirectory)
         """
+        # Load from tasks/ directory (excluding archive/ subdirectory),
+        # optionally followed by the archive/ directory
+        files, cache_key = self._scan_task_dirs(include_archived)
+        cached = self._tasks_cache.get(include_archived)
+        if cached is not None and cached[0] == cache_key:
+            return list(cached[1])
+
         tasks = []
         failed_files = []
 
-        # Load from tasks/ directory (excluding archive/ subdirectory)
-        if self.tasks_dir.exists():
-            for task_file in sorted(self.tasks_dir.glob("task-*.md")):
-                try:
-                    # Use cached loading with mtime for automatic invalidation
-                    mtime = task_file.stat().st_mtime
-                    task = _load_task_cached(str(task_file), mtime, self.name)
-                    tasks.append(task)
-                except Exception as e:
-                    failed_files.append((task_file, str(e)))
-                    if not silent_errors:
-                        # Check if error is due to git conflict markers
-                        if "<<<<<<< HEAD" in str(e) or "could not find expected ':'" in str(e):
-                            print(f"Warning: Failed to load task {task_file.name}: Invalid YAML frontmatter: {e}")
-                        else:
-                            print(f"Warning: Failed to load task {task_file.name}: {e}")
-
-        # Optionally load from archive/ directory
-        if include_archived and self.archive_dir.exists():
-            for task_file in sorted(self.archive_dir.glob("task-*.md")):
-                try:
-                    # Use cached loading with mtime for automatic invalidation
-                    mtime = task_file.stat().st_mtime
-                    task = _load_task_cached(str(task_file), mtime, self.name)
-                    tasks.append(task)
-                except Exception as e:
-                    failed_files.append((task_file, str(e)))
-                    if not silent_errors:
-                        # Check if error is due to git conflict markers
-                        if "<<<<<<< HEAD" in str(e) or "could not find expected ':'" in str(e):
-                            print(f"Warning: Failed to load task {task_file.name}: Invalid YAML frontmatter: {e}")
-                        else:
-                            print(f"Warning: Failed to load task {task_file.name}: {e}")
-
-        # Show summary if there were errors and we're being silent
-        if silent_errors and failed_files:
-            print(f"Warning: Failed to load {len(failed_files)} task(s) in {self.name} repository")
-            # Check for git conflict markers
-            conflict_files = [f for f, e in failed_files if "<<<<<<< HEAD" in e or "could not find expected ':'" in e]
-            if conflict_files:
-                print(f"  → {len(conflict_files)} file(s) appear to have unresolved git merge conflicts")
-                print("  → Run 'git status' to check for conflicts and resolve them")
+        def load(file: tuple[os.DirEntry, Optional[os.stat_result]]) -> tuple[Optional[Task], Optional[Exception]]:
+            entry, st = file
+            try:
+                if st is None:
+                    st = entry.stat()
+                # Use cached loading with mtime for automatic invalidation
+                return _load_task_cached(entry.path, st.st_mtime_ns, st.st_size, self.name), None
+            except Exception as e:
+                return None, e
+
+        # Loading is I/O bound, so larger repositories are read on a thread pool
+        if len(files) >= _PARALLEL_LOAD_MIN_FILES:
+            with ThreadPoolExecutor(max_workers=_MAX_LOAD_WORKERS) as executor:
+                results = list(executor.map(load, files))
+        else:
+            results = [load(file) for file in files]
 
-        return tasks
+        for (entry, _), (task, e) in zip(files, results, strict=True):
+            if e is None:
+                tasks.append(task)
+            else:
+                failed_files.append((entry.path, str(e)))
+
+        _report_load_failures(failed_files, "task", self.name, silent_errors)
+
+        self._tasks_cache[include_archived] = (cache_key, tasks)
+        return list(tasks)
+
+    def task_count(self) -> int:
+        """Count task files in tasks/ (excluding archive/) without parsing them.
+
+        Returns:
+            Number of task-*.md files in the tasks/ folder
+        """
+        try:
+            with os.scandir(self.tasks_dir) as entries:
+                return sum(1 for entry in entries if entry.name.startswith("task-") and entry.name.endswith(".md"))
+        except OSError:
+            return 0
 
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get a specific task by ID.
@@ -196,17 +436,14 @@ class Repository:
         Returns:
             Task object or None if not found
         """
-        # Try tasks/ directory first
-        task_file = self.tasks_dir / f"task-{task_id}.md"
-        if task_file.exists():
-            mtime = task_file.stat().st_mtime
-            return _load_task_cached(str(task_file), mtime, self.name)
-
-        # Try archive/ directory
-        task_file = self.archive_dir / f"task-{task_id}.md"
-        if task_file.exists():
-            mtime = task_file.stat().st_mtime
-            return _load_task_cached(str(task_file), mtime, self.name)
+        # Try tasks/ directory first, then archive/ directory
+        for task_dir in (self.tasks_dir, self.archive_dir):
+            task_file = str(task_dir / f"task-{task_id}.md")
+            try:
+                st = os.stat(task_file)
+            except OSError:
+                continue
+            return _load_task_cached(task_file, st.st_mtime_ns, st.st_size, self.name)
 
         return None
 
@@ -223,6 +460,7 @@ class Repository:
             Path to the saved task file
         """
         task.repo = self.name
+        self.invalidate()
 
         # Always save to tasks/ folder
         return task.save(self.path, subfolder="tasks")
@@ -242,12 +480,14 @@ class Repository:
         task_file = self.tasks_dir / f"task-{task_id}.md"
         if task_file.exists():
             task_file.unlink()
+            self.invalidate()
             return True
 
         # Try archive/ directory
         task_file = self.archive_dir / f"task-{task_id}.md"
         if task_file.exists():
             task_file.unlink()
+            self.invalidate()
             return True
 
         return False
@@ -264,30 +504,14 @@ class Repository:
         tasks = []
         failed_files = []
 
-        if self.archive_dir.exists():
-            for task_file in sorted(self.archive_dir.glob("task-*.md")):
-                try:
-                    task = Task.load(task_file, repo=self.name)
-                    tasks.append(task)
-                except Exception as e:
-                    failed_files.append((task_file, str(e)))
-                    if not silent_errors:
-                        # Check if error is due to git conflict markers
-                        if "<<<<<<< HEAD" in str(e) or "could not find expected ':'" in str(e):
-                            print(
-                                f"Warning: Failed to load archived task {task_file.name}: Invalid YAML frontmatter: {e}"
-                            )
-                        else:
-                            print(f"Warning: Failed to load archived task {task_file.name}: {e}")
-
-        # Show summary if there were errors and we're being silent
-        if silent_errors and failed_files:
-            print(f"Warning: Failed to load {len(failed_files)} archived task(s) in {self.name} repository")
-            # Check for git conflict markers
-            conflict_files = [f for f, e in failed_files if "<<<<<<< HEAD" in e or "could not find expected ':'" in e]
-            if conflict_files:
-                print(f"  → {len(conflict_files)} file(s) appear to have unresolved git merge conflicts")
-                print("  → Run 'git status' to check for conflicts and resolve them")
+        for entry in _scan_task_files(self.archive_dir):
+            try:
+                task = Task.load(Path(entry.path), repo=self.name)
+                tasks.append(task)
+            except Exception as e:
+                failed_files.append((entry.path, str(e)))
+
+        _report_load_failures(failed_files, "archived task", self.name, silent_errors)
 
         return tasks
 
@@ -306,8 +530,10 @@ class Repository:
             return False
 
         # Move to archive directory
+        self.archive_dir.mkdir(exist_ok=True)
         archive_file = self.archive_dir / f"task-{task_id}.md"
         task_file.rename(archive_file)
+        self.invalidate()
         return True
 
     def unarchive_task(self, task_id: str) -> bool:
@@ -333,6 +559,7 @@ class Repository:
             return False
 
         archive_file.rename(task_file)
+        self.invalidate()
         return True
 
     def next_task_id(self) -> str:
@@ -343,15 +570,121 @@ class Repository:
         """
         return str(uuid.uuid4())
 
+    @property
+    def _meta_cache_path(self) -> Path:
+        """Path to this repository's persistent task metadata cache."""
+        safe_name = self.name.replace("/", "_").replace("\\", "_")
+        return get_meta_cache_dir() / f"{safe_name}_meta.json"
+
+    def _load_meta_cache(self) -> dict[str, list]:
+        """Load the persistent metadata cache for this repository.
+
+        Returns:
+            Mapping of task filename to [mtime_ns, size, id, project, assignees, tags],
+            or an empty dict if the cache is missing, corrupt or for another path
+        """
+        try:
+            with open(self._meta_cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != META_CACHE_VERSION:
+            return {}
+        if data.get("repo_path") != str(self.path) or not isinstance(data.get("entries"), dict):
+            return {}
+        return data["entries"]
+
+    def _save_meta_cache(self, entries: dict[str, list]) -> None:
+        """Atomically write the persistent metadata cache for this repository.
+
+        Args:
+            entries: Mapping of task filename to cache entry (see _load_meta_cache)
+        """
+        cache_path = self._meta_cache_path
+        tmp_path = cache_path.with_suffix(".tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": META_CACHE_VERSION, "repo_path": str(self.path), "entries": entries}, f)
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError):
+            # Non-JSON values or unwritable directory - just skip caching
+            tmp_path.unlink(missing_ok=True)
+
+    def _list_task_meta(self) -> list[TaskMeta]:
+        """List aggregator metadata for tasks in tasks/ without parsing bodies.
+
+        Reuses the memoized list_tasks() result when it is still valid.
+        Otherwise unchanged files (same mtime and size) are served from the
+        persistent metadata cache in ~/.TaskRepo/meta_cache/, and only new or
+        modified files have their frontmatter parsed. Files that fail to load
+        are skipped; list_tasks() reports them.
+
+        Returns:
+            List of TaskMeta tuples (excluding archive/ subdirectory)
+        """
+        cached = self._tasks_cache.get(False)
+        if cached is not None and cached[0] == self._tasks_cache_key(False):
+            return [TaskMeta(t.id, t.project, t.assignees, t.tags) for t in cached[1]]
+
+        meta_cache = self._load_meta_cache()
+        entries = {}
+        metas = []
+        for entry in _scan_task_files(self.tasks_dir):
+            try:
+                st = entry.stat()
+                cache_entry = meta_cache.get(entry.name)
+                if (
+                    isinstance(cache_entry, list)
+                    and len(cache_entry) == 6
+                    and cache_entry[:2] == [st.st_mtime_ns, st.st_size]
+                ):
+                    meta = TaskMeta(*cache_entry[2:])
+                else:
+                    meta = Task.load_metadata_only(Path(entry.path))
+            except Exception:
+                continue
+            entries[entry.name] = [st.st_mtime_ns, st.st_size, *meta]
+            metas.append(meta)
+
+        # Rewrite only when files were added, changed or removed
+        if entries != meta_cache:
+            self._save_meta_cache(entries)
+        return metas
+
+    def summarize(self) -> dict[str, list[str]]:
+        """Collect projects, assignees and tags in a single pass over the tasks.
+
+        The result is cached with the same key as list_tasks(), so repeated
+        calls (e.g. from autocompletion prompts) don't rescan the task set.
+
+        Returns:
+            Dictionary with sorted "projects", "assignees" and "tags" lists
+        """
+        cache_key = self._tasks_cache_key(False)
+        if self._summary_cache is None or self._summary_cache[0] != cache_key:
+            self._summary_cache = (cache_key, self._build_summary())
+        return {field: list(values) for field, values in self._summary_cache[1].items()}
+
+    def _build_summary(self) -> dict[str, list[str]]:
+        """Scan task metadata once and build the summarize() result."""
+        projects = set()
+        assignees = set()
+        tags = set()
+        for task in self._list_task_meta():
+            if task.project:
+                projects.add(task.project)
+            assignees.update(task.assignees)
+            tags.update(task.tags)
+        return {"projects": sorted(projects), "assignees": sorted(assignees), "tags": sorted(tags)}
+
     def get_projects(self) -> list[str]:
         """Get list of unique projects in this repository.
 
         Returns:
             List of project names
         """
-        tasks = self.list_tasks()
-        projects = {task.project for task in tasks if task.project}
-        return sorted(projects)
+        return self.summarize()["projects"]
 
     def get_assignees(self) -> list[str]:
         """Get list of unique assignees in this repository.
@@ -359,11 +692,7 @@ class Repository:
         Returns:
             List of assignee handles (with @ prefix)
         """
-        tasks = self.list_tasks()
-        assignees = set()
-        for task in tasks:
-            assignees.update(task.assignees)
-        return sorted(assignees)
+        return self.summarize()["assignees"]
 
     def get_tags(self) -> list[str]:
         """Get list of unique tags in this repository.
@@ -371,11 +700,7 @@ class Repository:
         Returns:
             List of tags
         """
-        tasks = self.list_tasks()
-        tags = set()
-        for task in tasks:
-            tags.update(task.tags)
-        return sorted(tags)
+        return self.summarize()["tags"]
 
     def get_subtasks(self, task_id: str) -> list[Task]:
         """Get all direct subtasks (children) of a given task.
@@ -540,42 +865,21 @@ class Repository:
                 children = children_map.get(task.id, [])
                 for i, child in enumerate(children):
                     child_is_last = i == len(children) - 1
-                    add_tree_item(child, depth + 1, child_is_last, ancestors + [is_last])
+                    add_tree_item(child, depth + 1, child_is_last, ancestors + (is_last,))
 
             # Start with top-level tasks
             top_level = [t for t in tasks if not t.parent or t.parent not in task_dict]
             for task in top_level:
-                add_tree_item(task, 0, False, [])
+                add_tree_item(task, 0, False, ())
 
             return result
 
         def format_tree_title_for_readme(title, depth, is_last, ancestors, subtask_count):
             """Format title with tree indentation for README markdown."""
-            if depth == 0:
-                if subtask_count > 0:
-                    return f"{title} 📋 {subtask_count}"
-                return title
-
-            # For direct children (depth 1), only show branch without ancestor lines
-            if depth == 1:
-                branch = "└─ " if is_last else "├─ "
-                if subtask_count > 0:
-                    return f"{branch}{title} 📋 {subtask_count}"
-                return f"{branch}{title}"
-
-            # For deeper nesting, add ancestor lines
-            prefix = ""
-            # Skip the first ancestor (parent is top-level)
-            for is_ancestor_last in ancestors[1:]:
-                prefix += "&nbsp;&nbsp;&nbsp;" if is_ancestor_last else "│&nbsp;&nbsp;"
-
-            branch = "└─ " if is_last else "├─ "
+            prefixed = f"{_readme_tree_prefix(depth, is_last, ancestors)}{title}"
             if subtask_count > 0:
-                return f"{prefix}{branch}{title} 📋 {subtask_count}"
-            return f"{prefix}{branch}{title}"
-
-        def count_children(task_id, tasks):
-            return sum(1 for t in tasks if t.parent == task_id)
+                return f"{prefixed} 📋 {subtask_count}"
+            return prefixed
 
         # Sort top-level tasks using centralized sorting logic from utils/sorting.py
         # NOTE: all_tasks parameter is critical for recursive due date calculations
@@ -589,6 +893,8 @@ class Repository:
         sorted_all = sorted_top_level + subtasks
 
         tree_items = build_tree_for_readme(sorted_all)
+        # Direct children per parent, counted once instead of scanning every task per row
+        subtask_counts = Counter(t.parent for t in sorted_all if t.parent)
 
         # Build README content
         lines = [
@@ -615,20 +921,15 @@ class Repository:
                 task_id = f"[{task.id[:8]}...](tasks/task-{task.id}.md)"
 
                 # Format title with tree structure and subtask count
-                subtask_count = count_children(task.id, sorted_all)
+                subtask_count = subtask_counts[task.id]
                 title = format_tree_title_for_readme(task.title, depth, is_last, ancestors, subtask_count)
 
                 # Status with emoji
-                status_emoji = {
-                    "pending": "⏳",
-                    "in-progress": "🔄",
-                    "completed": "✅",
-                    "cancelled": "❌",
-                }.get(task.status, "")
+                status_emoji = _README_STATUS_EMOJI.get(task.status, "")
                 status = f"{status_emoji} {task.status}"
 
                 # Priority with emoji
-                priority_emoji = {"H": "🔴", "M": "🟡", "L": "🟢"}.get(task.priority, "")
+                priority_emoji = _README_PRIORITY_EMOJI.get(task.priority, "")
                 priority = f"{priority_emoji} {task.priority}"
 
                 assignees = ", ".join(task.assignees) if task.assignees else "-"
@@ -722,47 +1023,19 @@ class Repository:
 
             # Table rows
             for task in sorted_archived:
-                # Format fields with emojis
-                task_id = f"[{task.id[:8]}...](task-{task.id}.md)"  # Relative link
-
-                title = task.title
-
-                # Status with emoji
-                status_emoji = {
-                    "pending": "⏳",
-                    "in-progress": "🔄",
-                    "completed": "✅",
-                    "cancelled": "❌",
-                }.get(task.status, "")
-                status = f"{status_emoji} {task.status}"
-
-                # Priority with emoji
-                priority_emoji = {"H": "🔴", "M": "🟡", "L": "🟢"}.get(task.priority, "")
-                priority = f"{priority_emoji} {task.priority}"
-
-                assignees = ", ".join(task.assignees) if task.assignees else "-"
-                project = task.project if task.project else "-"
-                tags = ", ".join(task.tags) if task.tags else "-"
-
-                # Format links
-                if task.links:
-                    # Create markdown links with 🔗 emoji
-                    link_items = [f"[🔗]({link})" for link in task.links]
-                    links = " ".join(link_items)
-                else:
-                    links = "-"
-
-                due_date = task.due.strftime("%Y-%m-%d") if task.due else "-"
-
-                # Archived date (modified timestamp)
-                archived_date = task.modified.strftime("%Y-%m-%d")
-
-                # Escape pipe characters
-                title = title.replace("|", "\\|")
-                project = project.replace("|", "\\|")
-
                 lines.append(
-                    f"| {task_id} | {title} | {status} | {priority} | {assignees} | {project} | {tags} | {links} | {due_date} | {archived_date} |"
+                    _archive_readme_row(
+                        task.id,
+                        task.title,
+                        task.status,
+                        task.priority,
+                        tuple(task.assignees),
+                        task.project,
+                        tuple(task.tags),
+                        tuple(task.links),
+                        task.due,
+                        task.modified,
+                    )
                 )
 
         # Add footer
@@ -774,6 +1047,7 @@ class Repository:
         )
 
         # Write README to archive/ folder
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
         readme_path = self.archive_dir / "README.md"
         readme_path.write_text("\n".join(lines) + "\n")
 
@@ -781,8 +1055,7 @@ class Repository:
 
     def __str__(self) -> str:
         """String representation of the repository."""
-        task_count = len(self.list_tasks())
-        return f"{self.name} ({task_count} tasks)"
+        return f"{self.name} ({self.task_count()} tasks)"
 
 
 class RepositoryManager:
@@ -795,74 +1068,116 @@ class RepositoryManager:
             parent_dir: Parent directory containing tasks-* repositories
         """
         self.parent_dir = parent_dir
-        self.parent_dir.mkdir(parents=True, exist_ok=True)
+        # One stat in the common case where the directory already exists
+        if not os.path.isdir(self.parent_dir):
+            self.parent_dir.mkdir(parents=True, exist_ok=True)
+        # (parent_dir mtime_ns, repositories); see discover_repositories()
+        self._repos_cache: Optional[tuple[int, list[Repository]]] = None
 
     @staticmethod
-    def scan_for_task_repositories(search_path: Path, max_depth: int = 3) -> dict[Path, list[str]]:
-        """Scan a directory tree for task repositories (tasks-* directories).
+    def scan_for_task_repositories(*search_paths: Path, max_depth: int = 3) -> dict[Path, list[str]]:
+        """Scan directory trees for task repositories (tasks-* directories).
+
+        All search paths are walked together breadth-first, so a directory reachable
+        from several of them (e.g. ~ and ~/Code) is listed only once, at its
+        shallowest depth.
 
         Args:
-            search_path: Starting directory to scan
+            *search_paths: Starting directories to scan
             max_depth: Maximum directory depth to search (default: 3)
 
         Returns:
             Dictionary mapping parent directories to lists of repository names found within them
             Example: {Path('/home/user/Code'): ['work', 'personal']}
         """
-        if not search_path.exists() or not search_path.is_dir():
-            return {}
-
         found_repos = {}
+        visited = set()
+        queue = deque((path, 0) for path in search_paths)
 
-        def scan_directory(path: Path, current_depth: int):
-            """Recursively scan directory for tasks-* folders."""
-            if current_depth > max_depth:
-                return
+        while queue:
+            path, depth = queue.popleft()
+            tasks_dirs = []
+            subdirs = []
 
             try:
-                # Check if this directory contains any tasks-* subdirectories
-                tasks_dirs = []
-                for item in path.iterdir():
-                    if item.is_dir() and item.name.startswith("tasks-"):
-                        # Extract repo name (remove tasks- prefix)
-                        repo_name = item.name[6:]
-                        tasks_dirs.append(repo_name)
-
-                # If we found any task repos in this directory, record it
-                if tasks_dirs:
-                    found_repos[path] = sorted(tasks_dirs)
-
-                # Continue scanning subdirectories (but not into tasks-* dirs themselves)
-                for item in path.iterdir():
-                    if item.is_dir() and not item.name.startswith("tasks-") and not item.name.startswith("."):
-                        scan_directory(item, current_depth + 1)
-
-            except (PermissionError, OSError):
+                real_path = os.path.realpath(path)
+                if real_path in visited:
+                    continue
+                visited.add(real_path)
+
+                # One directory read per directory; DirEntry caches the type info
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if not entry.is_dir():
+                            continue
+                        if entry.name.startswith("tasks-"):
+                            # Extract repo name (remove tasks- prefix)
+                            tasks_dirs.append(entry.name[6:])
+                        elif depth < max_depth and not entry.name.startswith("."):
+                            # Continue into subdirectories (but not into tasks-* dirs themselves)
+                            subdirs.append(Path(entry.path))
+            except OSError:
                 # Skip directories we can't access
-                pass
+                continue
+
+            # If we found any task repos in this directory, record it
+            if tasks_dirs:
+                found_repos[path] = sorted(tasks_dirs)
+
+            queue.extend((subdir, depth + 1) for subdir in subdirs)
 
-        scan_directory(search_path, 0)
         return found_repos
 
     def discover_repositories(self) -> list[Repository]:
         """Discover all task repositories in parent directory.
 
+        The result is reused until parent_dir's mtime changes (a repository
+        was added, removed or renamed), so repeated manager calls share the
+        same Repository objects and their task caches.
+
         Returns:
             List of Repository objects
         """
+        mtime_ns = _dir_mtime_ns(self.parent_dir)
+        if self._repos_cache is not None and mtime_ns is not None and self._repos_cache[0] == mtime_ns:
+            return list(self._repos_cache[1])
+
         repos = []
-        if not self.parent_dir.exists():
+        try:
+            # DirEntry.is_dir() answers from the cached dirent type, no extra stat
+            with os.scandir(self.parent_dir) as it:
+                entries = [e for e in it if e.name.startswith("tasks-") and e.is_dir()]
+        except OSError:
             return repos
+        entries.sort(key=lambda e: e.name)
 
-        for path in sorted(self.parent_dir.iterdir()):
-            if path.is_dir() and path.name.startswith("tasks-"):
-                try:
-                    repo = Repository(path)
-                    repos.append(repo)
-                except Exception as e:
-                    print(f"Warning: Failed to load repository {path}: {e}")
+        for entry in entries:
+            path = Path(entry.path)
+            try:
+                # scandir already established that this is a tasks-* directory
+                repo = Repository._from_trusted(path)
+                repos.append(repo)
+            except Exception as e:
+                print(f"Warning: Failed to load repository {path}: {e}")
+
+        if mtime_ns is not None:
+            self._repos_cache = (mtime_ns, repos)
+        return list(repos)
 
-        return repos
+    def discover_repository_names(self) -> list[str]:
+        """Discover repository names in parent directory without opening them.
+
+        Cheaper than discover_repositories() when only names are needed, as no
+        Repository (and git repo) objects are constructed.
+
+        Returns:
+            Sorted list of repository names (without 'tasks-' prefix)
+        """
+        try:
+            with os.scandir(self.parent_dir) as entries:
+                return sorted(entry.name[6:] for entry in entries if entry.name.startswith("tasks-") and entry.is_dir())
+        except OSError:
+            return []
 
     def get_repository(self, name: str) -> Optional[Repository]:
         """Get a specific repository by name.
@@ -984,6 +1299,7 @@ class RepositoryManager:
 
         # Create local repository
         repo_path.mkdir(parents=True, exist_ok=True)
+        self._repos_cache = None
         repo = Repository(repo_path)
 
         # Create initial commit with README
@@ -1052,13 +1368,19 @@ _Last updated: {self._get_timestamp()}_
         Args:
             include_archived: If True, also load tasks from archive/ folders
 
+        Repositories are loaded concurrently, since loading is dominated by
+        file I/O. Tasks are returned in repository order.
+
         Returns:
             List of Task objects
         """
-        tasks = []
-        for repo in self.discover_repositories():
-            tasks.extend(repo.list_tasks(include_archived=include_archived))
-        return tasks
+        repos = self.discover_repositories()
+        if len(repos) < 2:
+            return [task for repo in repos for task in repo.list_tasks(include_archived=include_archived)]
+
+        with ThreadPoolExecutor(max_workers=min(len(repos), _MAX_LOAD_WORKERS)) as executor:
+            per_repo = executor.map(lambda repo: repo.list_tasks(include_archived=include_archived), repos)
+            return [task for repo_tasks in per_repo for task in repo_tasks]
 
     def get_all_assignees(self) -> list[str]:
         """Get list of unique assignees across all repositories.
@@ -1121,3 +1443,27 @@ _Last updated: {self._get_timestamp()}_
             descendants.extend(self.get_all_subtasks_cross_repo(child_task.id))
 
         return descendants
+
+
+_managers: "weakref.WeakValueDictionary[str, RepositoryManager]" = weakref.WeakValueDictionary()
+
+
+def get_manager(parent_dir: Path) -> RepositoryManager:
+    """Get the RepositoryManager for a parent directory, sharing live instances.
+
+    While a manager for the same directory is still referenced elsewhere in
+    the process, it is returned instead of a new one, so its discovered
+    repositories and their task caches are reused.
+
+    Args:
+        parent_dir: Parent directory containing tasks-* repositories
+
+    Returns:
+        RepositoryManager for parent_dir
+    """
+    key = os.path.realpath(parent_dir)
+    manager = _managers.get(key)
+    if manager is None:
+        manager = RepositoryManager(parent_dir)
+        _managers[key] = manager
+    return manager
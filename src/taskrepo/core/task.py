@@ -3,13 +3,102 @@
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 from urllib.parse import urlparse
 
 import yaml
 from dateutil import parser as date_parser
 
+# Prefer the libyaml-backed loader (bundled with PyYAML wheels); it parses
+# frontmatter several times faster than the pure-Python SafeLoader.
+# Falls back to SafeLoader when PyYAML was built without libyaml.
+_YamlLoader: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class TaskMeta(NamedTuple):
+    """Frontmatter fields needed by repository aggregators.
+
+    Attributes:
+        id: Task identifier (from the filename)
+        project: Project name, if any
+        assignees: List of assignee handles
+        tags: List of tags
+    """
+
+    id: str
+    project: Optional[str]
+    assignees: list[str]
+    tags: list[str]
+
+
+def _read_frontmatter(task_file: Path, read_body: bool = True) -> tuple[str, str]:
+    """Split a task file into its YAML frontmatter and markdown body.
+
+    The file is read line by line up to the closing ``---`` delimiter; the
+    body is only read when requested.
+
+    Args:
+        task_file: Path to task markdown file
+        read_body: If False, stop after the frontmatter and return an empty body
+
+    Returns:
+        Tuple of (raw YAML text between the ``---`` delimiters, body text)
+
+    Raises:
+        ValueError: If frontmatter is missing or unterminated
+    """
+    with open(task_file) as f:
+        if f.readline().rstrip() != "---":
+            raise ValueError("Invalid task format: YAML frontmatter not found")
+        lines: list[str] = []
+        for line in f:
+            if line.rstrip() == "---":
+                return "".join(lines), f.read() if read_body else ""
+            lines.append(line)
+    raise ValueError("Invalid task format: YAML frontmatter not found")
+
+
+# Frontmatter keys read by load_metadata_only()
+_METADATA_KEYS = frozenset({"project", "assignees", "tags"})
+
+
+def _select_top_level_keys(frontmatter_str: str, keys: frozenset[str]) -> str:
+    """Cut the blocks of the given top-level keys out of YAML frontmatter.
+
+    A top-level key starts at column 0; indented lines, ``- `` list items and
+    comments belong to the preceding key. This matches the block layout that
+    to_markdown() writes, and lets callers parse a few keys instead of the
+    whole mapping.
+
+    Args:
+        frontmatter_str: Raw YAML frontmatter text
+        keys: Top-level keys to keep
+
+    Returns:
+        YAML text containing only the selected keys
+    """
+    selected = []
+    keep = False
+    for line in frontmatter_str.splitlines(keepends=True):
+        if line[:1] not in ("", " ", "\t", "-", "#", "\n", "\r"):
+            keep = line.split(":", 1)[0] in keys
+        if keep:
+            selected.append(line)
+    return "".join(selected)
+
+
+# Cached sort attributes on Task, keyed by the field they are derived from.
+# Reassigning the field drops the cached value (see Task.__setattr__).
+_DERIVED_ATTRS = {
+    "title": "title_lower",
+    "project": "project_lower",
+    "due": "due_ts",
+    "created": "created_ts",
+    "modified": "modified_ts",
+}
+
 
 @dataclass
 class Task:
@@ -92,6 +181,13 @@ class Task:
                     f"  --links https://docs.example.com,https://mail.google.com/..."
                 )
 
+    def __setattr__(self, name: str, value) -> None:
+        """Set an attribute, dropping any cached value derived from it."""
+        derived = _DERIVED_ATTRS.get(name)
+        if derived is not None:
+            self.__dict__.pop(derived, None)
+        object.__setattr__(self, name, value)
+
     @classmethod
     def from_markdown(cls, content: str, task_id: str, repo: Optional[str] = None) -> "Task":
         """Parse a markdown file with YAML frontmatter into a Task object.
@@ -114,12 +210,29 @@ class Task:
         if not match:
             raise ValueError("Invalid task format: YAML frontmatter not found")
 
-        frontmatter_str = match.group(1)
-        description = match.group(2).strip()
+        return cls._from_frontmatter(match.group(1), match.group(2).strip(), task_id, repo)
 
+    @classmethod
+    def _from_frontmatter(
+        cls, frontmatter_str: str, description: str, task_id: str, repo: Optional[str] = None
+    ) -> "Task":
+        """Build a Task from already split YAML frontmatter and description.
+
+        Args:
+            frontmatter_str: Raw YAML frontmatter text
+            description: Markdown body (already stripped)
+            task_id: Task ID
+            repo: Repository name
+
+        Returns:
+            Task object
+
+        Raises:
+            ValueError: If frontmatter is invalid
+        """
         # Parse YAML frontmatter
         try:
-            metadata = yaml.safe_load(frontmatter_str) or {}
+            metadata = yaml.load(frontmatter_str, Loader=_YamlLoader) or {}
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML frontmatter: {e}") from e
 
@@ -244,12 +357,47 @@ class Task:
         Returns:
             Task object
         """
-        content = task_file.read_text()
+        frontmatter_str, body = _read_frontmatter(task_file)
 
         # Extract task ID from filename (task-001.md -> 001)
         task_id = task_file.stem.replace("task-", "")
 
-        return cls.from_markdown(content, task_id, repo)
+        return cls._from_frontmatter(frontmatter_str, body.strip(), task_id, repo)
+
+    @staticmethod
+    def load_metadata_only(task_file: Path) -> TaskMeta:
+        """Load only the aggregator fields of a task, skipping the body.
+
+        Unlike load(), this does not validate or build a full Task.
+
+        Args:
+            task_file: Path to task markdown file
+
+        Returns:
+            TaskMeta with id, project, assignees and tags
+
+        Raises:
+            ValueError: If frontmatter is missing or invalid
+        """
+        try:
+            frontmatter_str, _ = _read_frontmatter(task_file, read_body=False)
+            selected = _select_top_level_keys(frontmatter_str, _METADATA_KEYS)
+            try:
+                metadata = yaml.load(selected, Loader=_YamlLoader) if selected else {}
+            except yaml.YAMLError:
+                metadata = None
+            if not isinstance(metadata, dict):
+                # Unusual layout the key selection can't handle; parse everything
+                metadata = yaml.load(frontmatter_str, Loader=_YamlLoader) or {}
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML frontmatter: {e}") from e
+
+        return TaskMeta(
+            id=task_file.stem.replace("task-", ""),
+            project=metadata.get("project"),
+            assignees=metadata.get("assignees") or [],
+            tags=metadata.get("tags") or [],
+        )
 
     def is_subtask(self) -> bool:
         """Check if this task is a subtask (has a parent).
@@ -298,6 +446,31 @@ class Task:
 
         return depth
 
+    @cached_property
+    def title_lower(self) -> str:
+        """Lowercased title, used as a sort key."""
+        return self.title.lower()
+
+    @cached_property
+    def project_lower(self) -> str:
+        """Lowercased project name (empty if none), used as a sort key."""
+        return (self.project or "").lower()
+
+    @cached_property
+    def due_ts(self) -> Optional[float]:
+        """POSIX timestamp of the due date, or None if no due date."""
+        return self.due.timestamp() if self.due else None
+
+    @cached_property
+    def created_ts(self) -> float:
+        """POSIX timestamp of the creation time."""
+        return self.created.timestamp()
+
+    @cached_property
+    def modified_ts(self) -> float:
+        """POSIX timestamp of the last modification time."""
+        return self.modified.timestamp()
+
     def __str__(self) -> str:
         """String representation of the task."""
         assignees_str = f" {', '.join(self.assignees)}" if self.assignees else ""
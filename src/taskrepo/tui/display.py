@@ -1,6 +1,8 @@
 """Display utilities for rendering task tables."""
 
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
 
 import wcwidth
 from rich.console import Console
@@ -9,9 +11,13 @@ from rich.table import Table
 from taskrepo.core.config import Config
 from taskrepo.core.task import Task
 from taskrepo.utils.display_constants import PRIORITY_COLORS, STATUS_COLORS
-from taskrepo.utils.id_mapping import get_display_id_from_uuid, save_id_cache
+from taskrepo.utils.id_mapping import load_uuid_to_display_id, save_id_cache
 from taskrepo.utils.sorting import sort_tasks
 
+# Rich markup for the known statuses and priorities, built once instead of per table row
+_STATUS_MARKUP = {status: f"[{color}]{status}[/{color}]" for status, color in STATUS_COLORS.items()}
+_PRIORITY_MARKUP = {priority: f"[{color}]{priority}[/{color}]" for priority, color in PRIORITY_COLORS.items()}
+
 
 def display_width(text: str) -> int:
     """Calculate the display width of a string, accounting for emojis and wide characters.
@@ -22,6 +28,10 @@ def display_width(text: str) -> int:
     Returns:
         Display width in terminal cells (emojis typically count as 2)
     """
+    # Printable ASCII is one cell per character; skip the per-codepoint lookup
+    if text.isascii() and text.isprintable():
+        return len(text)
+
     width = wcwidth.wcswidth(text)
     # wcswidth returns -1 if there are non-printable characters or unrecognized sequences
     if width >= 0:
@@ -64,6 +74,9 @@ def truncate_to_width(text: str, max_width: int, suffix: str = "...") -> str:
         # Not enough space for suffix
         return suffix[:max_width]
 
+    if text.isascii() and text.isprintable():
+        return text[:target_width] + suffix
+
     # Build truncated string character by character
     result = ""
     current = 0
@@ -107,12 +120,13 @@ def pad_to_width(text: str, target_width: int, align: str = "left") -> str:
         return text + padding
 
 
-def get_countdown_text(due_date: datetime, status: str = None) -> tuple[str, str]:
+def get_countdown_text(due_date: datetime, status: str = None, now: datetime | None = None) -> tuple[str, str]:
     """Calculate countdown text and color from a due date.
 
     Args:
         due_date: The due date to calculate countdown for
         status: Task status (if completed/cancelled, return neutral text)
+        now: Current time (defaults to datetime.now())
 
     Returns:
         Tuple of (countdown_text, color_name)
@@ -127,7 +141,7 @@ def get_countdown_text(due_date: datetime, status: str = None) -> tuple[str, str
         return "-", "red"
 
     # Use centralized countdown calculation
-    countdown_text, countdown_status, _ = calculate_countdown(due_date)
+    countdown_text, countdown_status, _ = calculate_countdown(due_date, now)
     return format_countdown_for_display(countdown_text, countdown_status)
 
 
@@ -157,13 +171,14 @@ def build_task_tree(tasks: list[Task], config: Config) -> list[tuple[Task, int,
     # Sort children within each parent
     # For subtasks, prioritize due date first, then apply the configured sort order
     # This ensures urgent subtasks appear first regardless of other sort criteria
-    for parent_id in children_map:
-        # Create a temporary config that prioritizes due date for subtasks
+    if children_map:
+        # Create a temporary config that prioritizes due date for subtasks (once, not per parent)
         # IMPORTANT: Modify _data directly to avoid triggering config.save()
         subtask_config = Config()
         subtask_config._data["sort_by"] = ["due"] + [f for f in config.sort_by if f.lstrip("-") != "due"]
         subtask_config._data["cluster_due_dates"] = config.cluster_due_dates
-        children_map[parent_id] = sort_tasks(children_map[parent_id], subtask_config, all_tasks=tasks)
+        for parent_id in children_map:
+            children_map[parent_id] = sort_tasks(children_map[parent_id], subtask_config, all_tasks=tasks)
 
     # Recursive function to build tree
     def add_to_tree(task: Task, depth: int, ancestor_positions: list[bool], result: list):
@@ -204,6 +219,24 @@ def count_subtasks(task: Task, tasks: list[Task]) -> int:
     return sum(1 for t in tasks if t.parent == task.id)
 
 
+@lru_cache(maxsize=1024)
+def _tree_prefix(depth: int, is_last: bool, ancestor_positions: tuple[bool, ...]) -> str:
+    """Build the tree-drawing prefix for a row; it depends only on the row's position in the tree."""
+    if depth == 0:
+        # Top-level task
+        return ""
+
+    branch = "└─ " if is_last else "├─ "
+
+    # For direct children (depth 1), only show branch without ancestor lines
+    if depth == 1:
+        return branch
+
+    # For deeper nesting, add ancestor lines, skipping the first ancestor (parent is top-level):
+    # no vertical line if the ancestor was the last child, otherwise a continuation line
+    return "".join("   " if is_ancestor_last else "│  " for is_ancestor_last in ancestor_positions[1:]) + branch
+
+
 def format_tree_title(title: str, depth: int, is_last: bool, ancestor_positions: list[bool], subtask_count: int) -> str:
     """Format a task title with tree indentation and characters.
 
@@ -217,34 +250,7 @@ def format_tree_title(title: str, depth: int, is_last: bool, ancestor_positions:
     Returns:
         Formatted title with tree characters
     """
-    if depth == 0:
-        # Top-level task
-        if subtask_count > 0:
-            return f"{title} 📋 {subtask_count}"
-        return title
-
-    # For direct children (depth 1), only show branch without ancestor lines
-    if depth == 1:
-        branch = "└─ " if is_last else "├─ "
-        if subtask_count > 0:
-            return f"{branch}{title} 📋 {subtask_count}"
-        return f"{branch}{title}"
-
-    # For deeper nesting, add ancestor lines
-    prefix = ""
-
-    # Skip the first ancestor (parent is top-level)
-    for is_ancestor_last in ancestor_positions[1:]:
-        if is_ancestor_last:
-            prefix += "   "  # No vertical line if ancestor was last
-        else:
-            prefix += "│  "  # Vertical line continuation
-
-    # Add branch character for this level
-    if is_last:
-        prefix += "└─ "  # Last child
-    else:
-        prefix += "├─ "  # Middle child
+    prefix = _tree_prefix(depth, is_last, tuple(ancestor_positions) if depth > 1 else ())
 
     # Add subtask count if this task has children
     if subtask_count > 0:
@@ -306,6 +312,16 @@ def display_tasks_table(
     table_title = title or f"Tasks ({len(display_tasks)} found)"
     table = Table(title=table_title, show_lines=True)
 
+    # Read the display ID cache once (after it was saved above) instead of once per row
+    display_ids = {} if id_offset > 0 else load_uuid_to_display_id()
+
+    # Count direct children per parent once instead of scanning all tasks per row
+    subtask_counts = Counter(t.parent for t in tasks if t.parent) if tree_view else Counter()
+
+    # Countdowns share one "now"; tasks often share due dates, so each (due, status) is formatted once
+    now = datetime.now()
+    countdown_markup: dict[tuple[datetime, str], str] = {}
+
     table.add_column("ID", style="cyan", no_wrap=True)
     table.add_column("🔗", justify="center", no_wrap=True)
     table.add_column("Title", style="white")
@@ -322,16 +338,7 @@ def display_tasks_table(
     else:
         table.add_column("Countdown", no_wrap=True)
 
-    for idx, (task, depth, is_last, ancestors) in enumerate(
-        zip(
-            display_tasks,
-            [item[1] for item in tree_items],
-            [item[2] for item in tree_items],
-            [item[3] for item in tree_items],
-            strict=False,
-        ),
-        start=1,
-    ):
+    for idx, (task, depth, is_last, ancestors) in enumerate(tree_items, start=1):
         # Get display ID
         if id_offset > 0:
             # Use offset-based sequential IDs (for completed tasks shown after active tasks)
@@ -339,7 +346,7 @@ def display_tasks_table(
         else:
             # Get display ID from cache (for both filtered and unfiltered views)
             # This ensures consistency: tsk add and tsk list show the same IDs
-            display_id = get_display_id_from_uuid(task.id)
+            display_id = display_ids.get(task.id)
             if display_id is None:
                 # Task not in cache (e.g., newly added), show first 8 chars of UUID
                 display_id_str = f"{task.id[:8]}..."
@@ -348,18 +355,14 @@ def display_tasks_table(
 
         # Format title with tree structure
         if tree_view:
-            subtask_count = count_subtasks(task, tasks)
+            subtask_count = subtask_counts[task.id]
             formatted_title = format_tree_title(task.title, depth, is_last, ancestors, subtask_count)
         else:
             formatted_title = task.title
 
-        # Format priority with color
-        priority_color = PRIORITY_COLORS.get(task.priority, "white")
-        priority_str = f"[{priority_color}]{task.priority}[/{priority_color}]"
-
-        # Format status with color
-        status_color = STATUS_COLORS.get(task.status, "white")
-        status_str = f"[{status_color}]{task.status}[/{status_color}]"
+        # Format priority and status with color
+        priority_str = _PRIORITY_MARKUP.get(task.priority) or f"[white]{task.priority}[/white]"
+        status_str = _STATUS_MARKUP.get(task.status) or f"[white]{task.status}[/white]"
 
         # Format assignees
         assignees_str = ", ".join(task.assignees) if task.assignees else "-"
@@ -380,8 +383,11 @@ def display_tasks_table(
         else:
             # Show countdown (existing logic)
             if task.due:
-                countdown_text, countdown_color = get_countdown_text(task.due, task.status)
-                countdown_str = f"[{countdown_color}]{countdown_text}[/{countdown_color}]"
+                countdown_str = countdown_markup.get((task.due, task.status))
+                if countdown_str is None:
+                    countdown_text, countdown_color = get_countdown_text(task.due, task.status, now)
+                    countdown_str = f"[{countdown_color}]{countdown_text}[/{countdown_color}]"
+                    countdown_markup[(task.due, task.status)] = countdown_str
             else:
                 countdown_str = "-"
 
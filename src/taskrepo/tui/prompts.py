@@ -158,7 +158,7 @@ def prompt_repository(repositories: list[Repository], default: Optional[str] = N
     # Display numbered list of repositories
     print("\nAvailable repositories:")
     for idx, repo in enumerate(repositories, start=1):
-        task_count = len(repo.list_tasks())
+        task_count = repo.task_count()
         marker = " (default)" if default and repo.name == default else ""
         print(f"  {idx}. {repo.name} ({task_count} tasks){marker}")
     print()
@@ -801,14 +801,15 @@ def prompt_parent_task(existing_tasks: list) -> Optional[str]:
         return None
 
     # Build completion list with display IDs and titles for easier selection
-    from taskrepo.utils.id_mapping import get_display_id_from_uuid
+    from taskrepo.utils.id_mapping import load_uuid_to_display_id
 
+    display_ids = load_uuid_to_display_id()
     task_options = []
     task_map = {}
 
     for task in existing_tasks:
         # Try to get display ID for this task
-        display_id = get_display_id_from_uuid(task.id)
+        display_id = display_ids.get(task.id)
 
         if display_id:
             # Format: "DisplayID: Title"
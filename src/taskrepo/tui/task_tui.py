@@ -1,10 +1,11 @@
 """Full-screen TUI for TaskRepo using prompt_toolkit."""
 
 import asyncio
-import html
 import os
-from pathlib import Path
-from typing import Optional
+from collections import Counter, OrderedDict
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable, NamedTuple, Optional
 
 from prompt_toolkit.application import Application
 from prompt_toolkit.filters import Condition
@@ -26,15 +27,301 @@ from taskrepo.core.repository import Repository, RepositoryManager
 from taskrepo.core.task import Task
 from taskrepo.tui.display import (
     build_task_tree,
-    count_subtasks,
     format_tree_title,
     get_countdown_text,
     pad_to_width,
     truncate_to_width,
 )
-from taskrepo.utils.id_mapping import get_display_id_from_uuid, save_id_cache
+from taskrepo.utils.display_constants import PRIORITY_COLORS, STATUS_COLORS
+from taskrepo.utils.id_mapping import load_uuid_to_display_id, save_id_cache
 from taskrepo.utils.sorting import sort_tasks
 
+# Optional: react to file changes as they happen instead of polling.
+try:
+    from watchfiles import awatch
+except ImportError:  # watchfiles not installed
+    awatch = None  # type: ignore[assignment]
+
+
+# Fixed texts, parsed once instead of on every render
+_NO_REPOSITORIES_TEXT = HTML("<b>No repositories found</b>")
+_NO_TASK_SELECTED_TEXT = HTML("<dim>No task selected</dim>")
+_NO_TASKS_TEXT = HTML("<yellow>No tasks found. Press 'n' to create one.</yellow>")
+
+
+# Auto-reload polling bounds (seconds) when watchfiles is unavailable
+_POLL_MIN_INTERVAL = 0.5
+_POLL_MAX_INTERVAL = 10.0
+
+# Pause in typing after which the filter is applied live, in seconds
+_FILTER_DEBOUNCE = 0.3
+
+
+def _poll_interval(idle_count: int) -> float:
+    """Get the delay before the next change poll after idle_count quiet polls."""
+    return min(_POLL_MAX_INTERVAL, _POLL_MIN_INTERVAL * 2 ** min(idle_count, 16))
+
+
+class _ColumnWidths(NamedTuple):
+    """Task list column widths for one frame."""
+
+    id: int
+    title: int
+    repo: int
+    project: int
+    status: int
+    priority: int
+    assignees: int
+    tags: int
+    due: int
+    countdown: int
+
+
+@lru_cache(maxsize=32)
+def _column_widths(terminal_width: int, hidden: tuple[bool, bool, bool]) -> _ColumnWidths:
+    """Compute the task list column widths for a terminal width.
+
+    Args:
+        terminal_width: Terminal width in columns
+        hidden: Whether the repo, project and assignee columns are hidden
+
+    Returns:
+        Column widths, with hidden columns at 0 and their space given to the title
+    """
+    hide_repo, hide_project, hide_assignee = hidden
+
+    # Define minimum and preferred widths for each column
+    # Fixed width columns (don't expand)
+    max_id_width = 4  # Accommodate 3-digit zero-padded IDs (001-999)
+    max_status_width = 7
+    max_priority_width = 3
+    max_due_width = 10
+    max_countdown_width = 9
+
+    # Calculate space used by fixed columns and separators
+    fixed_width = max_id_width + max_status_width + max_priority_width + max_due_width + max_countdown_width
+
+    # Calculate number of separators dynamically based on visible columns
+    # Each visible column has 1 space separator, except:
+    # - ID column has its marker (no additional space)
+    # - Due/Count has 4 spaces between them (3 extra + 1 normal)
+    num_visible_cols = 5  # ID, Title, Status, Priority, Tags (always visible)
+    if not hide_repo:
+        num_visible_cols += 1  # Repo
+    if not hide_project:
+        num_visible_cols += 1  # Project
+    if not hide_assignee:
+        num_visible_cols += 1  # Assignee
+    num_visible_cols += 2  # Due and Count
+
+    # Each column gets 1 separator space, except ID (no space before) and Count (no space after)
+    # Plus 3 extra spaces between Due and Count
+    separators = num_visible_cols - 1 + 3
+
+    # Calculate remaining space for flexible columns
+    remaining_width = terminal_width - fixed_width - separators - 2  # -2 for margins
+
+    # Distribute remaining space among flexible columns
+    # Priority: Title > Repo/Project/Assignees/Tags (equal distribution)
+    if remaining_width < 60:
+        # Narrow terminal: use minimum widths
+        max_title_width = 20
+        max_repo_width = 8
+        max_project_width = 8
+        max_assignees_width = 8
+        max_tags_width = 6
+    else:
+        # Wide terminal: distribute space
+        # Title gets 40% of remaining space, others share the rest
+        max_title_width = max(25, int(remaining_width * 0.4))
+        other_space = remaining_width - max_title_width
+        each_other = max(8, other_space // 4)
+        max_repo_width = each_other
+        max_project_width = each_other
+        max_assignees_width = each_other
+        max_tags_width = each_other
+
+    # Adjust widths for hidden columns - give space to title
+    freed_space = 0
+    if hide_repo:
+        freed_space += max_repo_width + 1  # +1 for separator
+        max_repo_width = 0
+    if hide_project:
+        freed_space += max_project_width + 1  # +1 for separator
+        max_project_width = 0
+    if hide_assignee:
+        freed_space += max_assignees_width + 1  # +1 for separator
+        max_assignees_width = 0
+
+    # Add freed space to title column
+    max_title_width += freed_space
+
+    return _ColumnWidths(
+        max_id_width,
+        max_title_width,
+        max_repo_width,
+        max_project_width,
+        max_status_width,
+        max_priority_width,
+        max_assignees_width,
+        max_tags_width,
+        max_due_width,
+        max_countdown_width,
+    )
+
+
+@lru_cache(maxsize=32)
+def _task_list_header(widths: _ColumnWidths, hidden: tuple[bool, bool, bool]) -> str:
+    """Build the task list header line with abbreviated column names.
+
+    Args:
+        widths: Column widths
+        hidden: Whether the repo, project and assignee columns are hidden
+
+    Returns:
+        Header text without trailing newline
+    """
+    hide_repo, hide_project, hide_assignee = hidden
+    header_parts = ["ID".ljust(widths.id), " ", "Title".ljust(widths.title), " "]
+    if not hide_repo:
+        header_parts += ["Repo".ljust(widths.repo), " "]
+    if not hide_project:
+        header_parts += ["Proj".ljust(widths.project), " "]  # Project -> Proj
+    header_parts += ["Status".ljust(widths.status), " ", "P".ljust(widths.priority), " "]  # Pri -> P
+    if not hide_assignee:
+        header_parts += ["Assign".ljust(widths.assignees), " "]  # Assigned -> Assign
+    header_parts += ["Tags".ljust(widths.tags), " "]
+    header_parts += ["Due".ljust(widths.due), "    "]  # Extra spacing before Countdown
+    header_parts.append("Count".ljust(widths.countdown))  # Countdown -> Count
+    return "".join(header_parts)
+
+
+@lru_cache(maxsize=32)
+def _task_list_header_lines(widths: _ColumnWidths, hidden: tuple[bool, bool, bool]) -> tuple[str, str, int]:
+    """Get the task list header and divider lines, each with its newline, and the table width."""
+    header = _task_list_header(widths, hidden)
+    return header + "\n", "─" * len(header) + "\n", len(header)
+
+
+# Display-width helpers walk the string per codepoint; rows repeat the same
+# titles at the same widths on every frame, so memoize them.
+_truncate_to_width = lru_cache(maxsize=4096)(truncate_to_width)
+_pad_to_width = lru_cache(maxsize=4096)(pad_to_width)
+
+
+@lru_cache(maxsize=1024)
+def _format_date(value: Optional[datetime], fmt: str) -> str:
+    """Format an optional datetime for display, or "-" when unset.
+
+    Results are cached because the same dates are redrawn on every frame.
+    """
+    return value.strftime(fmt) if value else "-"
+
+
+# Abbreviated status labels and style classes for task list cells
+_STATUS_ABBREVIATIONS = {"pending": "pending", "in-progress": "progres", "completed": "done", "cancelled": "cancel"}
+_STATUS_STYLES = {
+    "pending": "class:status-pending",
+    "in-progress": "class:status-in-progress",
+    "completed": "class:status-completed",
+    "cancelled": "class:status-cancelled",
+}
+_PRIORITY_STYLES = {"H": "class:priority-high", "M": "class:priority-medium", "L": "class:priority-low"}
+# Header labels per view mode: (item label, "All" tab name)
+_VIEW_LABELS = {
+    "repo": ("Repository", "All Repositories"),
+    "project": ("Project", "All Projects"),
+    "assignee": ("Assignee", "All Assignees"),
+}
+_COUNTDOWN_STYLES = {
+    "red": "class:countdown-overdue",
+    "yellow": "class:countdown-urgent",
+    "green": "class:countdown-normal",
+}
+
+
+@lru_cache(maxsize=64)
+def _status_cell(status: str, width: int) -> tuple[str, str]:
+    """Get the (style, padded text) task list cell for a status."""
+    label = _STATUS_ABBREVIATIONS.get(status, status)[:width]
+    return _STATUS_STYLES.get(status, ""), label.ljust(width) + " "
+
+
+@lru_cache(maxsize=64)
+def _priority_cell(priority: str, width: int) -> tuple[str, str]:
+    """Get the (style, padded text) task list cell for a priority."""
+    return _PRIORITY_STYLES.get(priority, ""), priority.ljust(width) + " "
+
+
+@lru_cache(maxsize=1024)
+def _countdown_cell(due: Optional[datetime], status: str, minute: datetime, width: int) -> tuple[str, str]:
+    """Get the (style, padded text) task list countdown cell for a due date.
+
+    Countdowns are computed against the current minute, so one result serves
+    every row sharing a due date and every frame drawn within that minute.
+    """
+    if not due:
+        return "", "-".ljust(width)
+    text, color = get_countdown_text(due, status, minute)
+    return _COUNTDOWN_STYLES.get(color, ""), text[:width].ljust(width)
+
+
+@lru_cache(maxsize=128)
+def _scroll_indicator(above: bool, count: int, width: int) -> str:
+    """Get a centered "more above/below" scroll indicator line, including its newline."""
+    message = f"▲ {count} more above" if above else f"▼ {count} more below"
+    return f"{message:^{width}}\n"
+
+
+def _format_display_id(task_id: str, display_id: Optional[int]) -> str:
+    """Format a task's display ID, zero-padded to 3 digits, or a short UUID prefix if it has none."""
+    return f"{display_id:03d}" if display_id else f"{task_id[:8]}..."
+
+
+def _detail_panel_height(terminal_height: int) -> int:
+    """Get the detail panel content height for a terminal height."""
+    # Use about 30% of terminal height for detail panel, but with min/max bounds
+    return max(8, min(15, int(terminal_height * 0.3)))
+
+
+@lru_cache(maxsize=32)
+def _layout_dims(terminal_height: int, status_bar_height: int) -> tuple[int, int, int]:
+    """Compute the TUI's vertical layout for a terminal and status bar height.
+
+    Args:
+        terminal_height: Terminal height in lines
+        status_bar_height: Status bar height in lines
+
+    Returns:
+        Tuple of (viewport_size, scroll_trigger, detail_panel_height)
+    """
+    detail_panel_height = _detail_panel_height(terminal_height)
+
+    # Calculate available space for task rows
+    # Fixed UI elements:
+    # - Header: 1 line
+    # - Task list header + separator: 2 lines
+    # - Detail panel content: dynamic (see _detail_panel_height)
+    # - Detail panel Frame borders: 2 lines (top + bottom)
+    # - Filter input: 1 line (when visible)
+    # - Status bar: dynamic (see TaskTUI._calculate_status_bar_height)
+    # - Scroll indicators: 2 lines (max)
+    fixed_lines = 1 + 2 + detail_panel_height + 2 + 1 + status_bar_height + 2  # All fixed elements
+
+    # Keep at least 6 rows, and cap the viewport for very tall terminals
+    viewport_size = min(50, max(6, terminal_height - fixed_lines))
+
+    # Start scrolling at 1/3 of the viewport
+    scroll_trigger = min(5, max(2, viewport_size // 3))
+
+    return viewport_size, scroll_trigger, detail_panel_height
+
+
+def _is_task_file_change(_change, path: str) -> bool:
+    """Accept only task-*.md paths in the file watcher."""
+    name = os.path.basename(path)
+    return name.startswith("task-") and name.endswith(".md")
+
 
 class TaskTUI:
     """Full-screen TUI for managing tasks."""
@@ -50,6 +337,24 @@ class TaskTUI:
         self.repositories = repositories
         self.view_mode = config.tui_view_mode  # "repo", "project", or "assignee"
 
+        # Task caches, cleared by _invalidate_task_caches() on reload
+        self._all_tasks_cache: Optional[list[Task]] = None  # every task across repositories
+        self._filtered_tasks_cache: Optional[tuple[tuple, tuple[list[Task], list]]] = None  # (key, (tasks, rows))
+        self._search_blobs: dict[str, tuple[Task, str]] = {}  # task ID -> (task, lowercased blob)
+        self._last_text_filter: Optional[tuple[tuple, str, list[Task]]] = None  # (view scope, query, matches)
+        self._display_ids: Optional[dict[str, int]] = None  # task UUID -> display ID
+        self._repo_by_name: Optional[dict[str, Repository]] = None  # repository name -> repository
+        self._subtask_counts: Optional[Counter[tuple[str, str]]] = None  # (repo, parent ID) -> direct children
+        self._all_view_rows: dict[bool, list] = {}  # tree_view -> sorted rows of the unfiltered "All" view
+        # Row inputs -> (task, fragments). Kept across reloads: unchanged task files load as the same Task
+        # objects, so only rows for edited tasks miss. Holding the task keeps its id() from being reused.
+        self._row_cache: OrderedDict[tuple, tuple[Task, list[tuple[str, str]]]] = OrderedDict()
+        self._row_cache_layout: Optional[tuple[_ColumnWidths, tuple[bool, bool, bool]]] = None  # layout of cached rows
+        self._task_positions: Optional[tuple[list[Task], dict[str, int]]] = None  # (view tasks, task ID -> row)
+        self._list_texts: dict[str, tuple[str, str]] = {}  # task ID -> (assignees, tags) display text
+        self._detail_cache: Optional[tuple[Task, Optional[int], FormattedText]] = None  # (task, display ID, text)
+        self._list_text_cache: Optional[tuple[list, tuple, FormattedText]] = None  # (rows, frame inputs, text)
+
         # Build view items based on mode
         self.view_items = self._build_view_items()
 
@@ -76,11 +381,14 @@ class TaskTUI:
         self.show_detail_panel = True  # Always show detail panel
 
         # Auto-reload state
-        self.last_mtime = self._get_repositories_mtime()
+        self._repo_mtimes = {repo.name: self._repository_mtime(repo) for repo in repositories}
+        self.last_mtime = max(self._repo_mtimes.values(), default=0.0)
         self.auto_reload_task: Optional[asyncio.Task] = None
+        self.countdown_tick_task: Optional[asyncio.Task] = None
+        self._countdown_visible = False  # whether the last painted rows include a due date
         self.last_reload_time: Optional[float] = None  # timestamp of last reload
 
-        # Background sync state (must be initialized before _calculate_viewport_size)
+        # Background sync state (must be initialized before _update_viewport_dims)
         self.sync_status = "idle"  # "idle", "syncing", "success", "error"
         self.last_sync_time: Optional[float] = None  # timestamp of last sync
         self.next_sync_time: Optional[float] = None  # timestamp of next scheduled sync
@@ -89,10 +397,16 @@ class TaskTUI:
         self.sync_message: Optional[str] = None  # temporary status bar message
         self.has_unsaved_changes: bool = False  # tracks local modifications since last sync
 
+        # Terminal size cached for the current frame (see _get_terminal_size)
+        self._term_size: Optional[tuple[int, int]] = None
+        # Status line for the current frame (see _build_status_info)
+        self._status_info: Optional[tuple[tuple[str, str], ...]] = None
+        # Last status bar markup and its parsed form
+        self._status_bar_cache: Optional[tuple[tuple, FormattedText]] = None
+
         # Viewport scrolling state (depends on sync state for height calculation)
         self.viewport_top = 0  # First task visible in viewport
-        self.viewport_size = self._calculate_viewport_size()  # Dynamic based on terminal size
-        self.scroll_trigger = min(5, max(2, self.viewport_size // 3))  # Start scrolling at 1/3 of viewport
+        self._update_viewport_dims()  # Sets viewport_size and scroll_trigger from the terminal size
         self.sync_message_time: Optional[float] = None  # when message was set
 
         # Create filter input widget
@@ -102,6 +416,9 @@ class TaskTUI:
             multiline=False,
             wrap_lines=False,
         )
+        # Filter live while typing, once the user pauses
+        self._filter_debounce_task: Optional[asyncio.Task] = None
+        self.filter_input.buffer.on_text_changed += self._on_filter_input_changed
 
         # Build key bindings
         self.kb = self._create_key_bindings()
@@ -119,6 +436,7 @@ class TaskTUI:
             style=self.style,
             full_screen=True,
             mouse_support=True,
+            before_render=self._on_before_render,
         )
 
     def _build_view_items(self) -> list[str]:
@@ -132,54 +450,117 @@ class TaskTUI:
             return [repo.name for repo in self.repositories]
         elif self.view_mode == "project":
             # Collect all unique projects from all repos
-            projects = set()
-            for repo in self.repositories:
-                for task in repo.list_tasks():
-                    if task.project:
-                        projects.add(task.project)
-            return sorted(projects)
+            return sorted({task.project for task in self._get_all_tasks() if task.project})
         elif self.view_mode == "assignee":
             # Collect all unique assignees from all repos
-            assignees = set()
-            for repo in self.repositories:
-                for task in repo.list_tasks():
-                    assignees.update(task.assignees)
-            return sorted(assignees)
+            return sorted({assignee for task in self._get_all_tasks() for assignee in task.assignees})
         else:
             # Fallback to repo mode
             return [repo.name for repo in self.repositories]
 
+    @staticmethod
+    def _repository_mtime(repo: Repository) -> float:
+        """Get the latest modification time of a repository's task directory.
+
+        The directory mtime catches added, removed and renamed task files; the
+        task files themselves are checked in a single scandir pass so in-place
+        edits are detected too.
+
+        Returns:
+            Latest modification time as a float timestamp, or 0.0 if unreadable
+        """
+        max_mtime = 0.0
+        try:
+            # Check the directory itself
+            max_mtime = os.stat(repo.tasks_dir).st_mtime
+
+            # Check all task files
+            with os.scandir(repo.tasks_dir) as entries:
+                for entry in entries:
+                    if entry.name.startswith("task-") and entry.name.endswith(".md"):
+                        max_mtime = max(max_mtime, entry.stat().st_mtime)
+        except OSError:
+            # Skip if we can't access the directory or a file
+            pass
+        return max_mtime
+
     def _get_repositories_mtime(self) -> float:
         """Get the latest modification time across all repository task directories.
 
         Returns:
             Latest modification time as a float timestamp, or 0.0 if no repos
         """
-        max_mtime = 0.0
-        for repo in self.repositories:
-            tasks_dir = Path(repo.path) / "tasks"
-            if tasks_dir.exists():
-                try:
-                    # Check the directory itself
-                    dir_mtime = tasks_dir.stat().st_mtime
-                    max_mtime = max(max_mtime, dir_mtime)
-
-                    # Check all task files
-                    for task_file in tasks_dir.glob("task-*.md"):
-                        file_mtime = task_file.stat().st_mtime
-                        max_mtime = max(max_mtime, file_mtime)
-                except (OSError, PermissionError):
-                    # Skip if we can't access the file
-                    pass
-        return max_mtime
+        return max((self._repository_mtime(repo) for repo in self.repositories), default=0.0)
+
+    def _discover_repositories(self, reuse_unchanged: bool = False) -> tuple[list[Repository], dict[str, float]]:
+        """Rediscover repositories from disk.
+
+        Args:
+            reuse_unchanged: Keep the existing Repository object, with its already
+                loaded tasks, for each repository whose task files have not changed
+                since the previous load
+
+        Returns:
+            Tuple of (repositories, repository name -> task directory mtime)
+        """
+        previous = {repo.name: repo for repo in self.repositories} if reuse_unchanged else {}
+
+        repositories = []
+        repo_mtimes = {}
+        for repo in RepositoryManager(self.config.parent_dir).discover_repositories():
+            mtime = self._repository_mtime(repo)
+            old_repo = previous.get(repo.name)
+            if old_repo is not None and old_repo.path == repo.path and self._repo_mtimes.get(repo.name) == mtime:
+                repo = old_repo
+            repositories.append(repo)
+            repo_mtimes[repo.name] = mtime
+        return repositories, repo_mtimes
+
+    def _load_changed_repositories(self) -> tuple[list[Repository], dict[str, float]]:
+        """Discover repositories and parse the tasks of the changed ones.
+
+        Safe to run on a worker thread: only new Repository objects are loaded,
+        so the UI keeps rendering from the current ones until the result is
+        applied with _reload_repositories().
+
+        Returns:
+            Tuple of (repositories, repository name -> task directory mtime)
+        """
+        current = {id(repo) for repo in self.repositories}
+        repositories, repo_mtimes = self._discover_repositories(reuse_unchanged=True)
+        for repo in repositories:
+            if id(repo) not in current:
+                repo.list_tasks()
+        return repositories, repo_mtimes
+
+    def _reload_repositories(
+        self,
+        reuse_unchanged: bool = False,
+        discovered: Optional[tuple[list[Repository], dict[str, float]]] = None,
+    ):
+        """Rediscover repositories from disk and reset the task caches.
 
-    def _check_for_changes(self) -> bool:
+        Args:
+            reuse_unchanged: Keep the existing Repository object, with its already
+                loaded tasks, for each repository whose task files have not changed
+                since the previous load
+            discovered: Result of an earlier _discover_repositories() or
+                _load_changed_repositories() call to apply instead of discovering again
+        """
+        if discovered is None:
+            discovered = self._discover_repositories(reuse_unchanged)
+        self.repositories, self._repo_mtimes = discovered
+        self._invalidate_task_caches()
+
+    async def _check_for_changes(self) -> bool:
         """Check if any task files have been modified since last check.
 
+        The directories are scanned on a worker thread to keep the UI responsive.
+
         Returns:
             True if changes detected, False otherwise
         """
-        current_mtime = self._get_repositories_mtime()
+        current_mtime = await asyncio.to_thread(self._get_repositories_mtime)
         if current_mtime > self.last_mtime:
             self.last_mtime = current_mtime
             return True
@@ -212,16 +593,13 @@ class TaskTUI:
         self.last_mtime = self._get_repositories_mtime()
 
         # Reload repositories from disk
-        manager = RepositoryManager(self.config.parent_dir)
-        self.repositories = manager.discover_repositories()
+        self._reload_repositories()
 
         # Rebuild view items
         self.view_items = self._build_view_items()
 
         # Update ID cache with all current tasks
-        all_tasks = manager.list_all_tasks(include_archived=False)
-        sorted_tasks = sort_tasks(all_tasks, self.config, all_tasks=all_tasks)
-        save_id_cache(sorted_tasks)
+        self._save_id_cache()
 
         # Clear multi-selection since task IDs may have changed
         self.multi_selected.clear()
@@ -236,14 +614,10 @@ class TaskTUI:
                 self.selected_row = max(0, len(tasks) - 1)
         elif preserve_selection and current_task_uuid:
             # Try to find the same task by UUID
-            found = False
-            for i, task in enumerate(tasks):
-                if task.id == current_task_uuid:
-                    self.selected_row = i
-                    found = True
-                    break
-
-            if not found:
+            position = self._get_task_positions().get(current_task_uuid)
+            if position is not None:
+                self.selected_row = position
+            else:
                 # Task not found (was removed or filtered out), stay at same position
                 if current_position >= len(tasks):
                     self.selected_row = max(0, len(tasks) - 1)
@@ -258,6 +632,72 @@ class TaskTUI:
         if hasattr(self, "app") and self.app:
             self.app.invalidate()
 
+    def _set_selected_status(self, status: str):
+        """Set the status of the selected task(s).
+
+        Args:
+            status: New status; completed and cancelled tasks move the selection up
+        """
+
+        def update(task: Task):
+            task.status = status
+
+        self._update_selected_tasks(update, select_above=status in ("completed", "cancelled"))
+
+    def _toggle_selected_in_progress(self):
+        """Toggle the selected task(s) between in-progress and pending."""
+
+        def update(task: Task):
+            task.status = "pending" if task.status == "in-progress" else "in-progress"
+
+        self._update_selected_tasks(update)
+
+    def _set_selected_priority(self, priority: str):
+        """Set the priority of the selected task(s).
+
+        Args:
+            priority: New priority (H, M or L)
+        """
+
+        def update(task: Task):
+            task.priority = priority
+
+        self._update_selected_tasks(update)
+
+    def _update_selected_tasks(self, update: Callable[[Task], None], select_above: bool = False):
+        """Modify and save the selected task(s), then refresh the view in place.
+
+        Args:
+            update: Function that modifies a task in place
+            select_above: Move the selection one row up, for changes that remove tasks from the view
+        """
+        selected_tasks = self._get_selected_tasks()
+        if not selected_tasks:
+            return
+
+        repos = {repo.name: repo for repo in self.repositories}
+        now = datetime.now()
+        changed = set()
+        for task in selected_tasks:
+            repo = repos.get(task.repo)
+            if repo is None:
+                continue
+            update(task)
+            task.modified = now
+            repo.save_task(task)
+            changed.add(id(task))
+
+        # The tasks were modified in place, so rows cached for these objects are stale
+        for key in [key for key, (task, _) in self._row_cache.items() if id(task) in changed]:
+            del self._row_cache[key]
+
+        # Local changes are not synced yet
+        self.sync_status = "idle"
+        self.has_unsaved_changes = True
+        self.sync_message = None
+
+        self._force_reload(select_above=select_above)
+
     def _check_background_sync_status(self):
         """Check global background sync status from CLI and update TUI status."""
         # Import the global flags from tui command module
@@ -292,41 +732,112 @@ class TaskTUI:
             pass
 
     async def _auto_reload_loop(self):
-        """Background task that periodically checks for file changes and reloads."""
-        import time
+        """Background task that reloads tasks when files change on disk.
+
+        Waits on filesystem events when watchfiles is installed, otherwise
+        polls modification times every 2 seconds.
+        """
+        if awatch is None:
+            await self._poll_for_changes()
+        else:
+            await self._watch_for_changes()
 
+    async def _countdown_tick_loop(self):
+        """Redraw at each minute boundary, only while a visible row shows a countdown.
+
+        Nothing else repaints an idle TUI, so without this countdowns would go
+        stale until the next key press or file change.
+        """
+        while True:
+            now = datetime.now()
+            await asyncio.sleep(60 - now.second - now.microsecond / 1_000_000)
+            if self._countdown_visible:
+                self.app.invalidate()
+
+    async def _poll_for_changes(self):
+        """Reload loop driven by mtime checks with adaptive backoff.
+
+        Polls quickly after a change (or while a sync is running) and backs off
+        exponentially up to _POLL_MAX_INTERVAL while nothing happens.
+        """
+        idle_count = 0
         while True:
-            await asyncio.sleep(2)  # Check every 2 seconds
+            await asyncio.sleep(_poll_interval(idle_count))
 
             # Check global background sync status from CLI
             self._check_background_sync_status()
 
-            if self._check_for_changes():
-                # Track reload time
-                self.last_reload_time = time.time()
+            if await self._check_for_changes():
+                await self._reload_from_disk_async()
+                idle_count = 0
+            elif self.sync_status == "syncing":
+                idle_count = 0
+            else:
+                idle_count += 1
 
-                # Reload repositories from disk
-                manager = RepositoryManager(self.config.parent_dir)
-                self.repositories = manager.discover_repositories()
+    async def _watch_for_changes(self):
+        """Reload loop driven by watchfiles events on the task directories."""
+        while True:
+            watched = [str(repo.tasks_dir) for repo in self.repositories if repo.tasks_dir.is_dir()]
+            if not watched:
+                await self._poll_for_changes()
+                return
+
+            # Wake up every 2 seconds even without changes to refresh the sync status
+            async for changes in awatch(
+                *watched,
+                watch_filter=_is_task_file_change,
+                debounce=500,
+                rust_timeout=2000,
+                yield_on_timeout=True,
+            ):
+                # Check global background sync status from CLI
+                self._check_background_sync_status()
+
+                if changes:
+                    self.last_mtime = await asyncio.to_thread(self._get_repositories_mtime)
+                    await self._reload_from_disk_async()
+
+                    # Restart the watcher if the set of repositories changed
+                    if [str(repo.tasks_dir) for repo in self.repositories] != watched:
+                        break
+
+    async def _reload_from_disk_async(self):
+        """Reload after an external change, scanning and parsing task files on a worker thread."""
+        discovered = await asyncio.to_thread(self._load_changed_repositories)
+        self._reload_from_disk(discovered)
+
+    def _reload_from_disk(self, discovered: Optional[tuple[list[Repository], dict[str, float]]] = None):
+        """Reload repositories and tasks after an external change.
 
-                # Rebuild view items
-                self.view_items = self._build_view_items()
+        Args:
+            discovered: Repositories already loaded by _load_changed_repositories(),
+                or None to discover them now
+        """
+        import time
 
-                # Update ID cache with all current tasks
-                all_tasks = manager.list_all_tasks(include_archived=False)
-                sorted_tasks = sort_tasks(all_tasks, self.config, all_tasks=all_tasks)
-                save_id_cache(sorted_tasks)
+        # Track reload time
+        self.last_reload_time = time.time()
 
-                # Clear multi-selection since task IDs may have changed
-                self.multi_selected.clear()
+        # Reload repositories from disk, keeping the ones whose task files didn't change
+        self._reload_repositories(reuse_unchanged=True, discovered=discovered)
 
-                # Reset selected row if out of bounds
-                tasks = self._get_filtered_tasks()
-                if self.selected_row >= len(tasks):
-                    self.selected_row = max(0, len(tasks) - 1)
+        # Rebuild view items
+        self.view_items = self._build_view_items()
 
-                # Invalidate the display to trigger a redraw
-                self.app.invalidate()
+        # Update ID cache with all current tasks
+        self._save_id_cache()
+
+        # Clear multi-selection since task IDs may have changed
+        self.multi_selected.clear()
+
+        # Reset selected row if out of bounds
+        tasks = self._get_filtered_tasks()
+        if self.selected_row >= len(tasks):
+            self.selected_row = max(0, len(tasks) - 1)
+
+        # Invalidate the display to trigger a redraw
+        self.app.invalidate()
 
     async def _background_sync_loop(self):
         """Background task that periodically syncs repositories."""
@@ -403,16 +914,14 @@ class TaskTUI:
                 if success_count > 0:
                     self._set_sync_message(f"✓ Synced {success_count} repo(s)")
 
-            # Reload repositories after sync
+            # Reload repositories after sync, parsing pulled task files on a worker thread
             if success_count > 0:
-                manager = RepositoryManager(self.config.parent_dir)
-                self.repositories = manager.discover_repositories()
+                discovered = await asyncio.to_thread(self._load_changed_repositories)
+                self._reload_repositories(reuse_unchanged=True, discovered=discovered)
                 self.view_items = self._build_view_items()
 
                 # Update ID cache
-                all_tasks = manager.list_all_tasks(include_archived=False)
-                sorted_tasks = sort_tasks(all_tasks, self.config, all_tasks=all_tasks)
-                save_id_cache(sorted_tasks)
+                self._save_id_cache()
 
             self.app.invalidate()
 
@@ -471,53 +980,49 @@ class TaskTUI:
             return ""
 
     def _get_terminal_size(self):
-        """Get current terminal size."""
-        try:
-            terminal_size = os.get_terminal_size()
-            return terminal_size.lines, terminal_size.columns
-        except (OSError, AttributeError):
-            # Fallback if terminal size cannot be determined
-            return 40, 120
-
-    def _calculate_viewport_size(self) -> int:
-        """Calculate viewport size based on terminal height."""
-        terminal_height, _ = self._get_terminal_size()
-
-        # Calculate available space for task rows
-        # Fixed UI elements:
-        # - Header: 1 line
-        # - Task list header + separator: 2 lines
-        # - Detail panel content: dynamic (see _calculate_detail_panel_height)
-        # - Detail panel Frame borders: 2 lines (top + bottom)
-        # - Filter input: 1 line (when visible)
-        # - Status bar: dynamic (see _calculate_status_bar_height)
-        # - Scroll indicators: 2 lines (max)
+        """Get current terminal size.
 
-        detail_panel_height = self._calculate_detail_panel_height()
-        status_bar_height = self._calculate_status_bar_height()
-        fixed_lines = 1 + 2 + detail_panel_height + 2 + 1 + status_bar_height + 2  # All fixed elements
-        # = header + task header/sep + detail content + frame borders + filter + status + scrollers
-        # = detail_panel_height + status_bar_height + 8
-
-        available_lines = terminal_height - fixed_lines
-
-        # Ensure minimum viewport size
-        viewport_size = max(6, available_lines)
+        The size is queried once and reused until the next render starts (see
+        ``_on_before_render``), so the several layout helpers called during one
+        redraw share a single ioctl. Resizes always trigger a redraw.
+        """
+        if self._term_size is None:
+            try:
+                terminal_size = os.get_terminal_size()
+                self._term_size = (terminal_size.lines, terminal_size.columns)
+            except (OSError, AttributeError):
+                # Fallback if terminal size cannot be determined
+                self._term_size = (40, 120)
+        return self._term_size
+
+    def _on_before_render(self, _app) -> None:
+        """Drop the per-frame terminal size and status line so each frame sees current values."""
+        self._term_size = None
+        self._status_info = None
+
+    def _update_viewport_dims(self):
+        """Set viewport_size and scroll_trigger for the current terminal size."""
+        terminal_height, _ = self._get_terminal_size()
+        self.viewport_size, self.scroll_trigger, _ = _layout_dims(terminal_height, self._calculate_status_bar_height())
 
-        # Cap maximum for very tall terminals
-        viewport_size = min(50, viewport_size)
+    def _clamp_viewport(self, total: int):
+        """Keep the viewport within the task list and the selected row inside the viewport.
 
-        return viewport_size
+        Args:
+            total: Number of rows in the current task list
+        """
+        max_viewport_top = max(0, total - self.viewport_size)
+        viewport_top = min(self.viewport_top, max_viewport_top)
+        if self.selected_row < viewport_top:
+            viewport_top = self.selected_row
+        elif self.selected_row >= viewport_top + self.viewport_size:
+            viewport_top = self.selected_row - self.viewport_size + 1
+        self.viewport_top = max(0, min(viewport_top, max_viewport_top))
 
     def _calculate_detail_panel_height(self) -> int:
         """Calculate detail panel height based on terminal size."""
         terminal_height, _ = self._get_terminal_size()
-
-        # Use about 30% of terminal height for detail panel, but with min/max bounds
-        detail_height = int(terminal_height * 0.3)
-        detail_height = max(8, min(15, detail_height))
-
-        return detail_height
+        return _detail_panel_height(terminal_height)
 
     def _calculate_status_bar_height(self) -> int:
         """Calculate status bar height based on content and terminal width.
@@ -595,6 +1100,7 @@ class TaskTUI:
             if self.filter_active:
                 # Cancel filter
                 self.filter_active = False
+                self._cancel_filter_debounce()
                 self.filter_text = ""
                 self.filter_input.text = ""
             else:
@@ -730,20 +1236,21 @@ class TaskTUI:
             """Edit selected task(s)."""
             event.app.exit(result="edit")
 
+        # Status and priority changes need no prompt, so they are applied without leaving the TUI
         @kb.add("d", filter=Condition(lambda: not self.filter_active))
         def _(event):
             """Mark task(s) as completed (done)."""
-            event.app.exit(result="done")
+            self._set_selected_status("completed")
 
         @kb.add("p", filter=Condition(lambda: not self.filter_active))
         def _(event):
-            """Mark task(s) as in-progress."""
-            event.app.exit(result="in-progress")
+            """Toggle task(s) between in-progress and pending."""
+            self._toggle_selected_in_progress()
 
         @kb.add("c", filter=Condition(lambda: not self.filter_active))
         def _(event):
             """Mark task(s) as cancelled."""
-            event.app.exit(result="cancelled")
+            self._set_selected_status("cancelled")
 
         @kb.add("l", filter=Condition(lambda: not self.filter_active))
         def _(event):
@@ -774,17 +1281,17 @@ class TaskTUI:
         @kb.add("H", filter=Condition(lambda: not self.filter_active))
         def _(event):
             """Set task(s) priority to High."""
-            event.app.exit(result="priority-high")
+            self._set_selected_priority("H")
 
         @kb.add("M", filter=Condition(lambda: not self.filter_active))
         def _(event):
             """Set task(s) priority to Medium."""
-            event.app.exit(result="priority-medium")
+            self._set_selected_priority("M")
 
         @kb.add("L", filter=Condition(lambda: not self.filter_active))
         def _(event):
             """Set task(s) priority to Low."""
-            event.app.exit(result="priority-low")
+            self._set_selected_priority("L")
 
         # View operations (only when not filtering)
         @kb.add("r", filter=Condition(lambda: not self.filter_active))
@@ -810,7 +1317,8 @@ class TaskTUI:
         def _(event):
             """View task details or confirm filter."""
             if self.filter_active:
-                # Apply filter
+                # Apply filter immediately
+                self._cancel_filter_debounce()
                 self.filter_text = self.filter_input.text
                 self.filter_active = False
                 self.selected_row = 0
@@ -821,6 +1329,27 @@ class TaskTUI:
 
         return kb
 
+    def _on_filter_input_changed(self, _buffer) -> None:
+        """Schedule the typed filter to be applied once typing pauses."""
+        self._cancel_filter_debounce()
+        if self.filter_active and self.app.is_running:
+            self._filter_debounce_task = self.app.create_background_task(self._apply_filter_after_pause())
+
+    def _cancel_filter_debounce(self) -> None:
+        """Cancel a pending live filter update."""
+        if self._filter_debounce_task is not None:
+            self._filter_debounce_task.cancel()
+            self._filter_debounce_task = None
+
+    async def _apply_filter_after_pause(self):
+        """Apply the filter input as the live filter after the debounce delay."""
+        await asyncio.sleep(_FILTER_DEBOUNCE)
+        self._filter_debounce_task = None
+        if self.filter_active and self.filter_input.text != self.filter_text:
+            self.filter_text = self.filter_input.text
+            self.selected_row = 0
+            self.app.invalidate()
+
     def _create_layout(self) -> Layout:
         """Create the TUI layout."""
         # Header showing current repo and filter
@@ -886,61 +1415,64 @@ class TaskTUI:
     def _get_header_text(self) -> FormattedText:
         """Get the header text showing current view and filter."""
         if not self.repositories:
-            return HTML("<b>No repositories found</b>")
+            return _NO_REPOSITORIES_TEXT
 
         # Determine view label based on mode
-        view_label_map = {"repo": "Repository", "project": "Project", "assignee": "Assignee"}
-        view_label = view_label_map.get(self.view_mode, "View")
+        view_label, all_name = _VIEW_LABELS.get(self.view_mode, ("View", "All"))
 
         # Show "All" when index is -1
         if self.current_view_idx == -1:
-            if self.view_mode == "repo":
-                view_name = "All Repositories"
-            elif self.view_mode == "project":
-                view_name = "All Projects"
-            elif self.view_mode == "assignee":
-                view_name = "All Assignees"
-            else:
-                view_name = "All"
+            view_name = all_name
             current_pos = 1
         else:
             view_name = self.view_items[self.current_view_idx]
             current_pos = self.current_view_idx + 2  # +2 because "All" is position 1
 
         total_tabs = len(self.view_items) + 1  # +1 for "All" tab
-        view_info = f"{view_label}: {html.escape(view_name)} ({current_pos}/{total_tabs}) [←/→ items | Tab: view type]"
+        view_info = f"{view_label}: {view_name} ({current_pos}/{total_tabs}) [←/→ items | Tab: view type]"
 
         if self.filter_text:
-            view_info += f" | Filter: '{html.escape(self.filter_text)}'"
+            view_info += f" | Filter: '{self.filter_text}'"
 
         # Sync status is now shown in bottom status bar, no need for top bar indicator
 
-        return HTML(f"<b> {view_info} </b>")
+        # Plain style fragments: nothing to escape or re-parse on each frame
+        return FormattedText([("class:b", f" {view_info} ")])
 
-    def _build_status_info(self) -> str:
-        """Build status information string with sync/reload/conflict info.
+    def _build_status_info(self) -> tuple[tuple[str, str], ...]:
+        """Build status information fragments with sync/reload/conflict info.
+
+        The status bar height and text both need it several times per frame,
+        and it may read the sync history file, so it is built once and reused
+        until the next render starts (see ``_on_before_render``).
 
         Returns:
-            HTML-formatted status string with priority information
+            (style, text) fragments in priority order, one per status item; empty when there is nothing to show
         """
-        from taskrepo.utils.sync_history import SyncHistory
+        if self._status_info is None:
+            self._status_info = self._compute_status_info()
+        return self._status_info
+
+    def _compute_status_info(self) -> tuple[tuple[str, str], ...]:
+        """Compute the status information fragments for _build_status_info."""
+        from taskrepo.utils.sync_history import get_last_sync_entry
         from taskrepo.utils.time_format import format_interval, format_time_ago
 
-        parts = []
+        parts: list[tuple[str, str]] = []
 
         # Priority 1: Conflict warnings (highest priority)
         if self.conflicted_repos:
             count = len(self.conflicted_repos)
-            parts.append(f"<yellow>⚠ {count} repo{'s' if count > 1 else ''} need manual sync</yellow>")
+            parts.append(("class:yellow", f"⚠ {count} repo{'s' if count > 1 else ''} need manual sync"))
 
         # Priority 2: Active sync status
         if self.sync_status == "syncing":
-            parts.append("<cyan>🔄 Syncing...</cyan>")
+            parts.append(("class:cyan", "🔄 Syncing..."))
 
         # Priority 3: Last sync status from history (reliable source of truth)
         if self.config.auto_sync_enabled:
-            sync_history = SyncHistory()
-            last_sync = sync_history.get_last_sync()
+            # Only re-read when the history file changed since the last frame
+            last_sync = get_last_sync_entry()
 
             if last_sync:
                 sync_time_str = format_time_ago(last_sync.timestamp)
@@ -950,47 +1482,55 @@ class TaskTUI:
                     if not self.conflicted_repos:
                         failed_count = len(last_sync.repos_failed)
                         parts.append(
-                            f"<red>✗ Sync failed {sync_time_str} ({failed_count} repo{'s' if failed_count != 1 else ''})</red>"
+                            (
+                                "class:red",
+                                f"✗ Sync failed {sync_time_str} ({failed_count} repo{'s' if failed_count != 1 else ''})",
+                            )
                         )
                 elif self.has_unsaved_changes:
                     # Successful sync but have local changes
                     repo_count = len(last_sync.repos_synced)
                     if repo_count > 1:
-                        parts.append(f"<yellow>Synced {sync_time_str} ({repo_count} repos, unsaved)</yellow>")
+                        parts.append(("class:yellow", f"Synced {sync_time_str} ({repo_count} repos, unsaved)"))
                     else:
-                        parts.append(f"<yellow>Synced {sync_time_str} (unsaved)</yellow>")
+                        parts.append(("class:yellow", f"Synced {sync_time_str} (unsaved)"))
                 else:
                     # Successful sync, no local changes
                     repo_count = len(last_sync.repos_synced)
                     if repo_count > 1:
-                        parts.append(f"<green>Synced {sync_time_str} ({repo_count} repos)</green>")
+                        parts.append(("class:green", f"Synced {sync_time_str} ({repo_count} repos)"))
                     else:
-                        parts.append(f"<green>Synced {sync_time_str}</green>")
+                        parts.append(("class:green", f"Synced {sync_time_str}"))
             else:
-                parts.append("<dim>Not synced yet</dim>")
+                parts.append(("class:dim", "Not synced yet"))
 
         # Priority 4: Last reload time
         if self.last_reload_time:
             reload_time_str = format_time_ago(self.last_reload_time)
-            parts.append(f"<blue>Reloaded {reload_time_str}</blue>")
+            parts.append(("class:blue", f"Reloaded {reload_time_str}"))
 
         # Priority 5: Auto-sync status (if enabled)
         if self.config.auto_sync_enabled:
             interval_str = format_interval(self.config.auto_sync_interval)
-            parts.append(f"<dim>Auto-sync: ON ({interval_str})</dim>")
+            parts.append(("class:dim", f"Auto-sync: ON ({interval_str})"))
 
-        return " | ".join(parts) if parts else ""
+        return tuple(parts)
 
-    def _get_shortcuts_text(self, terminal_width: int, allow_multiline: bool = False) -> str:
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _get_shortcuts_text(terminal_width: int, allow_multiline: bool = False) -> str:
         """Get keyboard shortcuts based on terminal width.
 
+        The text depends only on its arguments, so it is wrapped once per
+        terminal width rather than on each of the status bar's per-frame calls.
+
         Args:
             terminal_width: Current terminal width in columns
             allow_multiline: If True, return full shortcuts even on narrow terminals
                             (they'll wrap to multiple lines with smart word-break logic)
 
         Returns:
-            HTML-formatted shortcuts string responsive to width
+            Shortcuts text responsive to width
         """
         # Very narrow (<80 cols): Just help hint (unless multiline allowed)
         if terminal_width < 80 and not allow_multiline:
@@ -1088,12 +1628,22 @@ class TaskTUI:
         # Get shortcuts based on terminal width (with multiline wrapping when needed)
         shortcuts = self._get_shortcuts_text(terminal_width, allow_multiline=allow_multiline)
 
+        # The status bar rarely changes between frames; reuse the previous fragments when it does not
+        key = (status_info, shortcuts)
+        if self._status_bar_cache is not None and self._status_bar_cache[0] == key:
+            return self._status_bar_cache[1]
+
+        fragments = [("", " ")]
+        for i, part in enumerate(status_info):
+            if i:
+                fragments.append(("", " | "))
+            fragments.append(part)
         # Always use separate lines for status and shortcuts when status exists
-        if status_info:
-            return HTML(f" {status_info}\n {shortcuts} ")
-        else:
-            # Just shortcuts if no status info
-            return HTML(f" {shortcuts} ")
+        fragments.append(("", f"\n {shortcuts} " if status_info else f"{shortcuts} "))
+
+        text = FormattedText(fragments)
+        self._status_bar_cache = (key, text)
+        return text
 
     def _get_task_detail_text(self) -> FormattedText:
         """Get formatted details for the currently selected task."""
@@ -1101,88 +1651,112 @@ class TaskTUI:
 
         # Check if there's a selected task
         if not tasks or self.selected_row < 0 or self.selected_row >= len(tasks):
-            return HTML("<dim>No task selected</dim>")
+            return _NO_TASK_SELECTED_TEXT
 
         task = tasks[self.selected_row]
+        display_id = self._get_display_id(task.id)
 
-        # Get display ID (zero-padded to 3 digits for consistent width)
-        display_id = get_display_id_from_uuid(task.id)
-        display_id_str = f"{display_id:03d}" if display_id else f"{task.id[:8]}..."
-
-        # Build detail sections
-        lines = []
-
-        # Title header
-        lines.append(f"<b>Task [{display_id_str}]: {html.escape(task.title)}</b>\n\n")
-
-        # Metadata line 1: Repo, Project, Status, Priority
-        repo = html.escape(task.repo) if task.repo else "-"
-        project = html.escape(task.project) if task.project else "-"
-
-        # Color-code status
-        status_color_map = {
-            "pending": "yellow",
-            "in-progress": "blue",
-            "completed": "green",
-            "cancelled": "red",
-        }
-        status_color = status_color_map.get(task.status, "white")
-
-        # Color-code priority
-        priority_color_map = {"H": "red", "M": "yellow", "L": "green"}
-        priority_color = priority_color_map.get(task.priority, "white")
-
-        lines.append(
-            f"<cyan>Repo:</cyan> <magenta>{repo}</magenta> | "
-            f"<cyan>Project:</cyan> <cyan>{project}</cyan> | "
-            f"<cyan>Status:</cyan> <{status_color}><b>{task.status}</b></{status_color}> | "
-            f"<cyan>Priority:</cyan> <{priority_color}><b>{task.priority}</b></{priority_color}>\n"
-        )
+        # Reuse the previous text while the same task stays selected
+        cached = self._detail_cache
+        if cached is not None and cached[0] is task and cached[1] == display_id:
+            return cached[2]
 
-        # Metadata line 2: Timestamps
-        created_str = task.created.strftime("%Y-%m-%d %H:%M") if task.created else "-"
-        modified_str = task.modified.strftime("%Y-%m-%d %H:%M") if task.modified else "-"
-        lines.append(f"<cyan>Created:</cyan> {created_str} | <cyan>Modified:</cyan> {modified_str}\n")
-
-        # Metadata line 3: Assignees, Tags, Due
-        assignees = ", ".join(html.escape(a) for a in task.assignees) if task.assignees else "-"
-        tags = ", ".join(html.escape(t) for t in task.tags) if task.tags else "-"
-        due_str = task.due.strftime("%Y-%m-%d") if task.due else "-"
-
-        # Color-code assignees and tags
-        lines.append(
-            f"<cyan>Assigned:</cyan> <blue>{assignees}</blue> | "
-            f"<cyan>Tags:</cyan> <yellow>{tags}</yellow> | "
-            f"<cyan>Due:</cyan> {due_str}\n"
-        )
+        text = self._build_task_detail_text(task, display_id)
+        self._detail_cache = (task, display_id, text)
+        return text
+
+    def _build_task_detail_text(self, task: Task, display_id: Optional[int]) -> FormattedText:
+        """Format the detail panel for a task.
+
+        Args:
+            task: Task to describe
+            display_id: Task's display ID, or None if it has none
+
+        Returns:
+            Formatted detail text
+        """
+        display_id_str = _format_display_id(task.id, display_id)
+
+        # Style fragments are used directly (no HTML markup to build, escape and re-parse)
+        label = "class:cyan"
+        heading = "class:cyan,b"
+
+        # Color-code status and priority
+        status_color = STATUS_COLORS.get(task.status, "white")
+        priority_color = PRIORITY_COLORS.get(task.priority, "white")
+
+        created_str = _format_date(task.created, "%Y-%m-%d %H:%M")
+        modified_str = _format_date(task.modified, "%Y-%m-%d %H:%M")
+        due_str = _format_date(task.due, "%Y-%m-%d")
+
+        fragments = [
+            # Title header
+            ("class:b", f"Task [{display_id_str}]: {task.title}"),
+            ("", "\n\n"),
+            # Metadata line 1: Repo, Project, Status, Priority
+            (label, "Repo:"),
+            ("", " "),
+            ("class:magenta", task.repo or "-"),
+            ("", " | "),
+            (label, "Project:"),
+            ("", " "),
+            ("class:cyan", task.project or "-"),
+            ("", " | "),
+            (label, "Status:"),
+            ("", " "),
+            (f"class:{status_color},b", task.status),
+            ("", " | "),
+            (label, "Priority:"),
+            ("", " "),
+            (f"class:{priority_color},b", task.priority),
+            ("", "\n"),
+            # Metadata line 2: Timestamps
+            (label, "Created:"),
+            ("", f" {created_str} | "),
+            (label, "Modified:"),
+            ("", f" {modified_str}\n"),
+            # Metadata line 3: Assignees, Tags, Due
+            (label, "Assigned:"),
+            ("", " "),
+            ("class:blue", ", ".join(task.assignees) if task.assignees else "-"),
+            ("", " | "),
+            (label, "Tags:"),
+            ("", " "),
+            ("class:yellow", ", ".join(task.tags) if task.tags else "-"),
+            ("", " | "),
+            (label, "Due:"),
+            ("", f" {due_str}\n"),
+        ]
 
         # Links section
         if task.links:
-            lines.append("\n<cyan><b>Links:</b></cyan>\n")
-            for link in task.links:
-                lines.append(f"  • {html.escape(link)}\n")
+            fragments.append(("", "\n"))
+            fragments.append((heading, "Links:"))
+            fragments.append(("", "".join(f"\n  • {link}" for link in task.links) + "\n"))
 
         # Dependencies section
         deps_info = []
         if task.parent:
-            deps_info.append(f"Parent: {html.escape(task.parent)}")
+            deps_info.append(f"Parent: {task.parent}")
         if task.depends:
-            deps_info.append(f"Depends on: {', '.join(html.escape(d) for d in task.depends)}")
+            deps_info.append(f"Depends on: {', '.join(task.depends)}")
         if deps_info:
-            lines.append(f"\n<cyan><b>Dependencies:</b></cyan> {' | '.join(deps_info)}\n")
+            fragments.append(("", "\n"))
+            fragments.append((heading, "Dependencies:"))
+            fragments.append(("", f" {' | '.join(deps_info)}\n"))
 
         # Description section
         if task.description:
-            lines.append("\n<cyan><b>Description:</b></cyan>\n")
+            fragments.append(("", "\n"))
+            fragments.append((heading, "Description:"))
             # Limit description to first 10 lines for display
             desc_lines = task.description.split("\n")
-            display_lines = desc_lines[:10]
-            for line in display_lines:
-                lines.append(f"{html.escape(line)}\n")
+            fragments.append(("", "\n" + "".join(f"{line}\n" for line in desc_lines[:10])))
             if len(desc_lines) > 10:
-                lines.append(f"<dim>... ({len(desc_lines) - 10} more lines)</dim>\n")
+                fragments.append(("class:dim", f"... ({len(desc_lines) - 10} more lines)"))
+                fragments.append(("", "\n"))
 
-        return HTML("".join(lines))
+        return FormattedText(fragments)
 
     def _get_current_repo(self) -> Optional[Repository]:
         """Get the currently selected repository (only valid in repo mode).
@@ -1196,348 +1770,474 @@ class TaskTUI:
         if self.current_view_idx == -1:
             return None
         # Get repository by name
-        repo_name = self.view_items[self.current_view_idx]
-        return next((r for r in self.repositories if r.name == repo_name), None)
+        if self._repo_by_name is None:
+            self._repo_by_name = {repo.name: repo for repo in self.repositories}
+        return self._repo_by_name.get(self.view_items[self.current_view_idx])
+
+    def _invalidate_task_caches(self):
+        """Forget memoized task data after repositories are reloaded."""
+        self._all_tasks_cache = None
+        self._filtered_tasks_cache = None
+        self._last_text_filter = None
+        self._display_ids = None
+        self._detail_cache = None
+        self._repo_by_name = None
+        self._subtask_counts = None
+        self._all_view_rows.clear()
+        self._list_texts.clear()
+
+    def _get_display_id(self, task_id: str) -> Optional[int]:
+        """Get a task's display ID, reading the ID cache file once per reload."""
+        if self._display_ids is None:
+            self._display_ids = load_uuid_to_display_id()
+        return self._display_ids.get(task_id)
+
+    def _get_list_texts(self, task: Task) -> tuple[str, str]:
+        """Get a task's comma-joined assignees and tags, joining them once per reload."""
+        texts = self._list_texts.get(task.id)
+        if texts is None:
+            texts = (
+                ", ".join(task.assignees) if task.assignees else "-",
+                ", ".join(task.tags) if task.tags else "-",
+            )
+            self._list_texts[task.id] = texts
+        return texts
+
+    def _get_subtask_count(self, repo_name: str, task_id: str) -> int:
+        """Count a task's direct subtasks within a repository.
+
+        Children are indexed by parent once per reload, so each row lookup is
+        O(1) instead of a scan over the repository's tasks.
+        """
+        if self._subtask_counts is None:
+            self._subtask_counts = Counter((t.repo, t.parent) for t in self._get_all_tasks() if t.parent)
+        return self._subtask_counts[(repo_name, task_id)]
+
+    def _get_all_tasks(self) -> list[Task]:
+        """Get every task across the loaded repositories, loading them once per reload.
+
+        Callers must not mutate the returned list.
+        """
+        if self._all_tasks_cache is None:
+            all_tasks = []
+            for repo in self.repositories:
+                all_tasks.extend(repo.list_tasks())
+            self._all_tasks_cache = all_tasks
+            # Unchanged tasks reload as the same objects and keep their search blobs; drop the rest.
+            # Until the filter is first used there are no blobs, so skip indexing the tasks.
+            if self._search_blobs:
+                live = {id(t) for t in all_tasks}
+                self._search_blobs = {k: v for k, v in self._search_blobs.items() if id(v[0]) in live}
+        return self._all_tasks_cache
+
+    def _search_blob(self, task: Task) -> str:
+        """Get the lowercased text the filter is matched against for a task.
+
+        Title, description, project, tags and assignees are joined with NUL
+        separators (so a match cannot span two fields) and lowercased once per
+        loaded task instead of on every filter change. Blobs outlive reloads
+        for tasks whose files did not change.
+        """
+        cached = self._search_blobs.get(task.id)
+        if cached is not None and cached[0] is task:
+            return cached[1]
+        blob = "\x00".join(
+            [task.title, task.description or "", task.project or "", *task.tags, *task.assignees]
+        ).lower()
+        self._search_blobs[task.id] = (task, blob)
+        return blob
 
     def _get_filtered_tasks(self) -> list[Task]:
-        """Get tasks from current view with filters applied."""
-        # Load all tasks first
-        all_tasks = []
-        for repo in self.repositories:
-            all_tasks.extend(repo.list_tasks())
+        """Get tasks from current view with filters applied.
+
+        The result is memoized on the view state and the last seen repository
+        mtime, so redraws and navigation keys reuse the same list until a reload
+        or a view/filter change. Callers must not mutate the returned list.
+        """
+        return self._get_filtered_view()[0]
+
+    def _get_filtered_rows(self) -> list[tuple[Task, int, bool, tuple[bool, ...]]]:
+        """Get display rows for the filtered tasks, in the same order.
+
+        Returns:
+            List of (task, depth, is_last_child, ancestor_positions) tuples as
+            produced by build_task_tree, with the ancestor positions frozen into
+            tuples; flat rows use depth 0 and no ancestors
+        """
+        return self._get_filtered_view()[1]
+
+    def _get_filtered_view(self) -> tuple[list[Task], list[tuple[Task, int, bool, tuple[bool, ...]]]]:
+        """Get the memoized (tasks, rows) pair for the current view."""
+        # Check if current_view_idx is still valid (it may be out of bounds after archiving/deleting)
+        if self.current_view_idx >= len(self.view_items):
+            # Index out of bounds - reset to "All" view
+            self.current_view_idx = -1
+
+        key = (
+            self.last_mtime,
+            self.current_view_idx,
+            self.view_mode,
+            self.filter_text,
+            self.tree_view,
+            id(self.repositories),
+            len(self.repositories),
+        )
+        if self._filtered_tasks_cache is not None and self._filtered_tasks_cache[0] == key:
+            return self._filtered_tasks_cache[1]
+
+        rows = self._compute_filtered_rows()
+        view = ([row[0] for row in rows], rows)
+        self._filtered_tasks_cache = (key, view)
+        return view
+
+    def _get_task_positions(self) -> dict[str, int]:
+        """Map task IDs to their row in the current view, indexing each filtered view once."""
+        tasks = self._get_filtered_tasks()
+        if self._task_positions is None or self._task_positions[0] is not tasks:
+            positions: dict[str, int] = {}
+            for i, task in enumerate(tasks):
+                positions.setdefault(task.id, i)
+            self._task_positions = (tasks, positions)
+        return self._task_positions[1]
+
+    def _compute_filtered_rows(self) -> list[tuple[Task, int, bool, tuple[bool, ...]]]:
+        """Load, filter and sort the tasks for the current view into display rows."""
+        # Fast path: the unfiltered "All" view is sorted once per reload
+        if self.current_view_idx == -1 and not self.filter_text:
+            return self._get_all_view_rows(self.tree_view)
+
+        all_tasks = self._get_all_tasks()
 
         # Filter by current view
         if self.current_view_idx == -1:
             # Show all tasks
             tasks = all_tasks
         else:
-            # Check if current_view_idx is still valid (it may be out of bounds after archiving/deleting)
-            if self.current_view_idx >= len(self.view_items):
-                # Index out of bounds - reset to "All" view
-                self.current_view_idx = -1
-                tasks = all_tasks
+            # Filter based on view mode
+            current_view_value = self.view_items[self.current_view_idx]
+
+            if self.view_mode == "repo":
+                # Filter by repository
+                tasks = [t for t in all_tasks if t.repo == current_view_value]
+            elif self.view_mode == "project":
+                # Filter by project
+                tasks = [t for t in all_tasks if t.project == current_view_value]
+            elif self.view_mode == "assignee":
+                # Filter by assignee
+                tasks = [t for t in all_tasks if current_view_value in t.assignees]
             else:
-                # Filter based on view mode
-                current_view_value = self.view_items[self.current_view_idx]
-
-                if self.view_mode == "repo":
-                    # Filter by repository
-                    tasks = [t for t in all_tasks if t.repo == current_view_value]
-                elif self.view_mode == "project":
-                    # Filter by project
-                    tasks = [t for t in all_tasks if t.project == current_view_value]
-                elif self.view_mode == "assignee":
-                    # Filter by assignee
-                    tasks = [t for t in all_tasks if current_view_value in t.assignees]
-                else:
-                    tasks = all_tasks
+                tasks = all_tasks
 
         # Apply text filter if active
         if self.filter_text:
             filter_lower = self.filter_text.lower()
-            tasks = [
-                t
-                for t in tasks
-                if (
-                    filter_lower in t.title.lower()
-                    or (t.description and filter_lower in t.description.lower())
-                    or (t.project and filter_lower in t.project.lower())
-                    or any(filter_lower in tag.lower() for tag in t.tags)
-                    or any(filter_lower in assignee.lower() for assignee in t.assignees)
-                )
-            ]
-
-        # Sort tasks
-        if self.tree_view:
-            # Separate top-level and subtasks
-            top_level = [t for t in tasks if not t.parent]
-            subtasks = [t for t in tasks if t.parent]
+            scope = (self.view_mode, self.view_items[self.current_view_idx] if self.current_view_idx >= 0 else None)
+            previous = self._last_text_filter
+            if previous is not None and previous[0] == scope and filter_lower.startswith(previous[1]):
+                # The query extends the previous one in the same view, so only its matches can still match
+                tasks = previous[2]
+            # A plain substring test beats a precompiled regex search here
+            search_blob = self._search_blob
+            tasks = [t for t in tasks if filter_lower in search_blob(t)]
+            self._last_text_filter = (scope, filter_lower, tasks)
+
+        return self._sort_into_rows(tasks, self.tree_view)
+
+    def _get_all_view_rows(self, tree_view: bool) -> list[tuple[Task, int, bool, tuple[bool, ...]]]:
+        """Get the sorted rows for every task, computed once per reload and layout.
+
+        Callers must not mutate the returned list.
+        """
+        rows = self._all_view_rows.get(tree_view)
+        if rows is None:
+            rows = self._sort_into_rows(self._get_all_tasks(), tree_view)
+            self._all_view_rows[tree_view] = rows
+        return rows
+
+    def _sort_into_rows(self, tasks: list[Task], tree_view: bool) -> list[tuple[Task, int, bool, tuple[bool, ...]]]:
+        """Sort tasks into display rows, as a tree or a flat list."""
+        if tree_view:
+            # Separate top-level and subtasks in a single pass
+            top_level: list[Task] = []
+            subtasks: list[Task] = []
+            for t in tasks:
+                (subtasks if t.parent else top_level).append(t)
             # Pass all tasks for effective due date calculation
             sorted_top_level = sort_tasks(top_level, self.config, all_tasks=tasks)
-            tree_items = build_task_tree(sorted_top_level + subtasks, self.config)
-            return [item[0] for item in tree_items]
+            # Ancestors are frozen once here so redraws can use them directly in row cache keys
+            return [
+                (task, depth, is_last, tuple(ancestors))
+                for task, depth, is_last, ancestors in build_task_tree(sorted_top_level + subtasks, self.config)
+            ]
         else:
-            return sort_tasks(tasks, self.config, all_tasks=tasks)
+            return [(task, 0, False, ()) for task in sort_tasks(tasks, self.config, all_tasks=tasks)]
+
+    def _save_id_cache(self):
+        """Save the display ID cache in flat "All" view order."""
+        save_id_cache([row[0] for row in self._get_all_view_rows(tree_view=False)])
 
     def _get_task_list_text(self) -> FormattedText:
         """Get formatted task list for viewport display."""
         # Recalculate viewport size dynamically based on current terminal size
-        self.viewport_size = self._calculate_viewport_size()
-        self.scroll_trigger = min(5, max(2, self.viewport_size // 3))
+        self._update_viewport_dims()
 
-        tasks = self._get_filtered_tasks()
+        # Rows carry the tree structure (or flat placeholders) built with the filtered list
+        tree_items = self._get_filtered_rows()
+
+        if not tree_items:
+            return _NO_TASKS_TEXT
 
-        if not tasks:
-            return HTML("<yellow>No tasks found. Press 'n' to create one.</yellow>")
+        total_rows = len(tree_items)
+
+        # A reload or resize may have shrunk the list or the viewport since the last key press
+        self._clamp_viewport(total_rows)
 
         # Determine which column to hide (only when viewing specific item, not "All")
         hide_repo = self.view_mode == "repo" and self.current_view_idx >= 0
         hide_project = self.view_mode == "project" and self.current_view_idx >= 0
         hide_assignee = self.view_mode == "assignee" and self.current_view_idx >= 0
 
-        # Build tree structure if needed
-        if self.tree_view:
-            tree_items = [(tasks[i], 0, False, []) for i in range(len(tasks))]
-            # Rebuild tree structure properly
-            top_level = [t for t in tasks if not t.parent]
-            subtasks = [t for t in tasks if t.parent]
-            if top_level or subtasks:
-                tree_items = build_task_tree(tasks, self.config)
-        else:
-            tree_items = [(task, 0, False, []) for task in tasks]
-
         # Calculate viewport boundaries
-        viewport_bottom = min(self.viewport_top + self.viewport_size, len(tree_items))
+        viewport_bottom = min(self.viewport_top + self.viewport_size, total_rows)
         viewport_items = tree_items[self.viewport_top : viewport_bottom]
 
-        # Calculate column widths dynamically based on terminal width
+        # Column widths and the header only change with the terminal width and hidden columns
         _, terminal_width = self._get_terminal_size()
+        hidden = (hide_repo, hide_project, hide_assignee)
+        widths = _column_widths(terminal_width, hidden)
+
+        # Subtask counts are shown for the selected repository only
+        current_repo = self._get_current_repo() if self.tree_view else None
+
+        # Countdowns for this frame are computed against the current minute
+        render_minute = datetime.now().replace(second=0, microsecond=0)
+
+        # One snapshot of the multi-selection serves both the frame key and the per-row checks
+        multi_selected = frozenset(self.multi_selected)
+
+        # Frames redrawn for other reasons (filter typing, status updates) reuse the whole list as is.
+        # The rows list is rebuilt on any reload or view change, so its identity stands for the tasks shown.
+        frame_key = (
+            self.viewport_top,
+            self.viewport_size,
+            self.selected_row,
+            multi_selected,
+            widths,
+            hidden,
+            current_repo.name if current_repo else None,
+            render_minute,
+        )
+        cached_frame = self._list_text_cache
+        if cached_frame is not None and cached_frame[0] is tree_items and cached_frame[1] == frame_key:
+            return cached_frame[2]
 
-        # Define minimum and preferred widths for each column
-        # Fixed width columns (don't expand)
-        max_id_width = 4  # Accommodate 3-digit zero-padded IDs (001-999)
-        max_status_width = 7
-        max_priority_width = 3
-        max_due_width = 10
-        max_countdown_width = 9
-
-        # Calculate space used by fixed columns and separators
-        fixed_width = max_id_width + max_status_width + max_priority_width + max_due_width + max_countdown_width
-
-        # Calculate number of separators dynamically based on visible columns
-        # Each visible column has 1 space separator, except:
-        # - ID column has its marker (no additional space)
-        # - Due/Count has 4 spaces between them (3 extra + 1 normal)
-        num_visible_cols = 5  # ID, Title, Status, Priority, Tags (always visible)
-        if not hide_repo:
-            num_visible_cols += 1  # Repo
-        if not hide_project:
-            num_visible_cols += 1  # Project
-        if not hide_assignee:
-            num_visible_cols += 1  # Assignee
-        num_visible_cols += 2  # Due and Count
-
-        # Each column gets 1 separator space, except ID (no space before) and Count (no space after)
-        # Plus 3 extra spaces between Due and Count
-        separators = num_visible_cols - 1 + 3
-
-        # Calculate remaining space for flexible columns
-        remaining_width = terminal_width - fixed_width - separators - 2  # -2 for margins
-
-        # Distribute remaining space among flexible columns
-        # Priority: Title > Repo/Project/Assignees/Tags (equal distribution)
-        if remaining_width < 60:
-            # Narrow terminal: use minimum widths
-            max_title_width = 20
-            max_repo_width = 8
-            max_project_width = 8
-            max_assignees_width = 8
-            max_tags_width = 6
-        else:
-            # Wide terminal: distribute space
-            # Title gets 40% of remaining space, others share the rest
-            max_title_width = max(25, int(remaining_width * 0.4))
-            other_space = remaining_width - max_title_width
-            each_other = max(8, other_space // 4)
-            max_repo_width = each_other
-            max_project_width = each_other
-            max_assignees_width = each_other
-            max_tags_width = each_other
-
-        # Adjust widths for hidden columns - give space to title
-        freed_space = 0
-        if hide_repo:
-            freed_space += max_repo_width + 1  # +1 for separator
-            max_repo_width = 0
-        if hide_project:
-            freed_space += max_project_width + 1  # +1 for separator
-            max_project_width = 0
-        if hide_assignee:
-            freed_space += max_assignees_width + 1  # +1 for separator
-            max_assignees_width = 0
-
-        # Add freed space to title column
-        max_title_width += freed_space
-
-        # Build result
-        result = []
-
-        # Build header with abbreviated column names, conditionally including columns
-        header_parts = []
-        header_parts.append(f"{'ID':<{max_id_width}} ")
-        header_parts.append(f"{'Title':<{max_title_width}} ")
-        if not hide_repo:
-            header_parts.append(f"{'Repo':<{max_repo_width}} ")
-        if not hide_project:
-            header_parts.append(f"{'Proj':<{max_project_width}} ")  # Project -> Proj
-        header_parts.append(f"{'Status':<{max_status_width}} ")
-        header_parts.append(f"{'P':<{max_priority_width}} ")  # Pri -> P
-        if not hide_assignee:
-            header_parts.append(f"{'Assign':<{max_assignees_width}} ")  # Assigned -> Assign
-        header_parts.append(f"{'Tags':<{max_tags_width}} ")
-        header_parts.append(f"{'Due':<{max_due_width}}    ")  # Extra spacing before Countdown
-        header_parts.append(f"{'Count':<{max_countdown_width}}")  # Countdown -> Count
+        header_line, divider_line, table_width = _task_list_header_lines(widths, hidden)
 
-        header = "".join(header_parts)
-        table_width = len(header)
+        result = []
 
         # Add scroll indicator at top if there are tasks above viewport
         if self.viewport_top > 0:
-            scroll_msg = f"▲ {self.viewport_top} more above"
-            result.append(("class:scrollbar", f"{scroll_msg:^{table_width}}\n"))
-        result.append(("class:header", header + "\n"))
-        result.append(("class:header", "─" * len(header) + "\n"))
-
-        # Build task rows (only viewport items)
+            result.append(("class:scrollbar", _scroll_indicator(True, self.viewport_top, table_width)))
+        result.append(("class:header", header_line + divider_line))
+
+        countdown_width = widths.countdown
+        countdown_visible = False
+
+        # Build task rows (only viewport items), reusing rows whose inputs are unchanged. Cached rows
+        # all share one column layout, so row keys need not repeat it.
+        row_cache = self._row_cache
+        if self._row_cache_layout != (widths, hidden):
+            row_cache.clear()
+            self._row_cache_layout = (widths, hidden)
         for viewport_idx, (task, depth, is_last, ancestors) in enumerate(viewport_items):
             # Calculate actual index in full task list
             actual_idx = self.viewport_top + viewport_idx
             is_selected = actual_idx == self.selected_row
-            is_multi_selected = task.id in self.multi_selected
+            is_multi_selected = task.id in multi_selected
 
-            # Get display ID (zero-padded to 3 digits for consistent width)
-            display_id = get_display_id_from_uuid(task.id)
-            display_id_str = f"{display_id:03d}" if display_id else f"{task.id[:8]}..."
-
-            # Format title with tree structure and selection markers
-            if self.tree_view:
-                all_repo_tasks = self._get_current_repo().list_tasks() if self._get_current_repo() else []
-                subtask_count = count_subtasks(task, all_repo_tasks)
-                formatted_title = format_tree_title(task.title, depth, is_last, ancestors, subtask_count)
-            else:
-                formatted_title = task.title
-
-            # Truncate title if too long (account for multi-select marker)
-            # Use display width to properly handle emojis and wide characters
-            title_space = max_title_width - 2  # Reserve space for markers
-            formatted_title = truncate_to_width(formatted_title, title_space)
-
-            # Add selection markers
-            selection_marker = ">" if is_selected else " "
-            multi_marker = "✓" if is_multi_selected else " "
-
-            # Format other fields with proper truncation
-            repo_str = (task.repo or "-")[:max_repo_width]
-            project_str = (task.project or "-")[:max_project_width]
-
-            # Abbreviate status for compact display
-            status_map = {"pending": "pending", "in-progress": "progres", "completed": "done", "cancelled": "cancel"}
-            status_str = status_map.get(task.status, task.status)[:max_status_width]
-            priority_str = task.priority
-            assignees_str = (", ".join(task.assignees) if task.assignees else "-")[:max_assignees_width]
-            tags_str = (", ".join(task.tags) if task.tags else "-")[:max_tags_width]
-            due_str = (task.due.strftime("%Y-%m-%d") if task.due else "-")[:max_due_width]
-
-            # Format countdown with color
+            display_id = self._get_display_id(task.id)
+            subtask_count = self._get_subtask_count(current_repo.name, task.id) if current_repo else 0
+            # Keyed on the countdown text itself, a new minute only rebuilds rows whose countdown changed
+            countdown = _countdown_cell(task.due, task.status, render_minute, countdown_width)
             if task.due:
-                countdown_text, countdown_color = get_countdown_text(task.due, task.status)
-                countdown_text = countdown_text[:max_countdown_width]
-                # Map colors to style classes
-                countdown_style_map = {
-                    "red": "class:countdown-overdue",
-                    "yellow": "class:countdown-urgent",
-                    "green": "class:countdown-normal",
-                }
-                countdown_style = countdown_style_map.get(countdown_color, "")
-            else:
-                countdown_text = "-"
-                countdown_style = ""
-
-            # Get style classes for priority and status
-            priority_style_map = {"H": "class:priority-high", "M": "class:priority-medium", "L": "class:priority-low"}
-            priority_style = priority_style_map.get(task.priority, "")
-
-            status_style_map = {
-                "pending": "class:status-pending",
-                "in-progress": "class:status-in-progress",
-                "completed": "class:status-completed",
-                "cancelled": "class:status-cancelled",
-            }
-            status_style = status_style_map.get(task.status, "")
-
-            # Build the row with colored segments
-            if is_selected:
-                # Selected row - use selected style for entire row
-                row_parts = []
-                row_parts.append(f"{selection_marker}")
-                row_parts.append(f"{display_id_str:<{max_id_width - 1}} ")
-                # Pad title with display width awareness
-                padded_title = pad_to_width(formatted_title, max_title_width - 2)
-                row_parts.append(f"{multi_marker} {padded_title} ")
-                if not hide_repo:
-                    row_parts.append(f"{repo_str:<{max_repo_width}} ")
-                if not hide_project:
-                    row_parts.append(f"{project_str:<{max_project_width}} ")
-                row_parts.append(f"{status_str:<{max_status_width}} ")
-                row_parts.append(f"{priority_str:<{max_priority_width}} ")
-                if not hide_assignee:
-                    row_parts.append(f"{assignees_str:<{max_assignees_width}} ")
-                row_parts.append(f"{tags_str:<{max_tags_width}} ")
-                row_parts.append(f"{due_str:<{max_due_width}}    ")  # Extra spacing before Countdown
-                row_parts.append(f"{countdown_text:<{max_countdown_width}}")
-
-                row = "".join(row_parts)
-                result.append(("class:selected", row + "\n"))
+                countdown_visible = True
+
+            key = (
+                id(task),
+                depth,
+                is_last,
+                ancestors,
+                subtask_count,
+                display_id,
+                is_selected,
+                is_multi_selected,
+                countdown,
+            )
+            cached = row_cache.get(key)
+            if cached is None:
+                fragments = self._build_row_fragments(
+                    task,
+                    depth,
+                    is_last,
+                    ancestors,
+                    subtask_count,
+                    display_id,
+                    is_selected,
+                    is_multi_selected,
+                    widths,
+                    hidden,
+                    countdown,
+                )
+                row_cache[key] = (task, fragments)
             else:
-                # Unselected row - use individual field colors
-                # Selection marker and ID
-                result.append(("", selection_marker))
-                result.append(("class:id", f"{display_id_str:<{max_id_width - 1}} "))
-
-                # Multi-select marker
-                if is_multi_selected:
-                    result.append(("class:multi-select", multi_marker))
-                else:
-                    result.append(("", multi_marker))
+                fragments = cached[1]
+                row_cache.move_to_end(key)
+            result.extend(fragments)
+        self._countdown_visible = countdown_visible
 
-                # Title (pad with display width awareness)
-                padded_title = pad_to_width(formatted_title, max_title_width - 2)
-                result.append(("", f" {padded_title} "))
+        # Keep roughly a few screens of rows
+        while len(row_cache) > 4 * self.viewport_size + 16:
+            row_cache.popitem(last=False)
 
-                # Repo (conditional)
-                if not hide_repo:
-                    result.append(("class:repo", f"{repo_str:<{max_repo_width}} "))
+        # Add scroll indicator at bottom if there are tasks below viewport
+        if viewport_bottom < total_rows:
+            remaining = total_rows - viewport_bottom
+            result.append(("class:scrollbar", _scroll_indicator(False, remaining, table_width)))
+
+        text = FormattedText(result)
+        self._list_text_cache = (tree_items, frame_key, text)
+        return text
+
+    def _build_row_fragments(
+        self,
+        task: Task,
+        depth: int,
+        is_last: bool,
+        ancestors: tuple[bool, ...],
+        subtask_count: int,
+        display_id: Optional[int],
+        is_selected: bool,
+        is_multi_selected: bool,
+        widths: "_ColumnWidths",
+        hidden: tuple[bool, bool, bool],
+        countdown: tuple[str, str],
+    ) -> list[tuple[str, str]]:
+        """Build the formatted fragments for one task row, including its newline.
+
+        Args:
+            task: Task shown in the row
+            depth: Tree depth of the task
+            is_last: Whether the task is the last child of its parent
+            ancestors: Whether each ancestor is a last child
+            subtask_count: Number of direct subtasks to show in tree view
+            display_id: Task's display ID, or None if it has none
+            is_selected: Whether the cursor is on this row
+            is_multi_selected: Whether the task is multi-selected
+            widths: Column widths for this frame
+            hidden: Whether the repo, project and assignee columns are hidden
+            countdown: (style, padded text) countdown cell
+
+        Returns:
+            List of (style, text) fragments
+        """
+        (
+            max_id_width,
+            max_title_width,
+            max_repo_width,
+            max_project_width,
+            max_status_width,
+            max_priority_width,
+            max_assignees_width,
+            max_tags_width,
+            max_due_width,
+            max_countdown_width,
+        ) = widths
+        hide_repo, hide_project, hide_assignee = hidden
+        display_id_str = _format_display_id(task.id, display_id)
+        result = []
 
-                # Project (conditional)
-                if not hide_project:
-                    result.append(("class:project", f"{project_str:<{max_project_width}} "))
+        # Format title with tree structure and selection markers
+        if self.tree_view:
+            formatted_title = format_tree_title(task.title, depth, is_last, ancestors, subtask_count)
+        else:
+            formatted_title = task.title
+
+        # Truncate title if too long (account for multi-select marker)
+        # Use display width to properly handle emojis and wide characters
+        title_space = max_title_width - 2  # Reserve space for markers
+        formatted_title = _truncate_to_width(formatted_title, title_space)
+
+        # Add selection markers
+        selection_marker = ">" if is_selected else " "
+        multi_marker = "✓" if is_multi_selected else " "
+
+        # Format other fields with proper truncation
+        repo_str = (task.repo or "-")[:max_repo_width]
+        project_str = (task.project or "-")[:max_project_width]
+
+        status_style, status_cell = _status_cell(task.status, max_status_width)
+        priority_style, priority_cell = _priority_cell(task.priority, max_priority_width)
+        assignees_text, tags_text = self._get_list_texts(task)
+        assignees_str = assignees_text[:max_assignees_width]
+        tags_str = tags_text[:max_tags_width]
+        due_str = _format_date(task.due, "%Y-%m-%d")[:max_due_width]
+
+        countdown_style, countdown_cell = countdown
+
+        # Build the row with colored segments
+        # Selection marker and ID share a fragment: styles only set the foreground, so the
+        # blank marker of an unselected row looks the same in either style
+        result.append(("class:id", selection_marker + display_id_str.ljust(max_id_width - 1) + " "))
+
+        # Multi-select marker and title (pad with display width awareness); an unstyled
+        # marker shares the title's fragment
+        padded_title = _pad_to_width(formatted_title, title_space)
+        if is_multi_selected:
+            result.append(("class:multi-select", multi_marker))
+            result.append(("", " " + padded_title + " "))
+        else:
+            result.append(("", multi_marker + " " + padded_title + " "))
 
-                # Status (colored)
-                result.append((status_style, f"{status_str:<{max_status_width}} "))
+        # Repo (conditional)
+        if not hide_repo:
+            result.append(("class:repo", repo_str.ljust(max_repo_width) + " "))
 
-                # Priority (colored)
-                result.append((priority_style, f"{priority_str:<{max_priority_width}} "))
+        # Project (conditional)
+        if not hide_project:
+            result.append(("class:project", project_str.ljust(max_project_width) + " "))
 
-                # Assignees (conditional)
-                if not hide_assignee:
-                    result.append(("class:assignee", f"{assignees_str:<{max_assignees_width}} "))
+        # Status (colored)
+        result.append((status_style, status_cell))
 
-                # Tags
-                result.append(("class:tag", f"{tags_str:<{max_tags_width}} "))
+        # Priority (colored)
+        result.append((priority_style, priority_cell))
 
-                # Due date
-                result.append(("class:due-date", f"{due_str:<{max_due_width}}    "))  # Extra spacing before Countdown
+        # Assignees (conditional)
+        if not hide_assignee:
+            result.append(("class:assignee", assignees_str.ljust(max_assignees_width) + " "))
 
-                # Countdown (colored)
-                result.append((countdown_style, f"{countdown_text:<{max_countdown_width}}"))
+        # Tags
+        result.append(("class:tag", tags_str.ljust(max_tags_width) + " "))
 
-                result.append(("", "\n"))
+        # Due date
+        result.append(("class:due-date", due_str.ljust(max_due_width) + "    "))  # Extra spacing before Countdown
 
-        # Add scroll indicator at bottom if there are tasks below viewport
-        if viewport_bottom < len(tree_items):
-            remaining = len(tree_items) - viewport_bottom
-            scroll_msg = f"▼ {remaining} more below"
-            result.append(("class:scrollbar", f"{scroll_msg:^{table_width}}\n"))
+        # Countdown (colored), ending the line
+        result.append((countdown_style, countdown_cell + "\n"))
 
-        return FormattedText(result)
+        if is_selected:
+            # Selected row - use selected style for entire row
+            return [("class:selected", "".join(text for _, text in result))]
+        return result
 
     def _get_selected_tasks(self) -> list[Task]:
         """Get the currently selected task(s) for operations."""
         tasks = self._get_filtered_tasks()
 
         if self.multi_selected:
-            # Return all multi-selected tasks
-            return [t for t in tasks if t.id in self.multi_selected]
+            # Return all multi-selected tasks in the current view, in display order
+            positions = self._get_task_positions()
+            return [tasks[i] for i in sorted(positions[t] for t in self.multi_selected if t in positions)]
         elif tasks and 0 <= self.selected_row < len(tasks):
             # Return single selected task
             return [tasks[self.selected_row]]
@@ -1555,6 +2255,9 @@ class TaskTUI:
             # Start auto-reload background task
             self.auto_reload_task = asyncio.create_task(self._auto_reload_loop())
 
+            # Start the per-minute countdown refresh
+            self.countdown_tick_task = asyncio.create_task(self._countdown_tick_loop())
+
             # Start background sync task if enabled
             if self.config.auto_sync_enabled:
                 self.background_sync_task = asyncio.create_task(self._background_sync_loop())
@@ -1577,5 +2280,12 @@ class TaskTUI:
                     except asyncio.CancelledError:
                         pass
 
+                if self.countdown_tick_task:
+                    self.countdown_tick_task.cancel()
+                    try:
+                        await self.countdown_tick_task
+                    except asyncio.CancelledError:
+                        pass
+
         # Run the async function
         return asyncio.run(run_with_background_tasks())
@@ -59,6 +59,7 @@ def sync_repository_background(repository: Repository, strategy: str = "auto", c
         if conflicts:
             # Try to auto-merge all conflicts
             unresolved = []
+            resolved_paths = []
 
             for conflict in conflicts:
                 resolved_task = None
@@ -78,11 +79,15 @@ def sync_repository_background(repository: Repository, strategy: str = "auto", c
                 if resolved_task:
                     # Save resolved task
                     repository.save_task(resolved_task)
-                    git_repo.git.add(str(conflict.file_path))
+                    resolved_paths.append(str(conflict.file_path))
                 else:
                     # Cannot auto-merge this conflict
                     unresolved.append(conflict)
 
+            # Stage all resolutions with a single git invocation
+            if resolved_paths:
+                git_repo.git.add(*resolved_paths)
+
             if unresolved:
                 # Cannot resolve all conflicts in background mode
                 return (
@@ -119,16 +124,14 @@ def sync_repository_background(repository: Repository, strategy: str = "auto", c
                 )
 
             # Stage and commit resolved files
-            for file_path in resolved_files:
-                git_repo.git.add(str(file_path))
+            git_repo.git.add(*[str(file_path) for file_path in resolved_files])
             git_repo.index.commit(f"Auto-resolve: Fixed {len(resolved_files)} conflict marker(s)")
 
         # Step 4b: Resolve README conflicts (auto-generated files, safe to auto-resolve)
         resolved_readmes = resolve_readme_conflicts(repository.path, console=None)
         if resolved_readmes:
             # Stage resolved README files
-            for file_path in resolved_readmes:
-                git_repo.git.add(str(file_path.relative_to(repository.path)))
+            git_repo.git.add(*[str(file_path.relative_to(repository.path)) for file_path in resolved_readmes])
             # Commit if we actually resolved README conflicts
             git_repo.index.commit(f"Auto-resolve: Fixed {len(resolved_readmes)} README conflict(s)")
 
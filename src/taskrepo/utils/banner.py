@@ -1,15 +1,20 @@
 """Banner display utility for TaskRepo CLI."""
 
+from functools import cache
+
 from rich.console import Console
 from rich.text import Text
 
 from taskrepo.__version__ import __version__
 
 
-def display_banner() -> None:
-    """Display the TaskRepo ASCII banner with gradient colors."""
-    console = Console()
+@cache
+def _build_banner() -> Text:
+    """Build the styled TaskRepo banner once per process.
 
+    Returns:
+        Rich Text with the gradient ASCII art and version line
+    """
     # ASCII art for "TaskRepo" in detailed block style
     lines = [
         "  dBBBBBBP dBBBBBb  .dBBBBP   dBP dBP dBBBBBb    dBBBP dBBBBBb  dBBBBP",
@@ -38,4 +43,9 @@ def display_banner() -> None:
     # Add version info below
     banner.append(f"TaskRepo v{__version__}\n", style="dim")
 
-    console.print(banner)
+    return banner
+
+
+def display_banner() -> None:
+    """Display the TaskRepo ASCII banner with gradient colors."""
+    Console().print(_build_banner())
@@ -12,6 +12,12 @@ class GitHubError(Exception):
     pass
 
 
+# Set once `gh auth status` succeeds, so later checks in the same process skip the
+# subprocess (and its round trip to GitHub). Failures are not remembered, so a
+# `gh auth login` in another terminal is picked up on the next check.
+_gh_authenticated = False
+
+
 def check_gh_cli_installed() -> bool:
     """Check if GitHub CLI (gh) is installed.
 
@@ -43,11 +49,15 @@ def check_gh_auth() -> bool:
     Returns:
         True if authenticated, False otherwise
     """
+    global _gh_authenticated
+    if _gh_authenticated:
+        return True
     try:
         result = subprocess.run(["gh", "auth", "status"], capture_output=True, text=True, check=False)
-        return result.returncode == 0
     except Exception:
         return False
+    _gh_authenticated = result.returncode == 0
+    return _gh_authenticated
 
 
 def check_github_repo_exists(org: str, repo_name: str) -> bool:
@@ -7,6 +7,7 @@ the latest formulae. The upgrade command in TaskRepo automatically handles this.
 """
 
 import re
+import shutil
 import subprocess
 from typing import Optional, Tuple
 from urllib.request import Request, urlopen
@@ -28,6 +29,10 @@ def check_brew_outdated(package: str = FORMULA_NAME, timeout: int = 5) -> Option
         Tuple of (current_version, latest_version) if outdated, None otherwise
         Returns None if brew is not installed or command fails
     """
+    # Avoid spawning a process just to hit FileNotFoundError
+    if shutil.which("brew") is None:
+        return None
+
     try:
         # Run: brew outdated --verbose <package>
         # Output format: "taskrepo (0.9.8) < 0.9.9"
@@ -1,12 +1,19 @@
 """ID mapping utilities for display ID to UUID conversion."""
 
 import json
+import os
 from pathlib import Path
 from typing import Optional
 
 from taskrepo.core.task import Task
 from taskrepo.utils.paths import get_id_cache_path, migrate_legacy_files
 
+# Parsed {uuid: display_id} maps per cache file, keyed by the file's (mtime_ns, size)
+# so a rewrite from any process is picked up on the next lookup
+_display_id_memo: dict[Path, tuple[tuple[int, int], dict[str, int]]] = {}
+# Parsed {display_id: uuid} maps, memoized the same way
+_uuid_memo: dict[Path, tuple[tuple[int, int], dict[str, str]]] = {}
+
 
 def get_cache_path() -> Path:
     """Get the path to the ID mapping cache file.
@@ -28,6 +35,12 @@ def save_id_cache(tasks: list[Task], rebalance: bool = True) -> None:
     """
     cache_path = get_cache_path()
 
+    # Read the current cache once: stable mode builds on it, and an unchanged mapping is not rewritten
+    try:
+        existing_text = cache_path.read_text()
+    except OSError:
+        existing_text = None
+
     if rebalance:
         # Full rebalance: assign sequential IDs based on task order
         cache = {}
@@ -41,11 +54,10 @@ def save_id_cache(tasks: list[Task], rebalance: bool = True) -> None:
         # Stable mode: preserve existing IDs, assign new IDs to new tasks
         # Load existing cache
         existing_cache = {}
-        if cache_path.exists():
+        if existing_text is not None:
             try:
-                with open(cache_path) as f:
-                    existing_cache = json.load(f)
-            except (json.JSONDecodeError, KeyError):
+                existing_cache = json.loads(existing_text)
+            except json.JSONDecodeError:
                 existing_cache = {}
 
         # Build UUID -> existing ID mapping
@@ -83,14 +95,32 @@ def save_id_cache(tasks: list[Task], rebalance: bool = True) -> None:
                 "title": task.title,
             }
 
+    # Most saves (every list and TUI reload) reproduce the current mapping; leave the
+    # file, and with it the parsed caches of every reader, untouched then
+    data = json.dumps(cache, indent=2)
+    if data == existing_text:
+        return
+
+    # Write to a sibling file and rename it into place, so a concurrent reader
+    # (or a crash mid-write) never sees a truncated cache
     cache_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(cache_path, "w") as f:
-        json.dump(cache, f, indent=2)
+    tmp_path = cache_path.with_suffix(".tmp")
+    try:
+        tmp_path.write_text(data)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    _display_id_memo.clear()
+    _uuid_memo.clear()
 
 
 def get_uuid_from_display_id(display_id: str) -> Optional[str]:
     """Get UUID from display ID using cache.
 
+    The cache file is parsed once and reused until it is rewritten, so
+    resolving a batch of display IDs reads it only once.
+
     Args:
         display_id: Display ID (e.g., "1", "2", "3")
 
@@ -98,32 +128,80 @@ def get_uuid_from_display_id(display_id: str) -> Optional[str]:
         UUID string if found, None otherwise
     """
     cache_path = get_cache_path()
-    if not cache_path.exists():
+    try:
+        stat = cache_path.stat()
+    except OSError:
         return None
 
-    try:
-        with open(cache_path) as f:
-            cache = json.load(f)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    memo = _uuid_memo.get(cache_path)
+    if memo is None or memo[0] != signature:
+        memo = (signature, _load_display_id_to_uuid(cache_path))
+        _uuid_memo[cache_path] = memo
+    return memo[1].get(str(display_id))
 
-        entry = cache.get(str(display_id))
-        if entry:
-            return entry["uuid"]
-    except (json.JSONDecodeError, KeyError):
-        return None
 
-    return None
+def _load_display_id_to_uuid(cache_path: Path) -> dict[str, str]:
+    """Load the ID cache and return a {display_id: uuid} map.
+
+    Args:
+        cache_path: Cache file to read
+
+    Returns:
+        Mapping of display ID to task UUID; empty if the cache file is
+        unreadable or structurally unexpected
+    """
+    try:
+        cache = json.loads(cache_path.read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    return {
+        display_id: entry["uuid"] for display_id, entry in cache.items() if isinstance(entry, dict) and "uuid" in entry
+    }
 
 
 def clear_id_cache() -> None:
     """Clear the ID mapping cache."""
-    cache_path = get_cache_path()
-    if cache_path.exists():
-        cache_path.unlink()
+    get_cache_path().unlink(missing_ok=True)
+    _display_id_memo.clear()
+    _uuid_memo.clear()
+
+
+def load_uuid_to_display_id(cache_path: Optional[Path] = None) -> dict[str, int]:
+    """Load the ID cache once and return a {uuid: display_id} map.
+
+    Use this instead of repeated get_display_id_from_uuid() calls when looking
+    up many tasks, since each of those calls stats the cache file.
+
+    Args:
+        cache_path: Cache file to read (defaults to get_cache_path())
+
+    Returns:
+        Mapping of task UUID to display ID; empty if the cache file is missing,
+        unreadable, or structurally unexpected
+    """
+    if cache_path is None:
+        cache_path = get_cache_path()
+    try:
+        cache = json.loads(cache_path.read_text())
+        if not isinstance(cache, dict):
+            return {}
+        return {
+            entry["uuid"]: int(display_id)
+            for display_id, entry in cache.items()
+            if isinstance(entry, dict) and "uuid" in entry
+        }
+    except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError):
+        return {}
 
 
 def get_display_id_from_uuid(uuid: str) -> Optional[int]:
     """Get display ID from UUID using cache.
 
+    The cache file is parsed once and reused until it is rewritten.
+
     Args:
         uuid: UUID string
 
@@ -131,20 +209,17 @@ def get_display_id_from_uuid(uuid: str) -> Optional[int]:
         Display ID as integer if found, None otherwise
     """
     cache_path = get_cache_path()
-    if not cache_path.exists():
-        return None
-
     try:
-        with open(cache_path) as f:
-            cache = json.load(f)
-
-        for display_id, entry in cache.items():
-            if entry["uuid"] == uuid:
-                return int(display_id)
-    except (json.JSONDecodeError, KeyError, ValueError):
+        stat = cache_path.stat()
+    except OSError:
         return None
 
-    return None
+    signature = (stat.st_mtime_ns, stat.st_size)
+    memo = _display_id_memo.get(cache_path)
+    if memo is None or memo[0] != signature:
+        memo = (signature, load_uuid_to_display_id(cache_path))
+        _display_id_memo[cache_path] = memo
+    return memo[1].get(uuid)
 
 
 def get_cache_size() -> int:
@@ -153,13 +228,7 @@ def get_cache_size() -> int:
     Returns:
         Number of tasks in cache, or 0 if cache doesn't exist or is invalid
     """
-    cache_path = get_cache_path()
-    if not cache_path.exists():
-        return 0
-
     try:
-        with open(cache_path) as f:
-            cache = json.load(f)
-        return len(cache)
-    except (json.JSONDecodeError, KeyError):
+        return len(json.loads(get_cache_path().read_text()))
+    except (OSError, json.JSONDecodeError, TypeError):
         return 0
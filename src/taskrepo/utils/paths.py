@@ -50,6 +50,15 @@ def get_history_cache_dir() -> Path:
     return cache_dir
 
 
+def get_meta_cache_dir() -> Path:
+    """Get the path to the task metadata cache directory.
+
+    Returns:
+        Path to ~/.TaskRepo/meta_cache/
+    """
+    return get_taskrepo_dir() / "meta_cache"
+
+
 def get_legacy_config_path() -> Path:
     """Get the path to the legacy configuration file.
 
@@ -13,11 +13,22 @@ README files should display tasks in the same order as 'tsk list' command.
 """
 
 from datetime import datetime
-from typing import Any, Optional
+from operator import attrgetter
+from typing import Any, Callable, Optional
 
 from taskrepo.core.config import Config
 from taskrepo.core.task import Task
 
+# Sort order of priority, status and urgency values (lower sorts first)
+_PRIORITY_ORDER = {"H": 0, "M": 1, "L": 2}
+_STATUS_ORDER = {"pending": 0, "in-progress": 1, "completed": 2, "cancelled": 3}
+_URGENCY_ORDER = {
+    "critical": 0,  # Overdue or now
+    "high": 1,  # Today
+    "medium": 2,  # Soon (1 week)
+    "low": 3,  # Future
+}
+
 # Cache for effective due dates during a sort operation
 # Format: {task_id: effective_due_date}
 _effective_due_date_cache: dict[str, Optional[datetime]] = {}
@@ -164,6 +175,114 @@ def get_due_date_cluster(due_date: Optional[datetime]) -> int:
     return 2 + weeks  # 3 (1w) through 20 (18w+)
 
 
+def _due_timestamp(task: Task, effective_due: Optional[datetime]) -> float:
+    """Get the timestamp of a task's effective due date (inf if none).
+
+    Reuses the task's cached due_ts when the effective due date is its own.
+    """
+    if effective_due is None:
+        return float("inf")
+    if effective_due is task.due:
+        return task.due_ts
+    return effective_due.timestamp()
+
+
+def _compile_sort_field(field: str, config: Config, all_tasks: list[Task]) -> Callable[[Task], Any]:
+    """Build a key extractor for one configured sort field.
+
+    All string parsing (the '-' prefix, the assignee preference) happens here,
+    once per sort, so the returned callable only reads task attributes.
+
+    Args:
+        field: Field name (may have '-' prefix for descending)
+        config: Configuration object (for cluster_due_dates)
+        all_tasks: All tasks in the system (for effective due dates)
+
+    Returns:
+        Callable mapping a task to its sortable value, with descending order applied
+    """
+    descending = field.startswith("-")
+    field_name = field[1:] if descending else field
+
+    extract: Callable[[Task], Any]
+    if field_name == "priority":
+
+        def extract(task: Task) -> Any:
+            return _PRIORITY_ORDER.get(task.priority, 3)
+
+    elif field_name == "due":
+        cluster = config.cluster_due_dates
+
+        def extract(task: Task) -> Any:
+            # Completed/cancelled tasks should sort to bottom (treat as no due date)
+            if task.status in ("completed", "cancelled"):
+                return 99 if cluster else float("inf")
+            # Get effective due date (considering subtasks and dependencies)
+            effective_due = get_effective_due_date(task, all_tasks)
+            if cluster:
+                # Use cluster bucket instead of exact timestamp
+                return get_due_date_cluster(effective_due)
+            return _due_timestamp(task, effective_due)
+
+    elif field_name == "urgency":
+        from taskrepo.utils.countdown import calculate_countdown
+
+        def extract(task: Task) -> Any:
+            # Completed/cancelled tasks should sort to bottom
+            if task.status in ("completed", "cancelled"):
+                return 999
+            effective_due = get_effective_due_date(task, all_tasks)
+            if effective_due is None:
+                # No due date - least urgent
+                return 100
+            _, _, urgency_level = calculate_countdown(effective_due)
+            return _URGENCY_ORDER.get(urgency_level, 4)
+
+    elif field_name == "created":
+        extract = attrgetter("created_ts")
+
+    elif field_name == "modified":
+        extract = attrgetter("modified_ts")
+
+    elif field_name == "status":
+
+        def extract(task: Task) -> Any:
+            return _STATUS_ORDER.get(task.status, 4)
+
+    elif field_name == "title":
+        # Strings keep ascending order even when prefixed with '-'
+        return attrgetter("title_lower")
+
+    elif field_name == "project":
+        return attrgetter("project_lower")
+
+    elif field_name.startswith("assignee"):
+        # Format: "assignee" or "assignee:@username"
+        preferred_assignee = field_name.split(":", 1)[1] if ":" in field_name else None
+        preferred_lower = preferred_assignee.lower() if preferred_assignee else ""
+        # Descending reverses the priority group: 0->2, 1->1, 2->0
+        first, rest, last = (2, 1, 0) if descending else (0, 1, 2)
+
+        def extract_assignee(task: Task) -> tuple[int, str]:
+            if not task.assignees:
+                # No assignees - sort last
+                return (last, "")
+            if preferred_assignee and preferred_assignee in task.assignees:
+                # Use preferred assignee for secondary sort to treat all matching tasks equally
+                return (first, preferred_lower)
+            return (rest, task.assignees[0].lower())
+
+        return extract_assignee
+
+    else:
+        return lambda task: ""
+
+    # Numeric fields: negate for descending order (inf becomes -inf)
+    if descending:
+        return lambda task: -extract(task)
+    return extract
+
+
 def sort_tasks(tasks: list[Task], config: Config, all_tasks: Optional[list[Task]] = None) -> list[Task]:
     """Sort tasks according to configuration settings.
 
@@ -188,149 +307,25 @@ def sort_tasks(tasks: list[Task], config: Config, all_tasks: Optional[list[Task]
     if all_tasks is None:
         all_tasks = tasks
 
-    def get_field_value(task: Task, field: str) -> tuple[bool, Any]:
-        """Get sortable value for a field.
+    extractors = [_compile_sort_field(field, config, all_tasks) for field in config.sort_by]
 
-        Args:
-            task: Task to get value from
-            field: Field name (may have '-' prefix for descending)
+    # When clustering is enabled, add the exact effective due timestamp after all
+    # configured fields so they take precedence within the same bucket
+    if config.cluster_due_dates:
+        due_fields = [field for field in config.sort_by if field.lstrip("-") == "due"]
+        if due_fields:
+            sign = -1 if due_fields[-1].startswith("-") else 1
 
-        Returns:
-            Tuple of (is_descending, value)
-        """
-        # Handle descending order prefix
-        descending = field.startswith("-")
-        field_name = field[1:] if descending else field
+            def exact_due(task: Task) -> float:
+                return sign * _due_timestamp(task, get_effective_due_date(task, all_tasks))
 
-        if field_name == "priority":
-            priority_order = {"H": 0, "M": 1, "L": 2}
-            value = priority_order.get(task.priority, 3)
-        elif field_name == "due":
-            # Completed/cancelled tasks should sort to bottom (treat as no due date)
-            if task.status in ("completed", "cancelled"):
-                value = float("inf") if not config.cluster_due_dates else 99
-            else:
-                # Get effective due date (considering subtasks and dependencies)
-                effective_due = get_effective_due_date(task, all_tasks)
-
-                if config.cluster_due_dates:
-                    # Use cluster bucket instead of exact timestamp
-                    value = get_due_date_cluster(effective_due)
-                else:
-                    # Use exact timestamp
-                    value = effective_due.timestamp() if effective_due else float("inf")
-        elif field_name == "urgency":
-            # Sort by urgency level (overdue first, then today, then future)
-            # Completed/cancelled tasks should sort to bottom
-            if task.status in ("completed", "cancelled"):
-                value = 999
-            else:
-                # Get effective due date (considering subtasks and dependencies)
-                effective_due = get_effective_due_date(task, all_tasks)
-
-                if effective_due is None:
-                    # No due date - least urgent
-                    value = 100
-                else:
-                    from taskrepo.utils.countdown import calculate_countdown
-
-                    _, status, urgency_level = calculate_countdown(effective_due)
-
-                    # Map urgency to sort order (lower = more urgent, sorts first)
-                    urgency_order = {
-                        "critical": 0,  # Overdue or now
-                        "high": 1,  # Today
-                        "medium": 2,  # Soon (1 week)
-                        "low": 3,  # Future
-                    }
-                    value = urgency_order.get(urgency_level, 4)
-        elif field_name == "created":
-            value = task.created.timestamp()
-        elif field_name == "modified":
-            value = task.modified.timestamp()
-        elif field_name == "status":
-            status_order = {"pending": 0, "in-progress": 1, "completed": 2, "cancelled": 3}
-            value = status_order.get(task.status, 4)
-        elif field_name == "title":
-            value = task.title.lower()
-        elif field_name == "project":
-            value = (task.project or "").lower()
-        elif field_name.startswith("assignee"):
-            # Handle assignee sorting with optional preferred user
-            # Format: "assignee" or "assignee:@username"
-            preferred_assignee = None
-            if ":" in field_name:
-                # Extract preferred assignee (e.g., "assignee:@paxcalpt" -> "@paxcalpt")
-                preferred_assignee = field_name.split(":", 1)[1]
+            extractors.append(exact_due)
 
-            if not task.assignees:
-                # No assignees - sort last
-                value = (2, "")
-            elif preferred_assignee and preferred_assignee in task.assignees:
-                # Task has the preferred assignee - sort first
-                # Use preferred assignee for secondary sort to treat all matching tasks equally
-                value = (0, preferred_assignee.lower())
-            else:
-                # Task has assignees but not the preferred one (or no preference)
-                first_assignee = task.assignees[0].lower()
-                value = (1, first_assignee)
-        else:
-            value = ""
-
-        # Reverse for descending order
-        if descending:
-            if isinstance(value, (int, float)):
-                value = -value if value != float("inf") else float("-inf")
-            elif isinstance(value, str):
-                # For strings, we'll reverse the sort later
-                return (True, value)  # Flag as descending
-            elif isinstance(value, tuple):
-                # For tuple values (like assignee), reverse the priority order
-                if len(value) == 2 and isinstance(value[0], int):
-                    # Reverse priority group: 0->2, 1->1, 2->0
-                    return (True, (2 - value[0], value[1]))
-
-        return (False, value) if not descending else (True, value)
-
-    def get_sort_key(task: Task) -> tuple:
-        """Get sort key for a task.
-
-        Args:
-            task: Task to get sort key for
-
-        Returns:
-            Tuple of values to sort by
-        """
-        sort_fields = config.sort_by
-        key_parts = []
-        due_field_info = None  # Track due field for timestamp tiebreaker
-
-        for field in sort_fields:
-            is_desc, value = get_field_value(task, field)
-            key_parts.append(value)
-
-            # When clustering is enabled and this is the 'due' field,
-            # remember it for adding timestamp tiebreaker at the end
-            if config.cluster_due_dates and field.lstrip("-") == "due":
-                # Use effective due date for tiebreaker as well
-                effective_due = get_effective_due_date(task, all_tasks)
-                due_field_info = (field, effective_due)
-
-        # Add exact timestamp as final tiebreaker when clustering is enabled
-        # This ensures all configured sort fields take precedence within same bucket
-        if due_field_info:
-            field, due_date = due_field_info
-            exact_timestamp = due_date.timestamp() if due_date else float("inf")
-            # If descending, negate the timestamp
-            if field.startswith("-"):
-                exact_timestamp = -exact_timestamp if exact_timestamp != float("inf") else float("-inf")
-            key_parts.append(exact_timestamp)
-
-        # Add task ID as final tiebreaker to ensure deterministic sorting
-        # This prevents tasks with identical sort keys from appearing in random order
-        key_parts.append(task.id)
-
-        return tuple(key_parts)
-
-    # Sort all tasks using the configured sort order
-    return sorted(tasks, key=get_sort_key)
+    # Task ID as final tiebreaker keeps the order deterministic. Python's sort is stable, so
+    # sorting by each key from the least significant up orders tasks as one sort by the
+    # tuple of keys would, while each pass calls a single extractor per task and no key
+    # tuples are built.
+    ordered = sorted(tasks, key=attrgetter("id"))
+    for extract in reversed(extractors):
+        ordered.sort(key=extract)
+    return ordered
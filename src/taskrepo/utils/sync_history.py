@@ -8,6 +8,10 @@ import json
 from dataclasses import asdict, dataclass
 from pathlib import Path
 
+# Most recent entry per history file, keyed by the file's (mtime_ns, size) so a
+# write from any process is picked up on the next lookup
+_last_sync_memo: dict[Path, tuple[tuple[int, int], "SyncHistoryEntry | None"]] = {}
+
 
 @dataclass
 class SyncHistoryEntry:
@@ -154,6 +158,7 @@ class SyncHistory:
         # Write to file
         with open(self.history_file, "w") as f:
             json.dump(data, f, indent=2)
+        _last_sync_memo.clear()
 
     def load(self) -> None:
         """Load history from disk if available."""
@@ -181,6 +186,7 @@ class SyncHistory:
         self.entries = []
         if self.history_file.exists():
             self.history_file.unlink()
+        _last_sync_memo.clear()
 
     def format_last_sync(self) -> str:
         """Format the last sync entry as a human-readable string.
@@ -208,3 +214,25 @@ class SyncHistory:
                 return f"Sync failed {time_str} (1 repo)"
             else:
                 return f"Sync failed {time_str} ({failed_count} repos)"
+
+
+def get_last_sync_entry() -> SyncHistoryEntry | None:
+    """Get the most recent sync entry, re-reading the history file only when it changes.
+
+    Suited to callers polled on every redraw, such as the TUI status bar.
+
+    Returns:
+        Most recent sync entry, or None if there is no history
+    """
+    history_file = Path.home() / ".TaskRepo" / "sync_history.json"
+    try:
+        stat = history_file.stat()
+    except OSError:
+        return None
+
+    signature = (stat.st_mtime_ns, stat.st_size)
+    memo = _last_sync_memo.get(history_file)
+    if memo is None or memo[0] != signature:
+        memo = (signature, SyncHistory().get_last_sync())
+        _last_sync_memo[history_file] = memo
+    return memo[1]
@@ -0,0 +1,74 @@
+"""Tests for the top-level CLI group in taskrepo.cli.main."""
+
+import sys
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from taskrepo.cli.main import LAZY_SUBCOMMANDS, LazyContextObj, LazyGroup, cli
+
+
+def test_lazy_subcommands_listed_without_import():
+    ctx = cli.make_context("tsk", [], resilient_parsing=True)
+
+    names = cli.list_commands(ctx)
+
+    assert "del" in names
+    assert "init" in names
+    assert set(LAZY_SUBCOMMANDS) <= set(names)
+
+
+def test_lazy_subcommand_resolved_on_lookup():
+    ctx = cli.make_context("tsk", [], resilient_parsing=True)
+
+    cmd = cli.get_command(ctx, "del")
+
+    assert cmd is not None
+    assert "taskrepo.cli.commands.delete" in sys.modules
+    # Resolved command is registered so later lookups don't re-import
+    assert cli.commands["del"] is cmd
+
+
+def test_unknown_subcommand_returns_none():
+    ctx = cli.make_context("tsk", [], resilient_parsing=True)
+
+    assert cli.get_command(ctx, "no-such-command") is None
+
+
+def test_config_loaded_on_first_access():
+    with patch("taskrepo.cli.main.Config") as config_cls:
+        obj = LazyContextObj()
+        config_cls.assert_not_called()
+
+        config = obj["config"]
+
+        config_cls.assert_called_once_with()
+        assert obj["config"] is config
+
+
+def test_version_does_not_load_config():
+    runner = CliRunner()
+    with patch("taskrepo.cli.main.Config") as config_cls:
+        result = runner.invoke(cli, ["--version"])
+
+    assert result.exit_code == 0
+    config_cls.assert_not_called()
+
+
+def test_declared_short_help_matches_commands():
+    ctx = cli.make_context("tsk", [], resilient_parsing=True)
+
+    for name, (_module, _attr, short_help) in LAZY_SUBCOMMANDS.items():
+        cmd = cli.get_command(ctx, name)
+        assert cmd.get_short_help_str(limit=200) == short_help, name
+
+
+def test_help_renders_without_importing_commands():
+    group = LazyGroup(name="tsk", lazy_subcommands={"list": ("no.such.module", "list_tasks", "List tasks.")})
+    ctx = group.make_context("tsk", [], resilient_parsing=True)
+
+    with patch("taskrepo.cli.main.importlib.import_module") as import_module:
+        help_text = group.get_help(ctx)
+
+    import_module.assert_not_called()
+    assert "List tasks." in help_text
@@ -0,0 +1,59 @@
+"""Unit tests for Config loading and the parsed-config cache."""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from taskrepo.core.config import Config
+
+
+def test_config_reuses_cache_when_file_unchanged():
+    """Test that an unchanged config file is not re-parsed."""
+    with TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "config"
+        config_path.write_text("default_priority: H\n")
+
+        Config(config_path)  # Populates cache
+
+        with patch("taskrepo.core.config.yaml.safe_load") as safe_load:
+            config = Config(config_path)
+
+        safe_load.assert_not_called()
+        assert config.default_priority == "H"
+
+
+def test_config_cache_invalidated_by_external_edit():
+    """Test that editing the config file is picked up despite the cache."""
+    with TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "config"
+        config_path.write_text("default_priority: H\n")
+        Config(config_path)
+
+        config_path.write_text("default_priority: L\ndefault_status: in-progress\n")
+
+        config = Config(config_path)
+        assert config.default_priority == "L"
+        assert config.default_status == "in-progress"
+
+
+def test_config_cache_refreshed_on_save():
+    """Test that values set through Config are visible to new instances."""
+    with TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "config"
+        config = Config(config_path)
+
+        config.sort_by = ["due", "priority"]
+        config.sort_by = ["priority", "due"]  # Same file size as before
+
+        assert Config(config_path).sort_by == ["priority", "due"]
+
+
+def test_config_ignores_corrupt_cache():
+    """Test that a corrupt cache file falls back to parsing the config."""
+    with TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "config"
+        config_path.write_text("default_priority: H\n")
+        config = Config(config_path)
+        config._cache_path.write_text("{not json")
+
+        assert Config(config_path).default_priority == "H"
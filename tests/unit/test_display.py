@@ -1,6 +1,22 @@
 """Tests for display utilities."""
 
-from taskrepo.tui.display import display_width, pad_to_width, truncate_to_width
+from datetime import datetime
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+import wcwidth
+
+from taskrepo.core.config import Config
+from taskrepo.core.task import Task
+from taskrepo.tui.display import (
+    display_tasks_table,
+    display_width,
+    format_tree_title,
+    get_countdown_text,
+    pad_to_width,
+    truncate_to_width,
+)
 
 
 def test_display_width_basic_text():
@@ -93,3 +109,85 @@ def test_id_zero_padding_consistency():
     assert f"{99:03d}" == "099"
     assert f"{100:03d}" == "100"
     assert f"{999:03d}" == "999"
+
+
+def test_get_countdown_text_uses_given_now():
+    """Test that countdown text is computed relative to an explicit current time."""
+    now = datetime(2025, 11, 10, 10, 0)
+    assert get_countdown_text(datetime(2025, 11, 8, 10, 0), "pending", now) == ("-2d", "red")
+    assert get_countdown_text(datetime(2025, 11, 11, 10, 0), "pending", now) == ("tomorrow", "yellow")
+
+
+def test_display_tasks_table_counts_direct_subtasks():
+    """Test that tree titles in the task table show each task's direct subtask count."""
+    parent = Task(id="p", title="Parent")
+    child = Task(id="c", title="Child", parent="p")
+    tasks = [parent, child, Task(id="g", title="Grandchild", parent="c"), Task(id="s", title="Sibling", parent="p")]
+
+    with TemporaryDirectory() as tmpdir:
+        config = Config(Path(tmpdir) / "config")
+        with patch("taskrepo.tui.display.format_tree_title", wraps=format_tree_title) as fmt:
+            display_tasks_table(tasks, config, save_cache=False)
+
+    counts = {call.args[0]: call.args[4] for call in fmt.call_args_list}
+    assert counts == {"Parent": 2, "Child": 1, "Grandchild": 0, "Sibling": 0}
+
+
+def test_ascii_fast_path_matches_wcwidth():
+    """Test that the printable-ASCII shortcut agrees with the per-character width path."""
+    text = "Fix login bug (#42)"
+    assert display_width(text) == wcwidth.wcswidth(text) == len(text)
+    assert truncate_to_width(text, 10) == "Fix log..."
+    assert pad_to_width("abc", 6, align="right") == "   abc"
+    # Control characters fall through to the wcwidth path
+    assert display_width("a\x00b") == 2
+
+
+def test_display_tasks_table_renders_status_and_priority(capsys, monkeypatch):
+    """Test that status and priority markup renders as plain values in the task table."""
+    monkeypatch.setenv("COLUMNS", "200")
+    tasks = [Task(id="a", title="One", status="completed", priority="H"), Task(id="b", title="Two", priority="L")]
+
+    with TemporaryDirectory() as tmpdir:
+        display_tasks_table(tasks, Config(Path(tmpdir) / "config"), tree_view=False, save_cache=False)
+
+    output = capsys.readouterr().out
+    assert "completed" in output
+    assert "pending" in output
+    assert "[red]" not in output
+
+
+def test_display_tasks_table_reads_display_ids_once(capsys, monkeypatch):
+    """Test that the task table looks display IDs up in one map instead of per row."""
+    monkeypatch.setenv("COLUMNS", "200")
+    tasks = [Task(id="a" * 36, title="One"), Task(id="b" * 36, title="Two")]
+
+    with TemporaryDirectory() as tmpdir:
+        with patch("taskrepo.tui.display.load_uuid_to_display_id", return_value={"a" * 36: 7}) as load:
+            display_tasks_table(tasks, Config(Path(tmpdir) / "config"), tree_view=False, save_cache=False)
+
+    load.assert_called_once()
+    output = capsys.readouterr().out
+    assert "7" in output
+    assert "bbbbbbbb..." in output
+
+
+def test_display_tasks_table_formats_shared_countdowns_once(capsys, monkeypatch):
+    """Test that tasks sharing a due date and status share one countdown computation."""
+    monkeypatch.setenv("COLUMNS", "200")
+    due = datetime(2030, 1, 1)
+    tasks = [Task(id=f"t{i}", title=f"Task {i}", due=due) for i in range(3)]
+
+    with TemporaryDirectory() as tmpdir:
+        with patch("taskrepo.tui.display.get_countdown_text", wraps=get_countdown_text) as countdown:
+            display_tasks_table(tasks, Config(Path(tmpdir) / "config"), tree_view=False, save_cache=False)
+
+    countdown.assert_called_once()
+    assert capsys.readouterr().out.count("months") == 3
+
+
+def test_format_tree_title_prefixes():
+    """Test tree prefixes for top-level, direct and nested children."""
+    assert format_tree_title("Root", 0, True, [], 2) == "Root 📋 2"
+    assert format_tree_title("Child", 1, False, [True], 0) == "├─ Child"
+    assert format_tree_title("Leaf", 3, True, [True, False, True], 0) == "│     └─ Leaf"
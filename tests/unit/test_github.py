@@ -30,14 +30,19 @@ def test_check_gh_cli_installed():
 
 def test_check_gh_auth():
     """Test checking GitHub authentication status."""
-    with patch("subprocess.run") as mock_run:
+    with patch("subprocess.run") as mock_run, patch("taskrepo.utils.github._gh_authenticated", False):
+        # Test when not authenticated (not remembered, so a later login is seen)
+        mock_run.return_value = MagicMock(returncode=1)
+        assert check_gh_auth() is False
+
         # Test when authenticated
         mock_run.return_value = MagicMock(returncode=0)
         assert check_gh_auth() is True
+        assert mock_run.call_count == 2
 
-        # Test when not authenticated
-        mock_run.return_value = MagicMock(returncode=1)
-        assert check_gh_auth() is False
+        # A successful check is remembered for the rest of the process
+        assert check_gh_auth() is True
+        assert mock_run.call_count == 2
 
 
 def test_create_github_repo_not_installed():
@@ -0,0 +1,105 @@
+"""Unit tests for display ID mapping."""
+
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+import pytest
+
+from taskrepo.core.task import Task
+from taskrepo.utils.id_mapping import (
+    clear_id_cache,
+    get_cache_size,
+    get_display_id_from_uuid,
+    get_uuid_from_display_id,
+    save_id_cache,
+)
+
+
+def test_display_id_lookup_parses_cache_once():
+    """Test that repeated lookups reuse the parsed cache until it is rewritten."""
+    with TemporaryDirectory() as tmpdir:
+        cache_path = Path(tmpdir) / "id_cache.json"
+        with patch("taskrepo.utils.id_mapping.get_cache_path", return_value=cache_path):
+            save_id_cache([Task(id="uuid-a", title="A"), Task(id="uuid-b", title="B")])
+
+            with patch("taskrepo.utils.id_mapping.json.loads", wraps=json.loads) as load:
+                assert get_display_id_from_uuid("uuid-b") == 2
+                assert get_display_id_from_uuid("uuid-a") == 1
+                assert get_display_id_from_uuid("missing") is None
+            assert load.call_count == 1
+
+            save_id_cache([Task(id="uuid-b", title="B")])
+            assert get_display_id_from_uuid("uuid-b") == 1
+
+            clear_id_cache()
+            assert get_display_id_from_uuid("uuid-b") is None
+
+
+def test_uuid_lookup_parses_cache_once():
+    """Test that resolving several display IDs reads the cache file once."""
+    with TemporaryDirectory() as tmpdir:
+        cache_path = Path(tmpdir) / "id_cache.json"
+        with patch("taskrepo.utils.id_mapping.get_cache_path", return_value=cache_path):
+            assert get_uuid_from_display_id("1") is None
+
+            save_id_cache([Task(id="uuid-a", title="A"), Task(id="uuid-b", title="B")])
+            with patch("taskrepo.utils.id_mapping.json.loads", wraps=json.loads) as load:
+                assert get_uuid_from_display_id("2") == "uuid-b"
+                assert get_uuid_from_display_id("1") == "uuid-a"
+                assert get_uuid_from_display_id("3") is None
+            assert load.call_count == 1
+
+            save_id_cache([Task(id="uuid-b", title="B")])
+            assert get_uuid_from_display_id("1") == "uuid-b"
+
+
+def test_save_id_cache_keeps_old_cache_when_write_fails():
+    """Test that a failed write leaves the previous cache file intact."""
+    with TemporaryDirectory() as tmpdir:
+        cache_path = Path(tmpdir) / "id_cache.json"
+        with patch("taskrepo.utils.id_mapping.get_cache_path", return_value=cache_path):
+            save_id_cache([Task(id="uuid-a", title="A")])
+
+            with patch("taskrepo.utils.id_mapping.os.replace", side_effect=OSError("disk full")):
+                with pytest.raises(OSError):
+                    save_id_cache([Task(id="uuid-b", title="B")])
+
+            assert json.loads(cache_path.read_text())["1"]["uuid"] == "uuid-a"
+            assert list(Path(tmpdir).iterdir()) == [cache_path]
+
+
+def test_save_id_cache_skips_unchanged_mapping():
+    """Test that saving the same mapping again leaves the cache file untouched."""
+    with TemporaryDirectory() as tmpdir:
+        cache_path = Path(tmpdir) / "id_cache.json"
+        with patch("taskrepo.utils.id_mapping.get_cache_path", return_value=cache_path):
+            tasks = [Task(id="uuid-a", title="A"), Task(id="uuid-b", title="B")]
+            save_id_cache(tasks)
+            assert get_display_id_from_uuid("uuid-b") == 2
+
+            with patch("taskrepo.utils.id_mapping.os.replace") as replace:
+                save_id_cache(tasks)
+                save_id_cache(tasks, rebalance=False)
+            replace.assert_not_called()
+
+            save_id_cache(tasks[::-1])
+            assert get_display_id_from_uuid("uuid-b") == 1
+
+
+def test_missing_or_corrupt_cache_reads_as_empty():
+    """Test that readers treat a missing or corrupt cache file as empty."""
+    with TemporaryDirectory() as tmpdir:
+        cache_path = Path(tmpdir) / "id_cache.json"
+        with patch("taskrepo.utils.id_mapping.get_cache_path", return_value=cache_path):
+            assert get_cache_size() == 0
+            clear_id_cache()
+
+            cache_path.write_text("{not json")
+            assert get_cache_size() == 0
+            assert get_uuid_from_display_id("1") is None
+
+            save_id_cache([Task(id="uuid-a", title="A")], rebalance=False)
+            assert get_cache_size() == 1
+            assert get_uuid_from_display_id("1") == "uuid-a"
@@ -1,14 +1,22 @@
 """Unit tests for Repository and RepositoryManager."""
 
+import os
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 import pytest
 
-from taskrepo.core.repository import Repository, RepositoryManager
+from taskrepo.core.repository import Repository, RepositoryManager, get_manager
 from taskrepo.core.task import Task
 
 
+@pytest.fixture(autouse=True)
+def isolated_meta_cache(tmp_path, monkeypatch):
+    """Keep the persistent task metadata cache out of the real home directory."""
+    monkeypatch.setattr("taskrepo.core.repository.get_meta_cache_dir", lambda: tmp_path / "meta_cache")
+
+
 def test_repository_creation():
     """Test creating a repository."""
     with TemporaryDirectory() as tmpdir:
@@ -263,6 +271,56 @@ def test_repository_generate_readme():
         assert "_Last updated:" in readme_content
 
 
+def test_repository_generate_readme_subtask_counts():
+    """Test that the README shows each parent's direct subtask count."""
+    from taskrepo.core.config import Config
+
+    with TemporaryDirectory() as tmpdir:
+        repo_path = Path(tmpdir) / "tasks-test"
+        repo_path.mkdir()
+        repo = Repository(repo_path)
+        config = Config(Path(tmpdir) / ".taskreporc")
+
+        Task(id="001", title="Parent").save(repo_path)
+        Task(id="002", title="Child one", parent="001").save(repo_path)
+        Task(id="003", title="Child two", parent="001").save(repo_path)
+        Task(id="004", title="Grandchild", parent="002").save(repo_path)
+
+        readme_content = repo.generate_readme(config).read_text()
+
+        assert "Parent 📋 2" in readme_content
+        assert "Child one 📋 1" in readme_content
+        assert "Child two 📋" not in readme_content
+
+
+def test_repository_generate_archive_readme_rows_follow_edits():
+    """Test that archive README rows are reused but reflect edited tasks."""
+    from taskrepo.core.config import Config
+    from taskrepo.core.repository import _archive_readme_row
+
+    with TemporaryDirectory() as tmpdir:
+        repo_path = Path(tmpdir) / "tasks-test"
+        repo_path.mkdir()
+        repo = Repository(repo_path)
+        config = Config(Path(tmpdir) / ".taskreporc")
+
+        repo.save_task(Task(id="001", title="Old | title", status="completed", tags=["a"]))
+        repo.archive_task("001")
+
+        _archive_readme_row.cache_clear()
+        assert "Old \\| title" in repo.generate_archive_readme(config).read_text()
+        repo.generate_archive_readme(config)
+        assert _archive_readme_row.cache_info().hits == 1
+
+        task = repo.list_archived_tasks()[0]
+        task.title = "New title"
+        task.tags.append("b")
+        task.save(repo_path, subfolder="tasks/archive")
+        readme_content = repo.generate_archive_readme(config).read_text()
+        assert "New title" in readme_content
+        assert "| a, b |" in readme_content
+
+
 def test_repository_generate_readme_no_tasks():
     """Test generating README when there are no tasks."""
     from taskrepo.core.config import Config
@@ -460,3 +518,267 @@ def test_repository_manager_create_github_integration(monkeypatch):
         mock_create_github_repo.assert_called_once_with("testorg", "tasks-test-repo", "private")
         mock_setup_git_remote.assert_called_once()
         mock_push_to_remote.assert_called_once()
+
+
+def test_scan_for_task_repositories_overlapping_roots():
+    """Test scanning several overlapping roots in one walk."""
+    with TemporaryDirectory() as tmpdir:
+        home = Path(tmpdir)
+        code = home / "Code"
+        (code / "tasks-work").mkdir(parents=True)
+        (code / "a" / "b" / "tasks-deep").mkdir(parents=True)
+        (home / "tasks-personal").mkdir()
+        (home / ".hidden" / "tasks-secret").mkdir(parents=True)
+
+        found = RepositoryManager.scan_for_task_repositories(home, code, max_depth=2)
+
+        assert found[home] == ["personal"]
+        assert found[code] == ["work"]
+        # Depth 3 from home, but depth 2 from Code
+        assert found[code / "a" / "b"] == ["deep"]
+        assert all(".hidden" not in path.parts for path in found)
+
+
+def test_scan_for_task_repositories_missing_path():
+    """Test that missing search paths are skipped."""
+    with TemporaryDirectory() as tmpdir:
+        assert RepositoryManager.scan_for_task_repositories(Path(tmpdir) / "missing") == {}
+
+
+def test_repository_task_count():
+    """Test counting task files without parsing them."""
+    with TemporaryDirectory() as tmpdir:
+        repo_path = Path(tmpdir) / "tasks-test"
+        repo_path.mkdir()
+        repo = Repository(repo_path)
+
+        Task(id="001", title="Task 1").save(repo.path)
+        Task(id="002", title="Task 2").save(repo.path)
+        Task(id="003", title="Archived").save(repo.path)
+        repo.archive_task("003")
+        (repo.tasks_dir / "README.md").write_text("not a task")
+
+        assert repo.task_count() == 2
+
+
+def test_repository_manager_discover_names():
+    """Test discovering repository names without constructing repositories."""
+    with TemporaryDirectory() as tmpdir:
+        parent_dir = Path(tmpdir)
+        (parent_dir / "tasks-repo2").mkdir()
+        (parent_dir / "tasks-repo1").mkdir()
+        (parent_dir / "not-a-repo").mkdir()
+        (parent_dir / "tasks-file.txt").write_text("")
+
+        manager = RepositoryManager(parent_dir)
+
+        assert manager.discover_repository_names() == ["repo1", "repo2"]
+        assert not (parent_dir / "tasks-repo1" / ".git").exists()
+
+
+def test_repository_list_tasks_memoized():
+    """Test that list_tasks reuses its result until the task set changes."""
+    with TemporaryDirectory() as tmpdir:
+        repo_path = Path(tmpdir) / "tasks-test"
+        repo_path.mkdir()
+        repo = Repository(repo_path)
+        repo.save_task(Task(id="001", title="Task 1"))
+
+        first = repo.list_tasks()
+        with patch("taskrepo.core.repository._load_task_cached") as load:
+            second = repo.list_tasks()
+        load.assert_not_called()
+        assert [t.id for t in second] == [t.id for t in first]
+
+        # Returned lists are copies, so callers can't corrupt the cache
+        second.clear()
+        assert len(repo.list_tasks()) == 1
+
+        repo.save_task(Task(id="002", title="Task 2"))
+        assert [t.id for t in repo.list_tasks()] == ["001", "002"]
+
+        repo.archive_task("001")
+        assert [t.id for t in repo.list_tasks()] == ["002"]
+        assert [t.id for t in repo.list_tasks(include_archived=True)] == ["002", "001"]
+
+
+def test_repository_list_tasks_sees_in_place_edit():
+    """Test that a task file rewritten in place by another process invalidates the memo."""
+    with TemporaryDirectory() as tmpdir:
+        repo_path = Path(tmpdir) / "tasks-test"
+        repo_path.mkdir()
+        repo = Repository(repo_path)
+        task_file = repo.save_task(Task(id="001", title="Old title", tags=["old"]))
+        assert [t.title for t in repo.list_tasks()] == ["Old title"]
+        assert repo.get_tags() == ["old"]
+
+        # Another process edits the file in place; the directory mtime stays the same
+        dir_st = repo.tasks_dir.stat()
+        task_file.write_text(Task(id="001", title="New title", tags=["new"]).to_markdown())
+        os.utime(repo.tasks_dir, ns=(dir_st.st_atime_ns, dir_st.st_mtime_ns))
+
+        assert [t.title for t in repo.list_tasks()] == ["New title"]
+        assert repo.get_tags() == ["new"]
+
+
+def test_repository_summarize():
+    """Test collecting projects, assignees and tags in one pass."""
+    with TemporaryDirectory() as tmpdir:
+        repo_path = Path(tmpdir) / "tasks-test"
+        repo_path.mkdir()
+        repo = Repository(repo_path)
+        repo.save_task(Task(id="001", title="A", project="web", assignees=["@bob"], tags=["ui", "bug"]))
+        repo.save_task(Task(id="002", title="B", assignees=["@alice", "@bob"], tags=["bug"]))
+
+        assert repo.summarize() == {"projects": ["web"], "assignees": ["@alice", "@bob"], "tags": ["bug", "ui"]}
+        assert repo.get_tags() == ["bug", "ui"]
+
+
+def test_repository_git_opened_lazily():
+    """Test that git is only initialized when git_repo is first accessed."""
+    with TemporaryDirectory() as tmpdir:
+        repo_path = Path(tmpdir) / "tasks-test"
+        repo_path.mkdir()
+        repo = Repository(repo_path)
+
+        repo.list_tasks()
+        assert not (repo_path / ".git").exists()
+
+        assert repo.git_repo is repo.git_repo
+        assert (repo_path / ".git").exists()
+
+
+def test_repository_get_task_sees_same_mtime_rewrite():
+    """Test that the task cache notices a rewrite that keeps the mtime."""
+    with TemporaryDirectory() as tmpdir:
+        repo_path = Path(tmpdir) / "tasks-test"
+        repo_path.mkdir()
+        repo = Repository(repo_path)
+        task_file = repo.save_task(Task(id="001", title="Short"))
+        st = task_file.stat()
+        assert repo.get_task("001").title == "Short"
+
+        Task(id="001", title="Much longer title").save(repo.path)
+        os.utime(task_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert repo.get_task("001").title == "Much longer title"
+
+
+def test_repository_manager_discover_cached():
+    """Test that discovery reuses Repository objects until parent_dir changes."""
+    with TemporaryDirectory() as tmpdir:
+        parent_dir = Path(tmpdir)
+        (parent_dir / "tasks-repo1").mkdir()
+        manager = RepositoryManager(parent_dir)
+
+        first = manager.discover_repositories()
+        assert manager.discover_repositories()[0] is first[0]
+
+        manager.create_repository("repo2")
+        assert [r.name for r in manager.discover_repositories()] == ["repo1", "repo2"]
+
+
+def test_repository_str_does_not_parse_tasks():
+    """Test that str(repo) counts task files without loading them."""
+    with TemporaryDirectory() as tmpdir:
+        repo_path = Path(tmpdir) / "tasks-test"
+        repo_path.mkdir()
+        repo = Repository(repo_path)
+        repo.save_task(Task(id="001", title="Task 1"))
+
+        with patch("taskrepo.core.repository._load_task_cached") as load:
+            assert str(repo) == "test (1 tasks)"
+        load.assert_not_called()
+
+
+def test_get_manager_shares_live_instances():
+    """Test that get_manager returns the live manager for the same directory."""
+    with TemporaryDirectory() as tmpdir:
+        parent_dir = Path(tmpdir)
+        manager = get_manager(parent_dir)
+
+        assert get_manager(parent_dir / ".") is manager
+        assert get_manager(parent_dir / "other") is not manager
+
+
+def test_repository_list_tasks_parallel_load_keeps_order():
+    """Test that large repositories load in filename order and skip bad files."""
+    with TemporaryDirectory() as tmpdir:
+        repo_path = Path(tmpdir) / "tasks-test"
+        repo_path.mkdir()
+        repo = Repository(repo_path)
+        for i in range(40):
+            repo.save_task(Task(id=f"{i:03d}", title=f"Task {i}"))
+        (repo.tasks_dir / "task-020x.md").write_text("no frontmatter")
+
+        tasks = repo.list_tasks(silent_errors=True)
+
+        assert [t.id for t in tasks] == [f"{i:03d}" for i in range(40)]
+
+
+def test_repository_meta_cache_skips_unchanged_files():
+    """Test that the persistent metadata cache avoids re-parsing unchanged tasks."""
+    with TemporaryDirectory() as tmpdir:
+        repo_path = Path(tmpdir) / "tasks-test"
+        repo_path.mkdir()
+        repo = Repository(repo_path)
+        repo.save_task(Task(id="001", title="A", project="web", tags=["ui"]))
+
+        with patch("taskrepo.core.repository.get_meta_cache_dir", return_value=Path(tmpdir) / "cache"):
+            assert Repository(repo_path).get_projects() == ["web"]
+
+            with patch("taskrepo.core.task.Task.load_metadata_only") as load:
+                assert Repository(repo_path).get_tags() == ["ui"]
+            load.assert_not_called()
+
+            Task(id="001", title="A", project="api").save(repo_path)
+            assert Repository(repo_path).get_projects() == ["api"]
+
+
+def test_repository_list_tasks_reports_failures(capsys):
+    """Test load warnings per file, or as one summary when silent."""
+    with TemporaryDirectory() as tmpdir:
+        repo_path = Path(tmpdir) / "tasks-test"
+        repo_path.mkdir()
+        repo = Repository(repo_path)
+        (repo.tasks_dir / "task-bad.md").write_text("no frontmatter")
+
+        repo.list_tasks()
+        assert "Warning: Failed to load task task-bad.md: Invalid task format" in capsys.readouterr().out
+
+        repo.invalidate()
+        repo.list_tasks(silent_errors=True)
+        assert capsys.readouterr().out == "Warning: Failed to load 1 task(s) in test repository\n"
+
+
+def test_discovered_repository_creates_dirs_on_demand():
+    """Test that discovered repositories create tasks/ and archive/ only when writing."""
+    with TemporaryDirectory() as tmpdir:
+        parent_dir = Path(tmpdir)
+        (parent_dir / "tasks-bare").mkdir()
+
+        (repo,) = RepositoryManager(parent_dir).discover_repositories()
+        assert repo.list_tasks() == []
+        assert not repo.tasks_dir.exists()
+
+        repo.save_task(Task(id="001", title="Task 1"))
+        assert repo.archive_task("001")
+        assert [t.id for t in repo.list_archived_tasks()] == ["001"]
+
+
+def test_repository_summarize_cached():
+    """Test that summarize() is reused until the task set changes."""
+    with TemporaryDirectory() as tmpdir:
+        repo_path = Path(tmpdir) / "tasks-test"
+        repo_path.mkdir()
+        repo = Repository(repo_path)
+        repo.save_task(Task(id="001", title="A", tags=["ui"]))
+        assert repo.get_tags() == ["ui"]
+
+        with patch.object(repo, "_list_task_meta") as list_meta:
+            assert repo.get_tags() == ["ui"]
+            assert repo.get_projects() == []
+        list_meta.assert_not_called()
+
+        repo.save_task(Task(id="002", title="B", tags=["api"]))
+        assert repo.get_tags() == ["api", "ui"]
@@ -739,3 +739,27 @@ def test_display_tree_view_does_not_modify_config():
         assert config_reloaded.sort_by == original_sort_by, (
             f"Config was modified! Expected {original_sort_by}, got {config_reloaded.sort_by}"
         )
+
+
+def test_sort_tasks_descending_fields():
+    """Test descending numeric fields reverse order while ties fall back to task ID."""
+    from datetime import datetime, timedelta
+
+    from taskrepo.utils.sorting import sort_tasks
+
+    now = datetime.now()
+    tasks = [
+        Task(id="b", title="B", priority="H", due=now + timedelta(days=1)),
+        Task(id="a", title="A", priority="H", due=now + timedelta(days=1)),
+        Task(id="c", title="C", priority="L", due=now + timedelta(days=9)),
+        Task(id="d", title="D", priority="M"),
+    ]
+
+    with TemporaryDirectory() as tmpdir:
+        config = Config(Path(tmpdir) / "config")
+
+        config.sort_by = ["-priority"]
+        assert [t.id for t in sort_tasks(tasks, config)] == ["c", "d", "a", "b"]
+
+        config.sort_by = ["-due", "title"]
+        assert [t.id for t in sort_tasks(tasks, config)] == ["d", "c", "a", "b"]
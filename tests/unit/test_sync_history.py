@@ -0,0 +1,22 @@
+"""Unit tests for sync history tracking."""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from taskrepo.utils.sync_history import SyncHistory, get_last_sync_entry
+
+
+def test_last_sync_entry_rereads_only_changed_history():
+    """Test that the last sync entry is parsed once per history file version."""
+    with TemporaryDirectory() as tmpdir, patch("pathlib.Path.home", return_value=Path(tmpdir)):
+        assert get_last_sync_entry() is None
+
+        SyncHistory().add_entry(success=True, repos_synced=["work"])
+        first = get_last_sync_entry()
+        with patch.object(SyncHistory, "load") as load:
+            assert get_last_sync_entry() is first
+        load.assert_not_called()
+
+        SyncHistory().add_entry(success=False, repos_failed=["work"])
+        assert get_last_sync_entry().success is False
@@ -253,3 +253,82 @@ def test_task_validate_url():
     assert Task.validate_url("ftp://example.com") is False
     assert Task.validate_url("github.com") is False
     assert Task.validate_url("") is False
+
+
+def test_task_load_metadata_only():
+    """Test loading aggregator fields without the markdown body."""
+    with TemporaryDirectory() as tmpdir:
+        task = Task(id="001", title="Test", project="web", assignees=["@bob"], tags=["ui"], description="Body")
+        task_file = task.save(Path(tmpdir))
+
+        meta = Task.load_metadata_only(task_file)
+
+        assert meta.id == "001"
+        assert meta.project == "web"
+        assert meta.assignees == ["@bob"]
+        assert meta.tags == ["ui"]
+
+
+def test_task_load_metadata_only_missing_frontmatter():
+    """Test that files without frontmatter are rejected."""
+    with TemporaryDirectory() as tmpdir:
+        task_file = Path(tmpdir) / "task-001.md"
+        task_file.write_text("Just a body\n")
+
+        with pytest.raises(ValueError, match="frontmatter not found"):
+            Task.load_metadata_only(task_file)
+
+
+def test_task_load_matches_from_markdown():
+    """Test that streaming load agrees with parsing the whole file."""
+    with TemporaryDirectory() as tmpdir:
+        task = Task(id="001", title="Test", tags=["a"], description="Intro\n\n---\n\nAfter a rule")
+        task_file = task.save(Path(tmpdir))
+
+        loaded = Task.load(task_file, repo="r")
+
+        assert loaded == Task.from_markdown(task_file.read_text(), "001", repo="r")
+        assert loaded.description == "Intro\n\n---\n\nAfter a rule"
+
+
+def test_task_load_metadata_only_matches_full_load():
+    """Test that the partial frontmatter parse agrees with a full load."""
+    with TemporaryDirectory() as tmpdir:
+        tasks = [
+            Task(id="001", title="Plain"),
+            Task(id="002", title="x: " * 40, project="a: b", assignees=["@bob", "@alice"], tags=["- dash", "#hash"]),
+            Task(id="003", title="Links", links=["https://example.com"], depends=["001"], parent="001", tags=["t"]),
+        ]
+        for task in tasks:
+            task_file = task.save(Path(tmpdir))
+            loaded = Task.load(task_file)
+
+            meta = Task.load_metadata_only(task_file)
+
+            assert (meta.id, meta.project, meta.assignees, meta.tags) == (
+                loaded.id,
+                loaded.project,
+                loaded.assignees,
+                loaded.tags,
+            )
+
+
+def test_task_cached_sort_attributes_follow_field_changes():
+    """Test cached sort attributes are recomputed after their field is reassigned."""
+    from datetime import datetime
+
+    task = Task(id="001", title="Write Docs", project="Web", due=datetime(2030, 1, 1))
+    assert task.title_lower == "write docs"
+    assert task.project_lower == "web"
+    assert task.due_ts == datetime(2030, 1, 1).timestamp()
+
+    task.title = "Ship IT"
+    task.project = None
+    task.due = None
+    task.modified = datetime(2031, 1, 1)
+
+    assert task.title_lower == "ship it"
+    assert task.project_lower == ""
+    assert task.due_ts is None
+    assert task.modified_ts == datetime(2031, 1, 1).timestamp()
+    assert task == Task(id="001", title="Ship IT", created=task.created, modified=datetime(2031, 1, 1), project=None)
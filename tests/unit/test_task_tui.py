@@ -0,0 +1,695 @@
+"""Unit tests for TaskTUI view state and caching."""
+
+import asyncio
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import AsyncMock, PropertyMock, patch
+
+import pytest
+
+from taskrepo.core.config import Config
+from taskrepo.core.repository import Repository
+from taskrepo.core.task import Task
+from taskrepo.tui.display import build_task_tree
+from taskrepo.tui.task_tui import (
+    TaskTUI,
+    _column_widths,
+    _ColumnWidths,
+    _countdown_cell,
+    _format_display_id,
+    _is_task_file_change,
+    _layout_dims,
+    _poll_interval,
+    _priority_cell,
+    _scroll_indicator,
+    _status_cell,
+    _task_list_header,
+    _task_list_header_lines,
+)
+
+
+def _make_tui(tmpdir: str, titles: list[str]) -> tuple[TaskTUI, Repository]:
+    repo_path = Path(tmpdir) / "tasks-work"
+    repo_path.mkdir()
+    repo = Repository(repo_path)
+    for title in titles:
+        repo.save_task(Task(id=repo.next_task_id(), title=title, repo="work"))
+    config = Config(Path(tmpdir) / "config")
+    return TaskTUI(config, [repo]), repo
+
+
+def test_filtered_tasks_memoized_between_redraws():
+    """Test that unchanged view state reuses the filtered task list."""
+    with TemporaryDirectory() as tmpdir:
+        tui, repo = _make_tui(tmpdir, ["Alpha", "Beta"])
+        first = tui._get_filtered_tasks()
+
+        with patch.object(repo, "list_tasks") as list_tasks:
+            second = tui._get_filtered_tasks()
+
+        list_tasks.assert_not_called()
+        assert second is first
+
+
+def test_typing_filter_does_not_reload_tasks():
+    """Test that each filter keystroke is answered from the loaded tasks without touching the repositories."""
+    with TemporaryDirectory() as tmpdir:
+        tui, repo = _make_tui(tmpdir, ["Alpha", "Beta", "Alphabet"])
+        tui._get_filtered_tasks()
+
+        with patch.object(repo, "list_tasks") as list_tasks:
+            for query in ["a", "al", "alp", "alph", "al", ""]:
+                tui.filter_text = query
+                tui._get_filtered_tasks()
+
+        list_tasks.assert_not_called()
+        tui.filter_text = "alph"
+        assert sorted(t.title for t in tui._get_filtered_tasks()) == ["Alpha", "Alphabet"]
+
+
+def test_filtered_tasks_recomputed_on_filter_change():
+    """Test that changing the filter text invalidates the memo."""
+    with TemporaryDirectory() as tmpdir:
+        tui, _repo = _make_tui(tmpdir, ["Alpha", "Beta"])
+        assert len(tui._get_filtered_tasks()) == 2
+
+        tui.filter_text = "alp"
+
+        assert [t.title for t in tui._get_filtered_tasks()] == ["Alpha"]
+
+
+def test_filter_is_case_insensitive_and_literal():
+    """Test that the text filter ignores case and treats regex characters literally."""
+    with TemporaryDirectory() as tmpdir:
+        tui, _repo = _make_tui(tmpdir, ["Fix C++ build", "Write docs"])
+
+        tui.filter_text = "c++"
+        assert [t.title for t in tui._get_filtered_tasks()] == ["Fix C++ build"]
+
+        tui.filter_text = "WRITE"
+        assert [t.title for t in tui._get_filtered_tasks()] == ["Write docs"]
+
+
+def test_terminal_size_cached_until_next_render():
+    """Test that the terminal size is queried once per frame."""
+    with TemporaryDirectory() as tmpdir:
+        tui, _repo = _make_tui(tmpdir, [])
+        tui._on_before_render(tui.app)
+
+        with patch("taskrepo.tui.task_tui.os.get_terminal_size", return_value=os.terminal_size((100, 50))) as size:
+            tui._get_terminal_size()
+            assert tui._get_terminal_size() == (50, 100)
+            assert size.call_count == 1
+
+            tui._on_before_render(tui.app)
+            tui._get_terminal_size()
+            assert size.call_count == 2
+
+
+def test_status_info_built_once_per_frame():
+    """Test that the status line is computed once per frame and refreshed on the next."""
+    with TemporaryDirectory() as tmpdir:
+        tui, _repo = _make_tui(tmpdir, [])
+        tui._on_before_render(tui.app)
+
+        with patch.object(tui, "_compute_status_info", return_value=()) as compute:
+            tui._calculate_status_bar_height()
+            tui._get_status_bar_text()
+            tui._update_viewport_dims()
+            assert compute.call_count == 1
+
+            tui._on_before_render(tui.app)
+            tui._get_status_bar_text()
+            assert compute.call_count == 2
+
+
+def test_repositories_mtime_sees_in_place_edits():
+    """Test that rewriting a task file in place is detected as a change."""
+    with TemporaryDirectory() as tmpdir:
+        tui, repo = _make_tui(tmpdir, ["Alpha"])
+        task_file = next(repo.tasks_dir.glob("task-*.md"))
+        baseline = tui._get_repositories_mtime()
+
+        os.utime(task_file, (baseline + 10, baseline + 10))
+
+        assert tui._get_repositories_mtime() == baseline + 10
+
+
+def test_watch_filter_accepts_only_task_files():
+    """Test that the file watcher ignores non-task files."""
+    assert _is_task_file_change(None, "/repos/tasks-work/tasks/task-0001.md")
+    assert not _is_task_file_change(None, "/repos/tasks-work/tasks/.task-0001.md.swp")
+    assert not _is_task_file_change(None, "/repos/tasks-work/README.md")
+
+
+def test_filter_matches_fields_but_not_across_them():
+    """Test that the search blob covers every field without joining neighbours."""
+    with TemporaryDirectory() as tmpdir:
+        tui, repo = _make_tui(tmpdir, [])
+        repo.save_task(Task(id=repo.next_task_id(), title="Ship", project="Launch", tags=["urgent"], repo="work"))
+
+        tui.filter_text = "URGENT"
+        assert [t.title for t in tui._get_filtered_tasks()] == ["Ship"]
+
+        tui.filter_text = "shiplaunch"
+        assert tui._get_filtered_tasks() == []
+
+
+def test_view_items_reuse_loaded_tasks():
+    """Test that switching view modes does not reload tasks from the repositories."""
+    with TemporaryDirectory() as tmpdir:
+        tui, repo = _make_tui(tmpdir, [])
+        repo.save_task(Task(id=repo.next_task_id(), title="A", project="web", assignees=["@alice"], repo="work"))
+        tui._invalidate_task_caches()
+        tui._get_filtered_tasks()
+
+        with patch.object(repo, "list_tasks") as list_tasks:
+            tui.view_mode = "project"
+            assert tui._build_view_items() == ["web"]
+            tui.view_mode = "assignee"
+            assert tui._build_view_items() == ["@alice"]
+
+        list_tasks.assert_not_called()
+
+
+def test_tree_rows_follow_filtered_task_order():
+    """Test that tree rows are built once and match the filtered task order."""
+    with TemporaryDirectory() as tmpdir:
+        tui, repo = _make_tui(tmpdir, [])
+        parent = Task(id=repo.next_task_id(), title="Parent", repo="work")
+        repo.save_task(parent)
+        repo.save_task(Task(id=repo.next_task_id(), title="Child", parent=parent.id, repo="work"))
+        tui._invalidate_task_caches()
+
+        with patch("taskrepo.tui.task_tui.build_task_tree", wraps=build_task_tree) as build:
+            rows = tui._get_filtered_rows()
+            tui._get_task_list_text()
+
+        build.assert_called_once()
+        assert [row[0] for row in rows] == tui._get_filtered_tasks()
+        assert [(row[0].title, row[1]) for row in rows] == [("Parent", 0), ("Child", 1)]
+        assert all(isinstance(row[3], tuple) for row in rows)
+
+
+def test_display_ids_read_once_per_reload():
+    """Test that rendering looks up display IDs without re-reading the ID cache."""
+    with TemporaryDirectory() as tmpdir:
+        tui, _repo = _make_tui(tmpdir, ["Alpha", "Beta"])
+        task_ids = [t.id for t in tui._get_filtered_tasks()]
+        id_map = {task_ids[0]: 1, task_ids[1]: 2}
+
+        with patch("taskrepo.tui.task_tui.load_uuid_to_display_id", return_value=id_map) as load:
+            tui._get_task_list_text()
+            tui._get_task_detail_text()
+            tui._get_task_detail_text()
+
+        load.assert_called_once()
+        assert tui._get_display_id(task_ids[1]) == 2
+
+
+def test_detail_text_shows_markup_characters_literally():
+    """Test that task fields are not interpreted as markup in the detail panel."""
+    with TemporaryDirectory() as tmpdir:
+        tui, _repo = _make_tui(tmpdir, ["Compare <a> & <b>"])
+
+        text = "".join(fragment[1] for fragment in tui._get_task_detail_text())
+
+        assert "Compare <a> & <b>" in text
+
+
+def test_status_bar_reparsed_only_when_text_changes():
+    """Test that an unchanged status bar reuses the parsed markup."""
+    with TemporaryDirectory() as tmpdir:
+        tui, _repo = _make_tui(tmpdir, [])
+
+        first = tui._get_status_bar_text()
+        assert tui._get_status_bar_text() is first
+
+        tui.conflicted_repos.add("work")
+        tui._on_before_render(tui.app)
+        assert tui._get_status_bar_text() is not first
+
+
+def test_current_repo_follows_view_index():
+    """Test that the current repository is resolved by name in repo mode."""
+    with TemporaryDirectory() as tmpdir:
+        tui, repo = _make_tui(tmpdir, [])
+        assert tui._get_current_repo() is None
+
+        tui.current_view_idx = tui.view_items.index("work")
+
+        assert tui._get_current_repo() is repo
+
+
+def test_subtask_counts_scoped_to_repository():
+    """Test that subtask counts only include children in the same repository."""
+    with TemporaryDirectory() as tmpdir:
+        tui, repo = _make_tui(tmpdir, [])
+        parent = Task(id=repo.next_task_id(), title="Parent", repo="work")
+        repo.save_task(parent)
+        for title in ("One", "Two"):
+            repo.save_task(Task(id=repo.next_task_id(), title=title, parent=parent.id, repo="work"))
+        tui._invalidate_task_caches()
+
+        assert tui._get_subtask_count("work", parent.id) == 2
+        assert tui._get_subtask_count("other", parent.id) == 0
+
+
+def test_auto_reload_keeps_unchanged_repositories():
+    """Test that an auto-reload only replaces repositories whose task files changed."""
+    with TemporaryDirectory() as tmpdir:
+        other_path = Path(tmpdir) / "tasks-home"
+        other_path.mkdir()
+        other = Repository(other_path)
+        other.save_task(Task(id=other.next_task_id(), title="Groceries", repo="home"))
+        tui, repo = _make_tui(tmpdir, ["Alpha"])
+        tui.config.parent_dir = Path(tmpdir)
+        tui._reload_repositories()
+        home, work = sorted(tui.repositories, key=lambda r: r.name)
+
+        task_file = next(work.tasks_dir.glob("task-*.md"))
+        os.utime(task_file, (tui.last_mtime + 10, tui.last_mtime + 10))
+        with patch("taskrepo.tui.task_tui.save_id_cache"):
+            tui._reload_from_disk()
+
+        reloaded = {r.name: r for r in tui.repositories}
+        assert reloaded["home"] is home
+        assert reloaded["work"] is not work
+        assert sorted(t.title for t in tui._get_all_tasks()) == ["Alpha", "Groceries"]
+
+
+def test_poll_interval_backs_off_to_a_cap():
+    """Test that idle polling slows down exponentially up to the maximum."""
+    assert _poll_interval(0) == 0.5
+    assert _poll_interval(2) == 2.0
+    assert _poll_interval(5) == 10.0
+    assert _poll_interval(1000) == 10.0
+
+
+def test_layout_dims_bounds():
+    """Test viewport and detail panel sizing at small and large terminal heights."""
+    assert _layout_dims(20, 2) == (6, 2, 8)
+    assert _layout_dims(40, 2) == (18, 5, 12)
+    assert _layout_dims(200, 4) == (50, 5, 15)
+
+
+def test_all_view_sorted_once_per_reload():
+    """Test that the unfiltered "All" view is not re-sorted after a filter is cleared."""
+    with TemporaryDirectory() as tmpdir:
+        tui, _repo = _make_tui(tmpdir, ["Alpha", "Beta"])
+        rows = tui._get_filtered_rows()
+        tui.filter_text = "alp"
+        tui._get_filtered_rows()
+        tui.filter_text = ""
+
+        with patch("taskrepo.tui.task_tui.sort_tasks") as sort:
+            assert tui._get_filtered_rows() is rows
+
+        sort.assert_not_called()
+
+
+def test_unchanged_rows_reused_between_redraws():
+    """Test that only rows whose selection changed are rebuilt on the next frame."""
+    with TemporaryDirectory() as tmpdir:
+        tui, _repo = _make_tui(tmpdir, ["Alpha", "Beta", "Gamma"])
+        first = tui._get_task_list_text()
+
+        tui.selected_row = 1
+        with patch.object(tui, "_build_row_fragments", wraps=tui._build_row_fragments) as build:
+            second = tui._get_task_list_text()
+
+        assert build.call_count == 2
+        assert "".join(f[1] for f in first) != "".join(f[1] for f in second)
+
+
+def test_selected_row_matches_unselected_layout():
+    """Test that the selected row is one fragment with the same text as its unselected form."""
+    with TemporaryDirectory() as tmpdir:
+        tui, _repo = _make_tui(tmpdir, ["Alpha 🚀", "Beta"])
+        tui.multi_selected.add(tui._get_filtered_tasks()[0].id)
+        task, depth, is_last, ancestors = tui._get_filtered_rows()[0]
+        widths = _column_widths(120, (False, False, False))
+        args = (task, depth, is_last, ancestors, 0, 1)
+        rest = (widths, (False, False, False), ("", "2 days".ljust(widths.countdown)))
+
+        unselected = tui._build_row_fragments(*args, False, True, *rest)
+        selected = tui._build_row_fragments(*args, True, True, *rest)
+
+        assert unselected[0][0] == "class:id" and unselected[0][1].startswith(" ")
+        assert selected == [("class:selected", ">" + "".join(text for _, text in unselected)[1:])]
+
+
+def test_unchanged_frame_reuses_task_list_text():
+    """Test that a redraw with unchanged list inputs returns the previous text without visiting rows."""
+    with TemporaryDirectory() as tmpdir:
+        tui, _repo = _make_tui(tmpdir, ["Alpha", "Beta", "Gamma"])
+        first = tui._get_task_list_text()
+
+        with patch.object(tui, "_get_display_id") as get_display_id:
+            assert tui._get_task_list_text() is first
+        get_display_id.assert_not_called()
+
+        tui.multi_selected.add(tui._get_filtered_tasks()[0].id)
+        assert tui._get_task_list_text() is not first
+
+
+def test_status_and_priority_cells():
+    """Test the padded, styled status and priority cells of the task list."""
+    assert _status_cell("in-progress", 7) == ("class:status-in-progress", "progres ")
+    assert _status_cell("blocked", 4) == ("", "bloc ")
+    assert _priority_cell("H", 3) == ("class:priority-high", "H   ")
+
+
+def test_task_list_header_omits_hidden_columns():
+    """Test that the header leaves out hidden columns and pads the rest to their widths."""
+    widths = _ColumnWidths(4, 8, 5, 0, 7, 3, 7, 5, 10, 9)
+
+    header = _task_list_header(widths, (False, True, False))
+
+    assert header == "ID   Title    Repo  Status  P   Assign  Tags  Due           Count    "
+    assert _task_list_header(widths, (False, True, False)) is header
+
+    header_line, divider_line, table_width = _task_list_header_lines(widths, (False, True, False))
+    assert header_line == header + "\n"
+    assert divider_line == "─" * table_width + "\n"
+    assert table_width == len(header)
+
+
+def test_list_texts_joined_once_per_reload():
+    """Test that assignee and tag text is reused until the task caches are invalidated."""
+    with TemporaryDirectory() as tmpdir:
+        tui, repo = _make_tui(tmpdir, [])
+        task = Task(id=repo.next_task_id(), title="A", assignees=["@alice", "@bob"], repo="work")
+
+        assert tui._get_list_texts(task) == ("@alice, @bob", "-")
+        task.tags.append("urgent")
+        assert tui._get_list_texts(task) == ("@alice, @bob", "-")
+
+        tui._invalidate_task_caches()
+        assert tui._get_list_texts(task) == ("@alice, @bob", "urgent")
+
+
+def test_reload_rebuilds_only_edited_rows():
+    """Test that rows of tasks whose files did not change survive an auto-reload."""
+    with TemporaryDirectory() as tmpdir:
+        tui, repo = _make_tui(tmpdir, ["Alpha", "Beta", "Gamma"])
+        tui.config.parent_dir = Path(tmpdir)
+        tui._reload_repositories()
+        tui.selected_row = -1
+        tui._get_task_list_text()
+
+        task_file = next(repo.tasks_dir.glob("task-*.md"))
+        os.utime(task_file, (tui.last_mtime + 10, tui.last_mtime + 10))
+        with patch("taskrepo.tui.task_tui.save_id_cache"):
+            tui._reload_from_disk()
+        with patch.object(tui, "_build_row_fragments", wraps=tui._build_row_fragments) as build:
+            text = "".join(fragment[1] for fragment in tui._get_task_list_text())
+
+        assert build.call_count == 1
+        assert all(title in text for title in ("Alpha", "Beta", "Gamma"))
+
+
+def test_viewport_clamped_when_list_shrinks():
+    """Test that a viewport left past the end of the list is pulled back onto the tasks."""
+    with TemporaryDirectory() as tmpdir:
+        tui, _repo = _make_tui(tmpdir, ["Alpha", "Beta"])
+        tui.viewport_top = 10
+        tui.selected_row = 1
+
+        text = "".join(fragment[1] for fragment in tui._get_task_list_text())
+
+        assert tui.viewport_top == 0
+        assert "Alpha" in text and "Beta" in text
+
+
+def test_header_shows_view_and_literal_filter():
+    """Test the header's view label, tab position and unescaped filter text."""
+    with TemporaryDirectory() as tmpdir:
+        tui, _repo = _make_tui(tmpdir, ["Alpha"])
+        tui.view_mode = "project"
+        tui.view_items = tui._build_view_items()
+        tui.filter_text = "<a&b>"
+
+        text = "".join(fragment[1] for fragment in tui._get_header_text())
+
+        assert text.startswith(" Project: All Projects (1/1)")
+        assert "Filter: '<a&b>'" in text
+
+
+def test_row_fragments_coalesce_unstyled_text():
+    """Test that rows end inside their last cell and merge the unstyled marker into the title."""
+    with TemporaryDirectory() as tmpdir:
+        tui, _repo = _make_tui(tmpdir, ["Alpha"])
+        tui.selected_row = -1
+
+        fragments = tui._get_task_list_text()
+        title = next(fragment for fragment in fragments if "Alpha" in fragment[1])
+
+        assert ("", "\n") not in fragments
+        assert title[1].startswith("  Alpha")
+
+
+def test_format_display_id():
+    """Test zero-padded display IDs and the short UUID fallback."""
+    assert _format_display_id("0123456789abcdef", 7) == "007"
+    assert _format_display_id("0123456789abcdef", None) == "01234567..."
+
+
+def test_countdown_cell_padded_and_styled():
+    """Test countdown cells for overdue, finished and undated tasks."""
+    now = datetime(2025, 11, 10, 10, 0)
+
+    assert _countdown_cell(datetime(2025, 11, 8, 10, 0), "pending", now, 9) == ("class:countdown-overdue", "-2d      ")
+    assert _countdown_cell(datetime(2025, 11, 8, 10, 0), "completed", now, 9) == ("class:countdown-normal", "✓        ")
+    assert _countdown_cell(None, "pending", now, 9) == ("", "-        ")
+
+
+def test_new_minute_keeps_rows_with_unchanged_countdown():
+    """Test that rows are only rebuilt on a clock tick when their countdown text changes."""
+    with TemporaryDirectory() as tmpdir:
+        tui, repo = _make_tui(tmpdir, [])
+        repo.save_task(Task(id=repo.next_task_id(), title="Later", due=datetime(2099, 1, 1), repo="work"))
+        tui._invalidate_task_caches()
+        tui.selected_row = -1
+
+        with patch("taskrepo.tui.task_tui.datetime") as clock:
+            clock.now.return_value = datetime(2030, 1, 1, 9, 0)
+            tui._get_task_list_text()
+            clock.now.return_value = datetime(2030, 1, 1, 9, 1)
+            with patch.object(tui, "_build_row_fragments", wraps=tui._build_row_fragments) as build:
+                tui._get_task_list_text()
+
+        build.assert_not_called()
+
+
+def test_resize_rebuilds_rows_for_new_layout():
+    """Test that rows cached for one column layout are not reused after a resize."""
+    with TemporaryDirectory() as tmpdir:
+        tui, _repo = _make_tui(tmpdir, ["Alpha", "Beta"])
+
+        with patch("taskrepo.tui.task_tui.os.get_terminal_size", return_value=os.terminal_size((100, 40))):
+            tui._on_before_render(tui.app)
+            narrow = tui._get_task_list_text()
+        with patch("taskrepo.tui.task_tui.os.get_terminal_size", return_value=os.terminal_size((160, 40))):
+            tui._on_before_render(tui.app)
+            with patch.object(tui, "_build_row_fragments", wraps=tui._build_row_fragments) as build:
+                wide = tui._get_task_list_text()
+
+        assert build.call_count == 2
+        assert len("".join(f[1] for f in wide)) > len("".join(f[1] for f in narrow))
+
+
+def test_scroll_indicator_centered():
+    """Test the centered scroll indicator lines above and below the viewport."""
+    assert _scroll_indicator(True, 3, 20) == "   ▲ 3 more above   \n"
+    assert _scroll_indicator(False, 12, 20) == "  ▼ 12 more below   \n"
+
+
+def test_selected_tasks_in_display_order():
+    """Test that multi-selected tasks come back in display order, limited to the current view."""
+    with TemporaryDirectory() as tmpdir:
+        tui, _repo = _make_tui(tmpdir, ["Alpha", "Beta", "Gamma"])
+        tasks = tui._get_filtered_tasks()
+        tui.multi_selected = {tasks[2].id, tasks[0].id, "not-in-view"}
+
+        assert tui._get_selected_tasks() == [tasks[0], tasks[2]]
+
+
+def test_async_reload_parses_changed_repository_off_loop():
+    """Test that the auto-reload applies repositories whose tasks were already parsed on a worker thread."""
+    with TemporaryDirectory() as tmpdir:
+        tui, repo = _make_tui(tmpdir, ["Alpha"])
+        tui.config.parent_dir = Path(tmpdir)
+        tui._reload_repositories()
+        repo.save_task(Task(id=repo.next_task_id(), title="Beta", repo="work"))
+
+        with patch("taskrepo.tui.task_tui.save_id_cache"):
+            asyncio.run(tui._reload_from_disk_async())
+        with patch.object(Task, "load") as load:
+            titles = sorted(t.title for t in tui._get_all_tasks())
+
+        load.assert_not_called()
+        assert titles == ["Alpha", "Beta"]
+
+
+def test_background_sync_reloads_off_loop():
+    """Test that the reload after a background sync parses pulled task files on a worker thread."""
+    with TemporaryDirectory() as tmpdir:
+        tui, repo = _make_tui(tmpdir, ["Alpha"])
+        tui.config.parent_dir = Path(tmpdir)
+        tui._reload_repositories()
+        repo.save_task(Task(id=repo.next_task_id(), title="Pulled", repo="work"))
+
+        load = Task.load
+        loading_threads = []
+
+        def record_thread(*args, **kwargs):
+            loading_threads.append(threading.current_thread())
+            return load(*args, **kwargs)
+
+        with (
+            patch("taskrepo.tui.task_tui.asyncio.sleep", side_effect=[None, asyncio.CancelledError]),
+            patch.object(tui, "_sync_repository_async", AsyncMock(return_value=(True, "", False))),
+            patch("taskrepo.utils.sync_history.SyncHistory"),
+            patch("taskrepo.tui.task_tui.save_id_cache"),
+            patch.object(Task, "load", side_effect=record_thread),
+            pytest.raises(asyncio.CancelledError),
+        ):
+            asyncio.run(tui._background_sync_loop())
+
+        assert loading_threads
+        assert threading.main_thread() not in loading_threads
+        assert sorted(t.title for t in tui._get_all_tasks()) == ["Alpha", "Pulled"]
+        assert tui.sync_status == "success"
+
+
+def test_countdown_tick_redraws_only_with_visible_countdowns():
+    """Test that the minute tick repaints only when a painted row shows a due date."""
+    with TemporaryDirectory() as tmpdir:
+        tui, repo = _make_tui(tmpdir, ["Alpha"])
+
+        async def tick_once():
+            with (
+                patch("taskrepo.tui.task_tui.asyncio.sleep", side_effect=[None, asyncio.CancelledError]),
+                patch.object(tui.app, "invalidate") as invalidate,
+                pytest.raises(asyncio.CancelledError),
+            ):
+                await tui._countdown_tick_loop()
+            return invalidate.call_count
+
+        tui._get_task_list_text()
+        assert not tui._countdown_visible
+        assert asyncio.run(tick_once()) == 0
+
+        repo.save_task(Task(id=repo.next_task_id(), title="Due", due=datetime(2030, 1, 1), repo="work"))
+        tui._invalidate_task_caches()
+        tui._get_task_list_text()
+        assert tui._countdown_visible
+        assert asyncio.run(tick_once()) == 1
+
+
+def test_status_and_priority_changes_apply_in_place():
+    """Test that status and priority keys save the selected task and refresh its row without leaving the TUI."""
+    with TemporaryDirectory() as tmpdir:
+        tui, repo = _make_tui(tmpdir, ["Alpha"])
+        tui.config.parent_dir = Path(tmpdir)
+        tui._reload_repositories()
+        task_id = tui._get_filtered_tasks()[0].id
+        tui._get_task_list_text()
+
+        with patch("taskrepo.tui.task_tui.save_id_cache"):
+            tui._set_selected_priority("H")
+            tui._toggle_selected_in_progress()
+
+        saved = repo.get_task(task_id)
+        assert (saved.priority, saved.status) == ("H", "in-progress")
+        assert tui.has_unsaved_changes
+        text = "".join(fragment[1] for fragment in tui._get_task_list_text())
+        assert "progres" in text
+
+        with patch("taskrepo.tui.task_tui.save_id_cache"):
+            tui._toggle_selected_in_progress()
+        assert repo.get_task(task_id).status == "pending"
+
+
+def test_column_widths_give_hidden_space_to_title():
+    """Test that hiding a column frees its width and separator for the title."""
+    shown = _column_widths(200, (False, False, False))
+    hidden = _column_widths(200, (True, False, False))
+
+    assert hidden.repo == 0
+    assert hidden.title == shown.title + shown.repo + 1
+    assert _column_widths(80, (False, False, False)).title == 20
+
+
+def test_navigation_reuses_filtered_view():
+    """Test that moving the selection and redrawing never recomputes the filtered rows."""
+    with TemporaryDirectory() as tmpdir:
+        tui, _repo = _make_tui(tmpdir, ["Alpha", "Beta", "Gamma"])
+        tui._get_task_list_text()
+        down, end, home = (tui.kb.get_bindings_for_keys((key,))[0].handler for key in ("down", "end", "home"))
+
+        with patch.object(tui, "_compute_filtered_rows", wraps=tui._compute_filtered_rows) as compute:
+            for handler in (down, down, end, home):
+                handler(None)
+                tui._get_task_list_text()
+                tui._get_task_detail_text()
+
+        compute.assert_not_called()
+        assert tui.selected_row == 0
+
+
+def test_filter_applied_live_after_typing_pauses():
+    """Test that typed filter text is applied once, after the debounce delay."""
+    with TemporaryDirectory() as tmpdir:
+        tui, _repo = _make_tui(tmpdir, ["Alpha", "Beta"])
+        tui.filter_active = True
+
+        async def type_and_wait():
+            tui.filter_input.text = "a"
+            tui.filter_input.text = "al"
+            assert tui.filter_text == ""
+            await asyncio.sleep(0.05)
+
+        with (
+            patch("taskrepo.tui.task_tui._FILTER_DEBOUNCE", 0.01),
+            patch.object(type(tui.app), "is_running", new_callable=PropertyMock, return_value=True),
+        ):
+            asyncio.run(type_and_wait())
+
+        assert tui.filter_text == "al"
+        assert [t.title for t in tui._get_filtered_tasks()] == ["Alpha"]
+
+
+def test_extended_filter_refines_previous_matches():
+    """Test that typing more characters only re-checks the tasks that matched before."""
+    with TemporaryDirectory() as tmpdir:
+        tui, _repo = _make_tui(tmpdir, ["Alpha", "Alps trip", "Beta"])
+        tui.filter_text = "al"
+        assert len(tui._get_filtered_tasks()) == 2
+
+        tui.filter_text = "alph"
+        with patch.object(tui, "_search_blob", wraps=tui._search_blob) as blob:
+            assert [t.title for t in tui._get_filtered_tasks()] == ["Alpha"]
+        assert blob.call_count == 2
+
+        tui.filter_text = "beta"
+        assert [t.title for t in tui._get_filtered_tasks()] == ["Beta"]
+
+
+def test_search_blobs_kept_for_unchanged_tasks_across_reloads():
+    """Test that a reload keeps search blobs of unchanged tasks and drops those of removed ones."""
+    with TemporaryDirectory() as tmpdir:
+        tui, repo = _make_tui(tmpdir, ["Alpha", "Beta"])
+        tui.filter_text = "a"
+        tui._get_filtered_tasks()
+        beta = next(t for t in tui._get_all_tasks() if t.title == "Beta")
+        repo.delete_task(beta.id)
+
+        tui._invalidate_task_caches()
+        tui._get_all_tasks()
+
+        assert [cached[0].title for cached in tui._search_blobs.values()] == ["Alpha"]